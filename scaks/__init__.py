@@ -1,5 +1,8 @@
+import atexit
+import os
 import time
 import sys
+import weakref
 
 from .functions import *
 from .errors.error import *
@@ -15,6 +18,91 @@ file_header = (
     '# Do not make changes to this file ' +
     'unless you know what you are doing\n\n') % (__version__, time.asctime())
 
+#-------------------------------------------------------
+# Archive of data updates                               |
+#-------------------------------------------------------
+
+# Model shells with buffered data updates.
+_pending_archives = weakref.WeakSet()
+
+
+def flush_archives(filename=None, create=True):
+    """
+    Append buffered data updates of all model shells to their data files.
+
+    :param filename: Only flush updates for this data file, all files by default
+    :type filename: str
+
+    :param create: Create the data file if it does not exist, default is True
+    :type create: bool
+    """
+    for shell in list(_pending_archives):
+        if filename is None or shell._owner.data_file == filename:
+            shell.flush_archive(create=create)
+
+
+def _flush_archives_at_exit():
+    """
+    Flush buffered data updates at exit, data files removed before are not created again.
+    """
+    flush_archives(create=False)
+    _pending_archives.clear()
+
+atexit.register(_flush_archives_at_exit)
+
+
+def load_archived_data(filename):
+    """
+    Load data dict from the records appended to data file, the latest
+    value of a variable is kept. Buffered updates for the file are
+    flushed before reading.
+
+    :param filename: data file name
+    :type filename: str
+
+    :return: archived data
+    :rtype: dict
+    """
+    flush_archives(filename)
+
+    data = {}
+    with open(filename, 'rb') as f:
+        while True:
+            try:
+                record = pickle.load(f)
+            except EOFError:
+                break
+            # Whole data dict in old data file.
+            if isinstance(record, dict):
+                data.update(record)
+            else:
+                data_name, value = record
+                data[data_name] = value
+
+    return data
+
+
+def truncate_archived_data(filename):
+    """
+    Truncate data file to one record for the latest value of each variable,
+    it is called when the model is set up to keep the appended file bounded.
+
+    :param filename: data file name
+    :type filename: str
+    """
+    if not os.path.exists(filename):
+        return
+
+    try:
+        data = load_archived_data(filename)
+    except (pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+        # Unreadable data file.
+        data = {}
+
+    with open(filename, 'wb') as f:
+        for record in data.items():
+            pickle.dump(record, f)
+
 #-------------------------------------------------------
 # Some base classes for kinetic model are defined below |
 #-------------------------------------------------------
@@ -29,10 +117,13 @@ class ModelShell(object):
     def __init__(self, owner):
         self._owner = owner
         self._archived_data_dict = {}
+        self._archive_buffer = []
 
     def archive_data(self, data_name, data):
         """
-        Update data dict and dump it to data file.
+        Update data dict and buffer the update, the buffered updates are appended
+        to data file when the buffer is full, :obj:`flush_archive` is called or
+        the data file is loaded.
 
         :param data_name: key in data dict
         :type data_name: str
@@ -43,10 +134,37 @@ class ModelShell(object):
         # Update data dict.
         if data_name in self._owner.archived_variables:
             self._archived_data_dict[data_name] = data
-            # Dump data dict to data file
-            if self._archived_data_dict:
-                with open(self._owner.data_file, 'wb') as f:
-                    pickle.dump(self._archived_data_dict, f)
+            if not self._archive_buffer:
+                _pending_archives.add(self)
+            self._archive_buffer.append((data_name, data))
+            if len(self._archive_buffer) >= self._owner.archive_buffer_size:
+                self.flush_archive()
+
+    def flush_archive(self, create=True):
+        """
+        Append buffered data updates to data file.
+
+        :param create: Create the data file if it does not exist, default is True
+        :type create: bool
+        """
+        if not self._archive_buffer:
+            return
+
+        filename = self._owner.data_file
+        if create or os.path.exists(filename):
+            with open(filename, 'ab') as f:
+                for record in self._archive_buffer:
+                    pickle.dump(record, f)
+
+        self._archive_buffer = []
+        _pending_archives.discard(self)
+
+    def __del__(self):
+        # Data files removed before are not created again.
+        try:
+            self.flush_archive(create=False)
+        except Exception:
+            pass
 
     @staticmethod
     def write2file(filename, line):
@@ -28,6 +28,10 @@ class ThermodynamicCorrector(CorrectorBase):
         self._enthalpy_dict = {}
         self._entropy_dict = {}
 
+        # Cached corrections for scalar arguments.
+        self.__shomate_cache = {}
+        self.__entropy_cache = {}
+
         # set logger object
         self.__logger = logging.getLogger('model.correctors.ThermodynamicCorrector')
 
@@ -37,24 +41,67 @@ class ThermodynamicCorrector(CorrectorBase):
         :param gas_name: The species site name of gas species, e.g. :obj:`CO_g`
         :type gas_name: str
 
-        :param T: Temperature(K)
-        :type T: float
+        :param T: Temperature(K), could be an array of temperatures
+        :type T: float or array of float
 
         :return: The correction energy value
-        :rtype: float
+        :rtype: float or numpy.ndarray
 
         Example::
             >>> shomate_correction("CO_g")
+            >>> shomate_correction("CO_g", T=[400.0, 500.0])
         """
         # {{{
+        # Set temperature.
+        temperature = self._owner.temperature if T is None else T
+        vectorized = isinstance(temperature, (list, tuple, np.ndarray))
+
+        # Cached results.
+        if not vectorized:
+            key = (gas_name, temperature)
+            if key in self.__shomate_cache:
+                return self.__shomate_cache[key]
+
         # Check gas name.
         formula = ChemFormula(gas_name)
         if formula.type() != "gas":
             # If it's not a gas, no correction.
-            return 0.0
+            free_energy = np.zeros(len(temperature)) if vectorized else 0.0
+        else:
+            free_energy = self.__get_shomate_free_energies(gas_name, temperature)
+            if not vectorized:
+                free_energy = free_energy[0]
 
-        # Set temperature.
-        temperature = self._owner.temperature if T is None else T
+        if not vectorized:
+            self.__shomate_cache[key] = free_energy
+
+        return free_energy
+        # }}}
+
+    def __get_shomate_table(self):
+        """
+        Private helper function to get Shomate parameters indexed by gas names,
+        the temperature ranges of a gas are in the order of database.
+        """
+        try:
+            return self.__shomate_table
+        except AttributeError:
+            shomate_table = {}
+            for key, params in shomate_params.items():
+                gas_key, T_range = key.split(':')
+                T_min, T_max = [float(t) for t in T_range.split('-')]
+                shomate_table.setdefault(gas_key, []).append((T_min, T_max, tuple(params)))
+            self.__shomate_table = shomate_table
+
+            return self.__shomate_table
+
+    def __get_shomate_free_energies(self, gas_name, temperatures):
+        """
+        Private helper function to get free energy corrections of a gas at
+        temperatures using Shomate equation.
+        """
+        # {{{
+        temperatures = np.atleast_1d(np.array(temperatures, dtype=np.float64))
         temperature_ref = 298.15
 
         # Nested functions for thermodynamic parameters.
@@ -77,20 +124,13 @@ class ThermodynamicCorrector(CorrectorBase):
             Cp = A + B*t + C*t**2 + D*t**3 + E/(t**2)
             return Cp
 
-        not_there = True
-        for key in shomate_params.keys():
-            gas_key, T_range = key.split(':')
-            T_min, T_max = [float(t) for t in T_range.split('-')]
+        free_energies = np.zeros(temperatures.shape)
+        found = np.zeros(temperatures.shape, dtype=bool)
 
-            # Check.
-            if gas_key != gas_name:
-                continue
-
-            # Set flag.
-            not_there = False
-
-            if temperature >= T_min and temperature <= T_max:
-                params = shomate_params[key]
+        for T_min, T_max, params in self.__get_shomate_table().get(gas_name, []):
+            in_range = ~found & (temperatures >= T_min) & (temperatures <= T_max)
+            if np.any(in_range):
+                temperature = temperatures[in_range]
                 Cp_ref = Cp(temperature_ref, params)
 
                 # deltaH(298-T) = shomate(T) - shomate(298)
@@ -104,36 +144,30 @@ class ThermodynamicCorrector(CorrectorBase):
                 #ZPE = sum(self.frequencies[gas_name])/2.0
                 #free_energy = ZPE +  dH - temperature*dS
 
-                free_energy = dH - temperature*dS
-                enthalpy = dH
-                entropy = -temperature*dS
+                free_energies[in_range] = dH - temperature*dS
 
-            elif temperature < T_min and T_min < 300:
-                params = shomate_params[key]
+            # Low temperatures.
+            below = ~found & ~in_range & (temperatures < T_min)
+            if T_min < 300 and np.any(below):
+                temperature = temperatures[below]
                 Cp_ref = Cp(T_min, params)
                 dS = S(T_min, params)
                 dH = (temperature*Cp_ref/1000.0)*(_kJmol2eV)  # eV
                 dS = dS*(_kJmol2eV/1e3)  # eV/K
 
                 #ZPE = sum(self.frequencies[gas_name])/2.0
-                free_energy = dH - temperature*dS
-                enthalpy = dH
-                entropy = -temperature*dS
-
-            else:
-                not_there = True
+                free_energies[below] = dH - temperature*dS
+                found |= below
 
-            if not not_there:
-                break
+            found |= in_range
 
-        if not_there:
+        if not np.all(found):
             msg = "No Shomate parameters specified for species '{}' at {}K"
-            msg = msg.format(gas_name, temperature)
+            msg = msg.format(gas_name, ", ".join([str(T) for T in temperatures[~found]]))
             self.__logger.warning(msg)
             #raise ValueError(msg)
-            free_energy = 0.0
 
-        return free_energy
+        return free_energies
         # }}}
 
     def entropy_correction(self, gas_name, m=None, p=None, T=None):
@@ -149,20 +183,39 @@ class ThermodynamicCorrector(CorrectorBase):
         :param p: partial pressure (**bar**), model's pressure by default
         :type p: float
 
-        :param T: temperature, model's temperature by default
-        :param T: float
+        :param T: temperature, model's temperature by default, could be an
+                  array of temperatures
+        :param T: float or array of float
+
+        :return: The correction energy value (eV)
+        :rtype: float or numpy.ndarray
 
         Example::
             >>> m.corrector.entropy_correction('CO_g')
             >>> -1.1538116935108251
         """
         # {{{
+        vectorized = isinstance(T, (list, tuple, np.ndarray))
+
+        # Cached results.
+        if not vectorized:
+            # Model's pressures are identified by version of species definitions.
+            if p is None:
+                owner = self._owner
+                key_p = ("version", type(owner).species_definitions.get_version(owner))
+            else:
+                key_p = p
+            key_T = self._owner.temperature if T is None else T
+            key = (gas_name, m, key_p, key_T)
+            if key in self.__entropy_cache:
+                return self.__entropy_cache[key]
+
         # Check gas name.
         formula = ChemFormula(gas_name)
         if formula.type() != "gas":
             #msg = "A gas name is expected, '{}' is recieved.".format(gas_name)
             #raise ParameterError(msg)
-            return 0.0
+            return np.zeros(len(T)) if vectorized else 0.0
 
         # Extract species_site and species name.
         species_site = formula.species_site()
@@ -177,7 +230,7 @@ class ThermodynamicCorrector(CorrectorBase):
             msg = msg.format(species_site)
             self.__logger.warning(msg)
             #raise SpeciesError(msg)
-            return 0.0
+            return np.zeros(len(T)) if vectorized else 0.0
 
         # Set default parameter values.
         if m is None:
@@ -189,15 +242,21 @@ class ThermodynamicCorrector(CorrectorBase):
         if T is None:
             T = self._owner.temperature
 
+        # Math functions for temperature arrays.
+        if vectorized:
+            T = np.array(T, dtype=np.float64)
+            exp_, log_ = np.exp, np.log
+        else:
+            exp_, log_ = exp, log
+
         # Calculate partition functions.
 
         # Translation partition functions.
-        try:
-            V = kB_J*T/p
-        except ZeroDivisionError:
+        if p == 0.0:
             msg_template = "Pressure of '{}' is 0.0, please check your input file."
             msg = msg_template.format(species_site)
             raise ZeroDivisionError(msg)
+        V = kB_J*T/p
 
         qt = V*(2*pi*m*kB_J*T/(h_J**2))**(3/2.0)
 
@@ -209,14 +268,14 @@ class ThermodynamicCorrector(CorrectorBase):
         if len(thetas) == 1:
             theta, = thetas
             ratio = theta/T
-            if ratio <= 0.01:
-                qr = T/(sigma*theta)
-            else:
-                qr = T/(sigma*theta)*(1 + theta/(3*T) + theta**2/(15*T**2))
-                if ratio >= 0.3:
-                    msg_template = "T/theta = {:.3e} is larger than 0.3, big error may be expected"
-                    msg = msg_template.format(ratio)
-                    self.logger.warning(msg)
+            qr = T/(sigma*theta)
+            qr = np.where(ratio <= 0.01, qr, qr*(1 + theta/(3*T) + theta**2/(15*T**2)))
+            if not vectorized:
+                qr = float(qr)
+            if np.any(ratio >= 0.3):
+                msg_template = "T/theta = {:.3e} is larger than 0.3, big error may be expected"
+                msg = msg_template.format(np.max(ratio))
+                self.__logger.warning(msg)
         # Nonlinear molecule.
         elif len(thetas) == 3:
             product = reduce(lambda x, y: x*y, thetas)
@@ -228,16 +287,21 @@ class ThermodynamicCorrector(CorrectorBase):
         # Linear molecule.
         if len(thetas) == 1:
             theta, = thetas
-            qv = exp(-theta/(2*T)) / (1 - exp(-theta/T))
+            qv = exp_(-theta/(2*T)) / (1 - exp_(-theta/T))
         # Nonlinear molecule.
         else:
-            temp_list = [1./(1 - exp(-theta/T)) for theta in thetas]
+            temp_list = [1./(1 - exp_(-theta/T)) for theta in thetas]
             qv = reduce(lambda x, y: x*y, temp_list)
 
         # Molecular partition function.
         q = qt*qr*qv
 
-        return -kB_eV*T*log(q)  # eV
+        correction = -kB_eV*T*log_(q)  # eV
+
+        if not vectorized:
+            self.__entropy_cache[key] = correction
+
+        return correction
         # }}}
 
     def correct_relative_energies(self, relative_energies, method="shomate"):
@@ -249,6 +313,7 @@ class ThermodynamicCorrector(CorrectorBase):
         :param method: Energy correctness method name, could be 'shomate' or 'entropy'
         :type method: str
         """
+        # {{{
         if method == "shomate":
             correct_func = self.shomate_correction
         elif method == "entropy":
@@ -256,94 +321,68 @@ class ThermodynamicCorrector(CorrectorBase):
         else:
             raise ValueError("Unknown method: '{}'".format(method))
 
-        # Loop over all elementary reactions.
-        if self._owner.log_allowed:
-            self.__logger.info("Use {} method to correct relative energies".format(method))
-            self.__logger.info("------------------------------------------")
-        for idx, rxn_expression in enumerate(self._owner.rxn_expressions):
-            # Data used for info output.
-            Gaf = relative_energies["Gaf"][idx]
-            Gar = relative_energies["Gar"][idx]
-            dG = relative_energies["dG"][idx]
-
-            self.__correct_single_relative_energies(relative_energies, idx, correct_func)
-
-            # Data used for info output.
-            Gaf_prime = relative_energies["Gaf"][idx]
-            Gar_prime = relative_energies["Gar"][idx]
-            dG_prime = relative_energies["dG"][idx]
-
-            msg = ("{}: Gaf({:.2f} -> {:.2f}), Gar({:.2f} -> {:.2f}), " +
-                   "dG({:.2f} -> {:.2f})").format(rxn_expression,
-                                                  Gaf, Gaf_prime,
-                                                  Gar, Gar_prime,
-                                                  dG, dG_prime)
-            if self._owner.log_allowed:
-                self.__logger.info(msg)
+        reaction_network = self._owner.reaction_network
+        elementary_rxns_list = reaction_network.elementary_rxns_list
 
-        if self._owner.log_allowed:
-            self.__logger.info("------------------------------------------\n")
+        # Corrections of all species, each species is corrected only once.
+        corrections = {}
+        for formula_lists in elementary_rxns_list:
+            for formula_list in formula_lists:
+                for formula in formula_list:
+                    if formula.formula() not in corrections:
+                        corrections[formula.formula()] = correct_func(formula.formula())
 
-        return relative_energies
+        # Energy changes for IS, TS, FS of all elementary reactions.
+        def get_deltas(state_idx):
+            return np.array([sum([corrections[formula.formula()]
+                                  for formula in formula_lists[state_idx]], 0.0)
+                             for formula_lists in elementary_rxns_list], dtype=np.float64)
 
-    def __correct_single_relative_energies(self, relative_energies, rxn_idx, correct_func):
-        """
-        Private helper function to correct relative energies for a single elementary reaction.
+        delta_is, delta_fs = get_deltas(0), get_deltas(-1)
+        has_ts = np.array([len(formula_lists) == 3 for formula_lists in elementary_rxns_list])
 
-        Parameters:
-        -----------
-        rxn_idx     : The index of the reaction expression, int.
-        correct_func: The function object to correct energy.
-        """
-        formula_lists = self._owner.elementary_rxns_list[rxn_idx]
-        deltas = [] # energy changes for IS, TS, FS
-        for formula_list in formula_lists:
-            delta = 0.0
-            for formula in formula_list:
-                delta += correct_func(formula.formula())
-            deltas.append(delta)
-
-        self.__change_relative_energies(relative_energies, rxn_idx, deltas)
-
-    def __change_relative_energies(self, relative_energies, rxn_idx, deltas):
-        """
-        Change the relative energies of solver from the enegies changes of
-        a single elementary reaction.
-
-        Parameters:
-        -----------
-        rxn_idx: The index of the reaction expression, int.
-        deltas : The energy change vector for the corresponding elementary reaction,
-                 float list.
-        """
-        Gaf = relative_energies["Gaf"][rxn_idx]
-        Gar = relative_energies["Gar"][rxn_idx]
-        dG = relative_energies["dG"][rxn_idx]
+        old_energies = [np.array(relative_energies[key], dtype=np.float64)
+                        for key in ("Gaf", "Gar", "dG")]
+        Gaf, Gar, dG = old_energies
 
         # We have to treat adsorption and desorption particularly.
-        if len(deltas) == 2:
-            E_IS = 0.0
-            E_FS = E_IS + dG
-            delta_is, delta_fs = deltas
-            E_IS += delta_is
-            E_FS += delta_fs
-            E_TS = max(E_IS, E_FS)
-            # Calculate relative energies again.
-            Gaf = E_TS - E_IS
-            Gar = E_TS - E_FS
-            dG = E_FS - E_IS
-        elif len(deltas) == 3:
-            # Correct relative energies.
-            d_is, d_ts, d_fs = deltas
-            d_Gaf = d_ts - d_is
-            d_Gar = d_ts - d_fs
-            d_dG = d_fs - d_is
-            Gaf += d_Gaf
-            Gar += d_Gar
-            dG += d_dG
+        E_IS = delta_is
+        E_FS = dG + delta_fs
+        E_TS = np.maximum(E_IS, E_FS)
+        new_energies = [E_TS - E_IS, E_TS - E_FS, E_FS - E_IS]
+
+        # Reactions with transition state.
+        if np.any(has_ts):
+            delta_ts = np.array([sum([corrections[formula.formula()]
+                                      for formula in formula_lists[1]], 0.0)
+                                 if len(formula_lists) == 3 else 0.0
+                                 for formula_lists in elementary_rxns_list], dtype=np.float64)
+            ts_energies = [Gaf + (delta_ts - delta_is),
+                           Gar + (delta_ts - delta_fs),
+                           dG + (delta_fs - delta_is)]
+            new_energies = [np.where(has_ts, ts_energy, energy)
+                            for ts_energy, energy in zip(ts_energies, new_energies)]
 
         # Update relative energies.
-        relative_energies["Gaf"][rxn_idx] = Gaf
-        relative_energies["Gar"][rxn_idx] = Gar
-        relative_energies["dG"][rxn_idx] = dG
+        for key, energies in zip(("Gaf", "Gar", "dG"), new_energies):
+            for idx, energy in enumerate(energies.tolist()):
+                relative_energies[key][idx] = energy
 
+        if self._owner.log_allowed:
+            self.__logger.info("Use {} method to correct relative energies".format(method))
+            self.__logger.info("------------------------------------------")
+            for idx, rxn_expression in enumerate(self._owner.rxn_expressions):
+                msg = ("{}: Gaf({:.2f} -> {:.2f}), Gar({:.2f} -> {:.2f}), " +
+                       "dG({:.2f} -> {:.2f})").format(rxn_expression,
+                                                      old_energies[0][idx], new_energies[0][idx],
+                                                      old_energies[1][idx], new_energies[1][idx],
+                                                      old_energies[2][idx], new_energies[2][idx])
+                self.__logger.info(msg)
+            self.__logger.info("------------------------------------------\n")
+
+        # Changes of model's energies must be seen by memoized functions.
+        if relative_energies is self._owner.relative_energies:
+            self._owner.set_relative_energies(relative_energies)
+
+        return relative_energies
+        # }}}
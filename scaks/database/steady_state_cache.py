@@ -0,0 +1,190 @@
+''' Module for persistent cache of converged steady states.
+'''
+
+import hashlib
+import json
+import sqlite3
+
+import mpmath as mp
+
+
+class SteadyStateCache(object):
+    """
+    Steady state results cache stored in a SQLite file, the results are
+    indexed by a hash of the reaction conditions which determine the
+    steady state.
+
+    :param filename: SQLite file name
+    :type filename: str
+
+    Example::
+
+        >>> cache = SteadyStateCache("steady_states.db")
+        >>> key = cache.get_key(model)
+        >>> cache.put(key, coverages, error)
+        >>> cache.get(key)
+        {'coverages': [...], 'error': '...', 'tofs': None}
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        connection = self.__connect()
+        try:
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS steady_states "
+                                   "(key TEXT PRIMARY KEY, coverages TEXT, "
+                                   "error TEXT, tofs TEXT, conditions TEXT)")
+        finally:
+            connection.close()
+
+    def __connect(self):
+        """
+        Private helper function to open a connection to the cache file.
+        """
+        # Wait for other processes writing the same file.
+        return sqlite3.connect(self.filename, timeout=60)
+
+    @staticmethod
+    def get_key(model, relative_energies=None):
+        """
+        Function to get the hash key of current reaction conditions of a model.
+
+        :param model: The micro kinetic model
+        :type model: MicroKineticModel
+
+        :param relative_energies: Relative energies of elementary reactions,
+                                  default is the relative energies of model
+        :type relative_energies: dict
+
+        :return: Hexadecimal SHA1 digest
+        :rtype: str
+        """
+        # {{{
+        if not relative_energies:
+            relative_energies = model.relative_energies
+
+        # Conditions of species and rate constants.
+        species = {}
+        for name, definition in model.species_definitions.items():
+            species[name] = {k: repr(float(v)) for k, v in definition.items()
+                             if k in ("pressure", "concentration", "total")}
+
+        energies = {k: [repr(float(e)) for e in v]
+                    for k, v in relative_energies.items()}
+
+        ref_energies = {k: repr(float(v)) for k, v in model.ref_energies.items()}
+
+        # Corrector used in rate constant calculation.
+        corrector = model.corrector
+        if corrector is not None and not isinstance(corrector, str):
+            corrector = corrector.__class__.__name__
+
+        conditions = dict(rxn_expressions=list(model.rxn_expressions),
+                          species=species,
+                          temperature=repr(float(model.temperature)),
+                          relative_energies=energies,
+                          ref_energies=ref_energies,
+                          rate_algo=model.rate_algo,
+                          unitcell_area=repr(float(model.unitcell_area)),
+                          active_ratio=repr(float(model.active_ratio)),
+                          corrector=corrector,
+                          numerical_representation=model.numerical_representation,
+                          decimal_precision=model.decimal_precision,
+                          tolerance=repr(float(model.tolerance)),
+                          rootfinding=model.rootfinding,
+                          max_rootfinding_iterations=model.max_rootfinding_iterations,
+                          log_coverage=model.log_coverage,
+                          mixed_precision=model.mixed_precision)
+        content = json.dumps(conditions, sort_keys=True)
+
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+        # }}}
+
+    def get(self, key):
+        """
+        Function to get the cached steady state.
+
+        :param key: Hash key of reaction conditions
+        :type key: str
+
+        :return: Coverages, error and TOFs in strings in dict with keys
+                 'coverages', 'error' and 'tofs', None if not cached.
+        :rtype: dict
+        """
+        connection = self.__connect()
+        try:
+            row = connection.execute("SELECT coverages, error, tofs FROM steady_states "
+                                     "WHERE key = ?", (key,)).fetchone()
+        finally:
+            connection.close()
+
+        if row is None:
+            return None
+
+        coverages, error, tofs = row
+        return dict(coverages=json.loads(coverages),
+                    error=error,
+                    tofs=json.loads(tofs) if tofs is not None else None)
+
+    @staticmethod
+    def __to_string(value):
+        """
+        Private helper function to convert a float to string without precision loss.
+        """
+        if isinstance(value, mp.mpf):
+            return mp.libmp.to_str(value._mpf_, mp.libmp.repr_dps(mp.mp.prec))
+        return repr(float(value))
+
+    def get_points(self):
+        """
+        Function to get reaction condition coordinates and coverages of all
+        cached steady states which have coordinates stored.
+
+        :return: Coordinates and coverages in strings
+        :rtype: list of tuple
+        """
+        connection = self.__connect()
+        try:
+            rows = connection.execute("SELECT conditions, coverages FROM steady_states "
+                                      "WHERE conditions IS NOT NULL").fetchall()
+        finally:
+            connection.close()
+
+        return [(json.loads(conditions), json.loads(coverages))
+                for conditions, coverages in rows]
+
+    def put(self, key, coverages, error, tofs=None, conditions=None):
+        """
+        Function to store a converged steady state, the values are stored in
+        strings to keep the precision.
+
+        :param key: Hash key of reaction conditions
+        :type key: str
+
+        :param coverages: Steady state coverages
+        :type coverages: tuple of float
+
+        :param error: Steady state error
+        :type error: float
+
+        :param tofs: TOFs of gases, optional
+        :type tofs: list of float
+
+        :param conditions: Coordinates of reaction conditions, optional
+        :type conditions: list of float
+        """
+        coverages = json.dumps([self.__to_string(c) for c in coverages])
+        if tofs is not None:
+            tofs = json.dumps([self.__to_string(tof) for tof in tofs])
+        if conditions is not None:
+            conditions = json.dumps([float(x) for x in conditions])
+
+        connection = self.__connect()
+        try:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO steady_states "
+                                   "VALUES (?, ?, ?, ?, ?)",
+                                   (key, coverages, self.__to_string(error), tofs,
+                                    conditions))
+        finally:
+            connection.close()
@@ -0,0 +1,133 @@
+''' Module for nearest-neighbor index of solved reaction conditions.
+'''
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class WarmStartIndex(object):
+    """
+    Spatial index of solved points in reaction condition space, which is used
+    to get initial coverages from the steady states of the closest solved points.
+
+    The coordinates of a point are 1000/T, log10 of gas pressures (or liquid
+    concentrations) and the forward barriers and reaction energies in eV.
+
+    Example::
+
+        >>> index = WarmStartIndex()
+        >>> index.add(index.get_point(model), coverages)
+        >>> index.get_initial_guess(index.get_point(model), k=2)
+    """
+
+    def __init__(self):
+        self.__points = []
+        self.__coverages = []
+        self.__tree = None
+
+    def __len__(self):
+        return len(self.__points)
+
+    @staticmethod
+    def get_point(model, relative_energies=None):
+        """
+        Function to get the coordinates of current reaction conditions of a model.
+
+        :param model: The micro kinetic model
+        :type model: MicroKineticModel
+
+        :param relative_energies: Relative energies of elementary reactions,
+                                  default is the relative energies of model
+        :type relative_energies: dict
+
+        :return: Coordinates of reaction conditions
+        :rtype: list of float
+        """
+        if not relative_energies:
+            relative_energies = model.relative_energies
+
+        point = [1000.0/float(model.temperature)]
+
+        # Pressures are floored to avoid log of zero pressure of products.
+        for name in sorted(model.species_definitions):
+            definition = model.species_definitions[name]
+            for key in ("pressure", "concentration"):
+                if key in definition:
+                    point.append(np.log10(max(float(definition[key]), 1e-30)))
+
+        for key in ("Gaf", "dG"):
+            point.extend([float(e) for e in relative_energies.get(key, [])])
+
+        return point
+
+    def add(self, point, coverages):
+        """
+        Function to add a solved point to the index.
+
+        :param point: Coordinates of reaction conditions
+        :type point: list of float
+
+        :param coverages: Steady state coverages of the point
+        :type coverages: tuple of float
+        """
+        self.__points.append([float(x) for x in point])
+        self.__coverages.append(tuple([float(c) for c in coverages]))
+        # Rebuild the tree in next query.
+        self.__tree = None
+
+    def query(self, point, k=1):
+        """
+        Function to get the closest solved points.
+
+        :param point: Coordinates of reaction conditions
+        :type point: list of float
+
+        :param k: Number of closest points, default is 1
+        :type k: int
+
+        :return: Distances and coverages of the closest points, nearest first
+        :rtype: list of tuple
+        """
+        if not self.__points:
+            return []
+
+        # Points of different dimension (another network) are not comparable.
+        if len(point) != len(self.__points[0]):
+            return []
+
+        if self.__tree is None:
+            self.__tree = cKDTree(np.array(self.__points))
+
+        k = min(k, len(self.__points))
+        distances, indices = self.__tree.query(np.array(point, dtype=np.float64), k=k)
+        distances, indices = np.atleast_1d(distances), np.atleast_1d(indices)
+
+        return [(float(d), self.__coverages[i]) for d, i in zip(distances, indices)]
+
+    def get_initial_guess(self, point, k=1):
+        """
+        Function to get initial coverages from the steady states of the closest
+        solved points, weighted by inverse distances.
+
+        :param point: Coordinates of reaction conditions
+        :type point: list of float
+
+        :param k: Number of closest points, default is 1
+        :type k: int
+
+        :return: Initial coverages, None if no solved point
+        :rtype: tuple of float
+        """
+        neighbors = self.query(point, k)
+        if not neighbors:
+            return None
+
+        # Exact match.
+        distance, coverages = neighbors[0]
+        if distance == 0.0 or len(neighbors) == 1:
+            return coverages
+
+        weights = [1.0/d for d, _ in neighbors]
+        total = sum(weights)
+        return tuple([sum([w*cvgs[i] for w, (_, cvgs) in zip(weights, neighbors)])/total
+                      for i in range(len(coverages))])
@@ -2,9 +2,11 @@
 Definitions of attribute descriptors.
 """
 
-import numpy as np
+from collections import namedtuple, OrderedDict
 import copy
 
+import numpy as np
+
 from ..utilities.check_utilities import check_species_definitions
 from ..utilities.check_utilities import check_ref_energies
 from ..utilities.check_utilities import check_analysis_interval
@@ -186,8 +188,43 @@ class Dict(Type):
         super(Dict, self).__init__(name, dict, default, deepcopy, candidates)
 
 
+class FrozenDict(dict):
+    """
+    A dict which could not be changed after construction.
+    """
+    def __readonly(self, *args, **kwargs):
+        raise TypeError("'{}' object is read-only".format(self.__class__.__name__))
+
+    __setitem__ = __delitem__ = __readonly
+    clear = pop = popitem = setdefault = update = __readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+def freeze(value):
+    """
+    Function to get a read-only copy of nested dicts and lists.
+    """
+    if isinstance(value, dict):
+        return FrozenDict([(k, freeze(v)) for k, v in value.items()])
+    elif isinstance(value, (list, tuple)):
+        return tuple([freeze(v) for v in value])
+    else:
+        return value
+
+
 class SpeciesDefinitions(AttrDescriptor):
-    ''' Descriptor for species definition of kinetic model and components
+    ''' Descriptor for species definition of kinetic model and components.
+
+    A read-only snapshot is returned without copying, it is rebuilt only after
+    the definitions are changed by :obj:`SpeciesDefinitions.update`.
 
     :param name: The attribute name
     :type name: str
@@ -195,19 +232,72 @@ class SpeciesDefinitions(AttrDescriptor):
     :param default: The default value when calling __get__() method
     :type default: any
 
-    :param deepcopy: Copy deeply or not
+    :param deepcopy: Not used, the returned snapshot is immutable
     :type deepcopy: bool
 
     :param candidates: All possible values of the attribute.
     :type candidates: list of any
     '''
-    def __init__(self, name, default, deepcopy=True):
+    def __init__(self, name, default, deepcopy=False):
         super(SpeciesDefinitions, self).__init__(name, default, deepcopy)
 
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        private_name = "_{}__{}".format(instance.__class__.__name__, self.name)
+        snapshot_name = "{}_snapshot".format(private_name)
+        version = self.get_version(instance)
+
+        snapshot = instance.__dict__.get(snapshot_name)
+        if snapshot is None or snapshot[0] != version:
+            definitions = super(SpeciesDefinitions, self).__get__(instance, owner)
+            snapshot = (version, freeze(definitions))
+            instance.__dict__[snapshot_name] = snapshot
+
+        return snapshot[1]
+
     def __set__(self, instance, value):
         check_species_definitions(value)
+        # Copy the definitions, which are usually from the setup dict of caller.
+        value = dict([(name, dict(definition)) for name, definition in value.items()])
         super(SpeciesDefinitions, self).__set__(instance, value)
 
+    def get_version(self, instance):
+        """
+        Function to get the version of species definitions of an instance,
+        which is increased by every update.
+
+        :param instance: The owner of species definitions
+        :type instance: any
+
+        :return: The version number
+        :rtype: int
+        """
+        version_name = "_{}__{}_version".format(instance.__class__.__name__, self.name)
+        return instance.__dict__.get(version_name, 0)
+
+    def update(self, instance, species_name, **definitions):
+        """
+        Function to change the definition of a species.
+
+        :param instance: The owner of species definitions
+        :type instance: any
+
+        :param species_name: Name of the species, e.g. 'CO_g'
+        :type species_name: str
+
+        :param definitions: New definition items, e.g. :obj:`pressure=1.0`
+        :type definitions: any
+        """
+        private_name = "_{}__{}".format(instance.__class__.__name__, self.name)
+        species_definitions = instance.__dict__.setdefault(private_name, {})
+        definition = dict(species_definitions.get(species_name, {}), **definitions)
+        species_definitions[species_name] = definition
+
+        version_name = "{}_version".format(private_name)
+        instance.__dict__[version_name] = self.get_version(instance) + 1
+
 
 class RefEnergies(AttrDescriptor):
     ''' Descriptor for reference energies of kinetic model
@@ -341,60 +431,140 @@ class Property(object):
 # Functions and classes for parameters and return value memoization.
 # ------------------------------------------------------------------
 
-class HashableDict(dict):
-    # Override the __hash__ method of dict to make it hashable.
-    def __hash__(self):
-        # Make all keys hashable.
-        keys = tuple(map(make_hashable, self.keys()))
-        # Make all values hashable.
-        values = tuple(map(make_hashable, self.values()))
-        # Return the hash value of dict.
-        hash_value = hash(tuple(sorted(zip(keys, values))))
+def make_key(var):
+    """
+    Function to get a flat hashable key of a variable, dicts are sorted by keys.
+    """
+    if isinstance(var, dict):
+        return tuple([(k, make_key(var[k])) for k in sorted(var)])
+    elif isinstance(var, (list, tuple)):
+        return tuple([make_key(v) for v in var])
+    elif isinstance(var, np.ndarray):
+        return (var.shape, tuple(var.ravel().tolist()))
+    else:
+        return var
 
-        return hash_value
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
-class HashableList(list):
-    def __hash__(self):
-        # Use the hash value of corresponding hashable tuple.
-        return hash(tuple(map(make_hashable, self)))
 
+class MemoizedCache(object):
+    """ Per-instance LRU cache of a memoized method, see :obj:`Memoized`.
 
-def make_hashable(var):
-    """
-    Function to make a immutable variable hashable.
-    """
-    if type(var) in (list, tuple):
-        return HashableList(var)
-    elif type(var) is dict:
-        return HashableDict(var)
-    else:
-        return var
+    :param func: The memoized method
+    :type func: function
 
+    :param instance: The owner of the method
+    :type instance: any
 
-class Memoized(object):
-    """ Descriptor for returned value memoization.
+    :param maxsize: Max number of cached results, None for no limit
+    :type maxsize: int
     """
-    def __init__(self, func):
+    def __init__(self, func, instance, maxsize):
         self.func = func
-        self.results = {}
-
-    def __get__(self, instance, cls):
         self.instance = instance
-        return self
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
 
-    def __call__(self, **kwargs):
-        # Make all arguments hashable.
-        key = make_hashable(kwargs)
+        # Results depending on the model's relative energies.
+        argnames = func.__code__.co_varnames[:func.__code__.co_argcount]
+        self.__energy_dependent = "relative_energies" in argnames
+
+    def __get_key(self, kwargs):
+        key = [(name, make_key(kwargs[name])) for name in sorted(kwargs)]
 
         # NOTE: if relative_energies is None, then we should
-        #       search the model's relative energies.
-        if "relative_energies" in key and key["relative_energies"] is None:
-            key["relative_energies"] = make_hashable(self.instance._owner.relative_energies)
+        #       search the model's relative energies, use its version
+        #       instead of the energies themselves.
+        if self.__energy_dependent and kwargs.get("relative_energies") is None:
+            owner = self.instance._owner
+            version = getattr(owner, "relative_energies_version", None)
+            if version is None:
+                version = make_key(owner.relative_energies)
+            key = [item for item in key if item[0] != "relative_energies"]
+            key.append(("relative_energies_version", version))
+
+        return tuple(key)
+
+    def __call__(self, **kwargs):
+        key = self.__get_key(kwargs)
 
         try:
-            return self.results[key]
+            result = self.results.pop(key)
         except KeyError:
-            self.results[key] = self.func(self.instance, **kwargs)
-            return self.results[key]
+            self.misses += 1
+            result = self.func(self.instance, **kwargs)
+        else:
+            self.hits += 1
+
+        # Most recently used result is the last one.
+        self.results[key] = result
+        if self.maxsize is not None:
+            while len(self.results) > max(self.maxsize, 0):
+                self.results.popitem(last=False)
+
+        return result
+
+    def clear(self):
+        """ Remove all memoized results, should be called when the data
+        which the results depend on is changed.
+        """
+        self.results.clear()
+        self.hits = self.misses = 0
+
+    def cache_info(self):
+        """ Query function for cache statistics.
+
+        :return: Hits, misses, max size and current size of the cache
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.results))
+
+
+class Memoized(object):
+    """ Descriptor for returned value memoization, the results are stored
+    per instance in a LRU cache.
+
+    :param func: The method to be memoized
+    :type func: function
+
+    :param maxsize: Max number of cached results for each instance,
+                    None for no limit, default is 128
+    :type maxsize: int
+
+    Example::
+
+        >>> @Memoized
+        ... def get_rate_constants(self, relative_energies=None): ...
+        >>> @Memoized(maxsize=None)
+        ... def poly_adsorbate_derivation(self, adsorbate_name, poly_expression): ...
+        >>> solver.get_rate_constants.cache_info()
+        CacheInfo(hits=3, misses=1, maxsize=128, currsize=1)
+
+    .. note::
+        If :obj:`relative_energies` is None, the model's energies are keyed by
+        its :obj:`relative_energies_version` instead of the values, in-place
+        changes of them are not seen until
+        :obj:`KineticModel.set_relative_energies` is called.
+    """
+    def __init__(self, func=None, maxsize=128):
+        self.func = func
+        self.maxsize = maxsize
+
+    def __call__(self, func):
+        # Used as decorator with arguments.
+        self.func = func
+        return self
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+
+        # The cache shadows the descriptor in instance's dict,
+        # so it is created only once for an instance.
+        cache = MemoizedCache(self.func, instance, self.maxsize)
+        instance.__dict__[self.func.__name__] = cache
 
+        return cache
@@ -12,6 +12,7 @@ from ..database.thermo_data import kB_eV, h_eV
 from ..errors.error import *
 from ..functions import *
 from ..utilities.profiling_utitlities import do_cprofile
+from ..parsers.reaction_network import ReactionNetwork
 from ..solvers.solver_base import SolverBase
 from ..correctors.corrector_base import CorrectorBase
 
@@ -173,6 +174,7 @@ class KineticModel(object):
         self._has_absolute_energy = False
         self._has_relative_energy = False
         self._relative_energies = {}
+        self._relative_energies_version = 0
 
         # Load setup file.
         self._load(self.setup_dict)
@@ -316,13 +318,16 @@ class KineticModel(object):
         if self.log_allowed:
             self._logger.info('Parsing elementary rxns...')
         if self.rxn_expressions:
+            parsed_rxns = self.parser.parse_elementary_rxns(self.rxn_expressions)
             (self.__adsorbate_names,
              self.__gas_names,
              self.__liquid_names,
              self.__site_names,
              self.__transition_state_names,
-             self.__elementary_rxns_list) = \
-                self.parser.parse_elementary_rxns(self.rxn_expressions)
+             self.__elementary_rxns_list) = parsed_rxns
+
+            # Topology index shared by all components.
+            self.__reaction_network = ReactionNetwork(self.rxn_expressions, parsed_rxns)
 
         # Instantialize solver.
         if "solver" in setup_dict:
@@ -414,6 +419,56 @@ class KineticModel(object):
         '''
         setattr(self, mangled_name(self, 'corrector'), corrector)
 
+    def set_temperature(self, temperature):
+        ''' Set temperature of current model, the temperature-dependent data
+        in solver will be updated.
+
+        :param temperature: New temperature (K)
+        :type temperature: float
+        '''
+        if not temperature > 0.0:
+            raise ParameterError("Invalid temperature: {}".format(temperature))
+
+        setattr(self, mangled_name(self, 'temperature'), float(temperature))
+
+        if isinstance(self.solver, SolverBase):
+            self.solver.update_conditions()
+
+    def set_pressures(self, pressures):
+        ''' Set pressures of gas species in current model, the pressure-dependent
+        data in solver will be updated.
+
+        :param pressures: New pressures of gases, e.g. :obj:`{'CO_g': 1.0}`
+        :type pressures: dict
+        '''
+        # The species definitions of model are read-only, modify them by descriptor.
+        descriptor = type(self).species_definitions
+
+        for gas_name, pressure in pressures.items():
+            if gas_name not in self.gas_names:
+                raise ParameterError("{} is not a gas species in model".format(gas_name))
+            if pressure < 0.0:
+                msg = "Invalid pressure for {}: {}".format(gas_name, pressure)
+                raise ParameterError(msg)
+            descriptor.update(self, gas_name, pressure=float(pressure))
+
+        if isinstance(self.solver, SolverBase):
+            self.solver.update_conditions()
+
+    def set_relative_energies(self, relative_energies):
+        ''' Set relative energies of elementary reactions in current model,
+        the version of relative energies will be increased. It is the only
+        mutating path seen by memoized functions, call it again after the
+        energies are changed in place.
+
+        :param relative_energies: Relative energies of all elementary reactions,
+                                  e.g. :obj:`{"Gaf": [...], "Gar": [...], "dG": [...]}`
+        :type relative_energies: dict
+        '''
+        self._relative_energies = relative_energies
+        self._relative_energies_version += 1
+        self._has_relative_energy = True
+
     @Property
     def log_allowed(self):
         """
@@ -444,6 +499,13 @@ class KineticModel(object):
         """
         return self.__elementary_rxns_list
 
+    @Property
+    def reaction_network(self):
+        """
+        Query function for the immutable reaction network index.
+        """
+        return self.__reaction_network
+
     @Property
     def site_names(self):
         """
@@ -497,9 +559,23 @@ class KineticModel(object):
     def relative_energies(self):
         """
         Query function for relative energy in data file.
+
+        .. note::
+            The model's own dict is returned. Memoized results of solvers are
+            keyed by :obj:`relative_energies_version`, so in-place changes, e.g.
+            :obj:`model.relative_energies["Gaf"][0] = 0.5`, must be followed by
+            :obj:`model.set_relative_energies(model.relative_energies)`.
         """
         return self._relative_energies
 
+    @Property
+    def relative_energies_version(self):
+        """
+        Query function for the version of relative energies, which is changed
+        every time the relative energies are set.
+        """
+        return self._relative_energies_version
+
     @Property
     def absolute_energies(self):
         """
@@ -5,13 +5,18 @@ Module for micro-kinetic model class definition.
 import logging
 import os
 from functools import wraps
+from itertools import product
+
+import numpy as np
 
 from .kinetic_model import KineticModel
 from ..errors.error import ParameterError
 from ..mpicommons import mpi
 from ..descriptors.descriptors import *
 from ..utilities.profiling_utitlities import do_cprofile
-from ..compatutil import pickle
+from .. import load_archived_data, flush_archives, truncate_archived_data
+from ..database.steady_state_cache import SteadyStateCache
+from ..database.warm_start_index import WarmStartIndex
 from ..plugins.analysis import OnTheFlyAnalysis
 from ..plugins.hybrid_methods import ODE_integration
 
@@ -55,14 +60,29 @@ class MicroKineticModel(KineticModel):
         'initial_guess', 'steady_state_coverages', 'steady_state_error', 'rates',
         'net_rates', 'reversibilities', 'tofs'
 
+        archive_buffer_size (:obj:`int`): Number of buffered data updates before they are
+        appended to data file, default is 100
+
         numerical_representation (:obj:`str`): Numerical representation method,
-        value could be 'mpmath' or 'sympy'.
+        value could be 'mpmath', 'numpy' or 'sympy'. 'numpy' uses vectorized float64
+        operations which is much faster than the arbitrary precision of 'mpmath'.
 
         rootfinding(:obj:`str`): Rootfinding iterator type, default value is 'MDNewton',
-        possible value can be 'MDNewton' or 'ConstrainedNewton'
+        possible value can be 'MDNewton', 'ConstrainedNewton', 'Broyden' or 'TrustRegionNewton'
 
         tolerance (:obj:`float`): Iteration tolerance, default is 1e-8
 
+        log_coverage (:obj:`bool`): Solve steady state equations in log coverages with float64 first,
+        in numpy representation the root is accepted if the max residual in log space is within
+        the tolerance, otherwise it is polished as initial guess, default is `False`
+
+        mixed_precision (:obj:`bool`): Converge Newton iterations in float64 before polishing
+        the root with mpmath iterative refinement, default is `False`
+
+        sparse_jacobian (:obj:`bool`): Use float64 sparse Jacobian and sparse LU solver, which is
+        used in Newton's iterations of 'MDNewton' and 'ConstrainedNewton' in numpy representation,
+        float64 iterations of mixed precision solving and ODE integration, default is `False`
+
         max_rootfinding_iterations (:obj:`int`): Max iteraction steps, default is 100
 
         ode_buffer_size (:obj:`int`): Ode integration buffer size, default is 500
@@ -71,6 +91,12 @@ class MicroKineticModel(KineticModel):
 
         data_file (:obj:`str`): Filename for data store, default is 'data.pkl'
 
+        cache_file (:obj:`str`): SQLite file for cache of converged steady states, the cache is
+        consulted before solving for the same reaction conditions, default is '' (no cache)
+
+        warm_start_neighbors (:obj:`int`): Number of the closest solved reaction conditions
+        whose steady state coverages are used as initial guess, default is 0 (no warm start)
+
         log_allowed (:obj:`bool`): If log output is allowed, default is `True`
 
         TOFs (:obj:`list` of :obj:`float`): Turnover frequencies calculated.
@@ -97,16 +123,25 @@ class MicroKineticModel(KineticModel):
                                   default=["steady_state_coverages"],
                                   entry_type=str)
 
+    archive_buffer_size = Integer("archive_buffer_size", default=100)
+
     numerical_representation = String("numerical_representation",
                                       default="mpmath",
-                                      candidates=["mpmath", "sympy"])
+                                      candidates=["mpmath", "numpy", "sympy"])
 
     rootfinding = String("rootfinding",
                          default="MDNewton",
-                         candidates=["MDNewton", "ConstrainedNewton"])
+                         candidates=["MDNewton", "ConstrainedNewton", "Broyden",
+                                     "TrustRegionNewton"])
 
     tolerance = Float("tolerance", default=1e-8)
 
+    log_coverage = Bool("log_coverage", default=False)
+
+    mixed_precision = Bool("mixed_precision", default=False)
+
+    sparse_jacobian = Bool("sparse_jacobian", default=False)
+
     max_rootfinding_iterations = Integer("max_rootfinding_iterations",
                                          default=100)
 
@@ -114,6 +149,10 @@ class MicroKineticModel(KineticModel):
 
     ode_output_interval = Integer("ode_output_interval", default=200)
 
+    cache_file = String("cache_file", default="")
+
+    warm_start_neighbors = Integer("warm_start_neighbors", default=0)
+
     # Reference energies used to calculate formation energy.
     ref_energies = RefEnergies("ref_energies", default={})
 
@@ -132,6 +171,9 @@ class MicroKineticModel(KineticModel):
             if mpi.is_master:
                 os.mkdir("./data")
 
+        # Keep only the latest archived values in data file of previous runs.
+        truncate_archived_data(self.data_file)
+
         # Model attributes definitions.
         self.__ss_cvgs = None          # steady-state coverages
         self.__tofs = None              # turn-over frequencies
@@ -151,6 +193,13 @@ class MicroKineticModel(KineticModel):
         :param init_cvgs: Initial guess for coverages
         :type init_cvgs: :obj:`list` of :obj:`float`
 
+        .. note::
+            The initial guess is taken from the first available source in order:
+            :obj:`init_cvgs`, coverages of the closest solved conditions (only if
+            :obj:`warm_start_neighbors` > 0), coverages archived in data file,
+            ODE integration if data file has no coverages, and the model's hybrid
+            method if there is no data file.
+
         :param relative_energies: Relative energies for all elementary reactions.
         :type relative_energies: dict
 
@@ -164,9 +213,25 @@ class MicroKineticModel(KineticModel):
         :param coarse_guess: use fsolve to do initial coverages preprocessing or not
         :type coarse_guess: bool
 
+        :param multistart: number of initial guesses for concurrent multi-start root finding,
+                           default is 0 (not used)
+        :type multistart: int
+
+        :param multistart_processes: number of processes for multi-start root finding,
+                                     default is 1
+        :type multistart_processes: int
+
         :param XRC: calculate degree of rate control or nor
         :type XRC: bool
 
+        :param XRC_method: method for XRC calculation, 'finite_difference' or 'linear_response',
+                           default is 'finite_difference'
+        :type XRC_method: str
+
+        :param XRC_processes: number of processes for finite difference XRC calculation,
+                              default is 1
+        :type XRC_processes: int
+
         :param epsilon: the change of energy for XRC calculation, default is 10-5.
         :type epsilon: float
 
@@ -181,7 +246,11 @@ class MicroKineticModel(KineticModel):
         relative_energies = kwargs.pop("relative_energies", None)
         fsolve = kwargs.pop("fsolve", False)
         coarse_guess = kwargs.pop("coarse_guess", True)
+        multistart = kwargs.pop("multistart", 0)
+        multistart_processes = kwargs.pop("multistart_processes", 1)
         XRC = kwargs.pop("XRC", False)
+        XRC_method = kwargs.pop("XRC_method", "finite_difference")
+        XRC_processes = kwargs.pop("XRC_processes", 1)
         epsilon = kwargs.pop("epsilon", 1e-5)
         product_name = kwargs.pop("product_name", None)
 
@@ -195,62 +264,86 @@ class MicroKineticModel(KineticModel):
 
         solver = self.solver
 
-        # set initial guess(initial coverage)
-        # if there is converged coverage in current path,
-        # use it as initial guess
-        if init_cvgs:
-            # Check init_cvgs type.
-            if not isinstance(init_cvgs, (tuple, list)):
-                msg = "init_cvgs must be a list or tuple, but {} received."
-                msg = msg.format(type(init_cvgs))
-                raise ParameterError(msg)
-
-            # Check coverages length.
-            if len(init_cvgs) != len(self.adsorbate_names):
-                msg = "init_cvgs must have {} elements, but {} is supplied"
-                msg = msg.format(len(self.adsorbate_names), len(init_cvgs))
-                raise ParameterError(msg)
-
+        # Consult steady state cache first.
+        cached = solver._get_cached_steady_state(relative_energies)
+        if cached is not None:
             if self.log_allowed:
-                self._logger.info('use user-defined coverages as initial guess...')
+                self._logger.info('use cached steady state coverages...')
+            self.__ss_cvgs = solver.coverages
+        else:
+            # set initial guess(initial coverage)
+            # if there is converged coverage in current path,
+            # use it as initial guess
+            warm_start_cvgs = None
+            if not init_cvgs:
+                warm_start_cvgs = solver._get_warm_start_cvgs(relative_energies)
+
+            if init_cvgs:
+                # Check init_cvgs type.
+                if not isinstance(init_cvgs, (tuple, list)):
+                    msg = "init_cvgs must be a list or tuple, but {} received."
+                    msg = msg.format(type(init_cvgs))
+                    raise ParameterError(msg)
+
+                # Check coverages length.
+                if len(init_cvgs) != len(self.adsorbate_names):
+                    msg = "init_cvgs must have {} elements, but {} is supplied"
+                    msg = msg.format(len(self.adsorbate_names), len(init_cvgs))
+                    raise ParameterError(msg)
+
+                if self.log_allowed:
+                    self._logger.info('use user-defined coverages as initial guess...')
 
-        elif os.path.exists(self.data_file):
-            with open(self.data_file, 'rb') as f:
-                data = pickle.load(f)
-            init_guess = 'steady_state_coverage'
-            if init_guess in data:
+            elif warm_start_cvgs is not None:
                 if self.log_allowed:
-                    msg = 'use coverages in {} as initial guess...'.format(self.data_file)
+                    msg = 'use coverages of the closest solved conditions as initial guess...'
                     self._logger.info(msg)
-                init_cvgs = data[init_guess]
-                coarse_guess = False
+                init_cvgs = warm_start_cvgs
+
+            elif os.path.exists(self.data_file):
+                data = load_archived_data(self.data_file)
+                init_guess = 'steady_state_coverage'
+                if init_guess in data:
+                    if self.log_allowed:
+                        msg = 'use coverages in {} as initial guess...'.format(self.data_file)
+                        self._logger.info(msg)
+                    init_cvgs = data[init_guess]
+                    coarse_guess = False
+                else:
+                    if self.log_allowed:
+                        self._logger.info('Do ODE integration to get initial guess...')
+                    _, init_cvgs = solver.integrate_to_steady_state(relative_energies=relative_energies)
+
             else:
                 if self.log_allowed:
-                    self._logger.info('Do ODE integration to get initial guess...')
-                ode_traj = solver.solve_ode()
-                init_cvgs = ode_traj[-1]
+                    self._logger.info('Use model\'s hybrid method to guess initial coverages')
 
-        else:
-            if self.log_allowed:
-                self._logger.info('Use model\'s hybrid method to guess initial coverages')
-
-        # Solve steady state coverages.
-        # Use scipy.optimize.fsolve or not (fast but low-precision).
-        if fsolve:
-            if self.log_allowed:
-                self._logger.info('using fsolve to get steady state coverages...')
-            self.__ss_cvgs = solver.fsolve_steady_state_cvgs(c0=init_cvgs,
-                                                             relative_energies=relative_energies)
-        else:
-            if coarse_guess:
+            # Solve steady state coverages.
+            # Use scipy.optimize.fsolve or not (fast but low-precision).
+            if fsolve:
                 if self.log_allowed:
-                    self._logger.info('getting coarse steady state coverages...')
-                init_cvgs = solver.coarse_steady_state_cvgs(c0=init_cvgs,
-                                                            relative_energies=relative_energies)
-            if self.log_allowed:
-                self._logger.info('getting precise steady state coverages...')
-            self.__ss_cvgs = solver.get_steady_state_cvgs(c0=init_cvgs,
-                                                          relative_energies=relative_energies)
+                    self._logger.info('using fsolve to get steady state coverages...')
+                self.__ss_cvgs = solver.fsolve_steady_state_cvgs(c0=init_cvgs,
+                                                                 relative_energies=relative_energies)
+            else:
+                if coarse_guess:
+                    if self.log_allowed:
+                        self._logger.info('getting coarse steady state coverages...')
+                    init_cvgs = solver.coarse_steady_state_cvgs(c0=init_cvgs,
+                                                                relative_energies=relative_energies)
+                self.__ss_cvgs = None
+                if multistart:
+                    if self.log_allowed:
+                        self._logger.info('getting steady state coverages from multiple starts...')
+                    self.__ss_cvgs = solver.multistart_steady_state_cvgs(c0=init_cvgs,
+                                                                         n_starts=multistart,
+                                                                         processes=multistart_processes,
+                                                                         relative_energies=relative_energies)
+                if self.__ss_cvgs is None:
+                    if self.log_allowed:
+                        self._logger.info('getting precise steady state coverages...')
+                    self.__ss_cvgs = solver.get_steady_state_cvgs(c0=init_cvgs,
+                                                                  relative_energies=relative_energies)
 
         # Output rate constants for all elementary reactions.
         solver.get_rate_constants(relative_energies=relative_energies, log=True)
@@ -261,8 +354,14 @@ class MicroKineticModel(KineticModel):
                                   log=True)
 
         # Get TOFs for gases.
-        self.__tofs = solver.get_tof(cvgs=self.__ss_cvgs,
-                                     relative_energies=relative_energies)
+        if cached is not None and cached["tofs"] is not None:
+            self.__tofs = [solver._mpf(tof) for tof in cached["tofs"]]
+        else:
+            self.__tofs = solver.get_tof(cvgs=self.__ss_cvgs,
+                                         relative_energies=relative_energies)
+            # Low-precision root from fsolve is not cached.
+            if not fsolve:
+                solver._cache_steady_state(relative_energies, tofs=self.__tofs)
 
         # Get reversibilities.
         self.__reversibilities = solver.get_reversibilities(rf, rr)
@@ -277,7 +376,129 @@ class MicroKineticModel(KineticModel):
 
             solver.get_single_XRC(product_name,
                                   epsilon=epsilon,
-                                  relative_energies=relative_energies)
+                                  relative_energies=relative_energies,
+                                  method=XRC_method,
+                                  processes=XRC_processes)
+
+        # Write buffered data of all components to data file.
+        flush_archives(self.data_file)
+        # }}}
+
+    def sweep(self, temperatures=None, pressures=None, **kwargs):
+        """
+        Solve steady state coverages and TOFs on a grid of reaction conditions
+        in current process. The parsed model is reused for all grid points and
+        Newton's iterations at each point start from the converged coverages of
+        the nearest solved point.
+
+        :param temperatures: Temperatures (K) to sweep, default is current temperature
+        :type temperatures: :obj:`list` of :obj:`float`
+
+        :param pressures: Pressures of gases to sweep, e.g. :obj:`{"CO_g": [0.1, 1.0]}`,
+                          gases not in it keep current pressures
+        :type pressures: dict
+
+        :param init_cvgs: Initial guess for coverages of the first grid point
+        :type init_cvgs: :obj:`list` of :obj:`float`
+
+        :param relative_energies: Relative energies for all elementary reactions.
+        :type relative_energies: dict
+
+        :returns: Sweep results, :obj:`"temperatures"` (N,), :obj:`"pressures"` (N, n_gases),
+                  :obj:`"coverages"` (N, n_adsorbates), :obj:`"TOFs"` (N, n_gases),
+                  :obj:`"errors"` (N,) and :obj:`"converged"` (N,), gases are in the order
+                  of :obj:`gas_names` and NaN is filled for unconverged points.
+        :rtype: dict of :obj:`numpy.ndarray`
+        """
+        # {{{
+        init_cvgs = kwargs.pop("init_cvgs", None)
+        relative_energies = kwargs.pop("relative_energies", None)
+
+        if kwargs:
+            for key in kwargs:
+                msg = "Found redundant keyword argument: {}".format(key)
+                self._logger.warning(msg)
+
+        solver = self.solver
+        gas_names = self.gas_names
+        species_definitions = self.species_definitions
+
+        # Current conditions.
+        T0 = self.temperature
+        p0 = [species_definitions[gas_name]["pressure"] for gas_name in gas_names]
+
+        # Grid axes.
+        if temperatures is None:
+            temperatures = [T0]
+        pressures = {} if pressures is None else pressures
+        for gas_name in pressures:
+            if gas_name not in gas_names:
+                raise ParameterError("{} is not a gas species in model".format(gas_name))
+        axes = [[float(T) for T in temperatures]]
+        for gas_name, p in zip(gas_names, p0):
+            axes.append([float(pi) for pi in pressures.get(gas_name, [p])])
+
+        conditions = np.array(list(product(*axes)), dtype=np.float64)
+        npts = conditions.shape[0]
+
+        # Coordinates for neighbor searching: temperatures and logarithmic pressures
+        # scaled to unit length along every axis.
+        coordinates = conditions.copy()
+        with np.errstate(divide="ignore"):
+            coordinates[:, 1:] = np.log10(coordinates[:, 1:])
+        coordinates[~np.isfinite(coordinates)] = 0.0
+        span = coordinates.max(axis=0) - coordinates.min(axis=0)
+        span[span == 0.0] = 1.0
+        coordinates = (coordinates - coordinates.min(axis=0))/span
+
+        nads = len(self.adsorbate_names)
+        coverages = np.full((npts, nads), np.nan)
+        tofs = np.full((npts, len(gas_names)), np.nan)
+        errors = np.full(npts, np.nan)
+        converged = np.zeros(npts, dtype=bool)
+
+        if self.log_allowed:
+            self._logger.info("--- Sweep Micro-kinetic model on {} points ---".format(npts))
+
+        try:
+            for i, condition in enumerate(conditions):
+                T, p = condition[0], condition[1:]
+                self.set_temperature(T)
+                self.set_pressures(dict(zip(gas_names, p)))
+
+                # Start from the nearest solved point.
+                solved = np.flatnonzero(converged)
+                if solved.size:
+                    distances = ((coordinates[solved] - coordinates[i])**2).sum(axis=1)
+                    c0 = tuple(coverages[solved[np.argmin(distances)]].tolist())
+                else:
+                    c0 = init_cvgs
+
+                if self.log_allowed:
+                    self._logger.info("T = {}, p = {}".format(T, dict(zip(gas_names, p))))
+
+                cvgs = solver.get_steady_state_cvgs(c0=c0, relative_energies=relative_energies)
+                if cvgs is None:
+                    if self.log_allowed:
+                        self._logger.warning("Steady state coverages not converged")
+                    continue
+
+                coverages[i] = [float(cvg) for cvg in cvgs]
+                tofs[i] = [float(tof) for tof in solver.get_tof(cvgs=cvgs,
+                                                                 relative_energies=relative_energies)]
+                errors[i] = float(solver.error)
+                converged[i] = True
+        finally:
+            # Restore model conditions.
+            self.set_temperature(T0)
+            self.set_pressures(dict(zip(gas_names, p0)))
+
+        return dict(temperatures=conditions[:, 0],
+                    pressures=conditions[:, 1:],
+                    coverages=coverages,
+                    TOFs=tofs,
+                    errors=errors,
+                    converged=converged)
         # }}}
 
     def hybrid_method_register(self, fn):
@@ -333,6 +554,34 @@ class MicroKineticModel(KineticModel):
         else:
             return "./data/data_{}.pkl".format(mpi.rank)
 
+    @Property
+    def steady_state_cache(self):
+        """
+        Steady state cache in cache file, None if no cache file is set.
+        """
+        if not self.cache_file:
+            return None
+        try:
+            return self.__steady_state_cache
+        except AttributeError:
+            self.__steady_state_cache = SteadyStateCache(self.cache_file)
+            return self.__steady_state_cache
+
+    @Property
+    def warm_start_index(self):
+        """
+        Nearest-neighbor index of solved reaction conditions, the points in
+        steady state cache are loaded if cache file is set.
+        """
+        try:
+            return self.__warm_start_index
+        except AttributeError:
+            self.__warm_start_index = WarmStartIndex()
+            if self.steady_state_cache is not None:
+                for point, coverages in self.steady_state_cache.get_points():
+                    self.__warm_start_index.add(point, [float(c) for c in coverages])
+            return self.__warm_start_index
+
     @Property
     def log_allowed(self):
         """
@@ -37,10 +37,7 @@ class AbsoluteEnergyParser(ParserBase):
 
         # Get relative energies from absolute energies.
         relative_energies = self._get_relative_from_absolute()
-        self._owner._relative_energies = relative_energies
-
-        # Set flag.
-        self._owner._has_relative_energy = True
+        self._owner.set_relative_energies(relative_energies)
 
         return
 
@@ -24,11 +24,6 @@ class ParserBase(ModelShell):
         # Set elementary parse regex(compiled)
         self.__regex_dict = {}
 
-        # Parser's species definition
-        # NOTE: parser's species definitions is the reference of model's.
-        attribute_name = mangled_name(self._owner, "species_definitions")
-        self.__species_definitions = getattr(self._owner, attribute_name)
-
         # Set logger.
         self.__logger = logging.getLogger("model.parser.ParserBase")
 
@@ -119,68 +114,42 @@ class ParserBase(ModelShell):
 
     def get_stoichiometry_matrices(self):
         """
-        Go through elementary_rxns_list, return sites stoichiometry matrix,
-        reactants and products stoichiometry matrix.
+        Return sites stoichiometry matrix, reactants and products stoichiometry
+        matrix of all elementary reactions.
 
         :returns site_matrix: coefficients matrix for intermediates, if species
             is on the left of arrow, the entry will be positive, vice-versa.
-            row vector: :obj:`[self.adsorbate_names]`
+            row vector: :obj:`[self.site_names + self.adsorbate_names]`
         :rtype: numpy.matrix
 
         :returns reapro_matrix: coefficients matrix for reactants and product,
             if species is on the left of arrow, the entry will be positive,
-            vice-versa.  row vector: :obj:`[self.gas_names]`
+            vice-versa.  row vector: :obj:`[self.gas_names + self.liquid_names]`
         :rtype: numpy.matrix
+
+        .. note::
+            New copies from :obj:`ReactionNetwork` of the model are returned,
+            which could be modified by caller.
         """
-        # {{{
-        # Site and adsorbate names.
-        sites_names = list(self._owner.site_names + self._owner.adsorbate_names)
-
-        # Reactant and product names.
-        reapro_names = list(self._owner.gas_names + self._owner.liquid_names)
-
-        # Initialize matrices.
-        m = len(self._owner.elementary_rxns_list)
-        n_s, n_g = len(sites_names), len(reapro_names)
-        site_matrix = np.matrix(np.zeros((m, n_s)))
-        reapro_matrix = np.matrix(np.zeros((m, n_g)))
-
-        rxns_list = self._owner.elementary_rxns_list
-
-        # Go through all elementary equations.
-        for i, rxn_list in enumerate(rxns_list):
-            # Initial state.
-            for formula in rxn_list[0]:
-                stoich = formula.stoichiometry()
-                species_site = formula.species_site()
-
-                # Empty site.
-                if species_site in sites_names:
-                    j = sites_names.index(species_site)
-                    site_matrix[i, j] += stoich
-
-                # Adsorbate.
-                if species_site in reapro_names:
-                    j = reapro_names.index(species_site)
-                    reapro_matrix[i, j] += stoich
-
-            # Final state.
-            for formula in rxn_list[-1]:
-                stoich = formula.stoichiometry()
-                species_site = formula.species_site()
-
-                # Empty site.
-                if species_site in sites_names:
-                    j = sites_names.index(species_site)
-                    site_matrix[i, j] -= stoich
-
-                # Adsorbate.
-                if species_site in reapro_names:
-                    j = reapro_names.index(species_site)
-                    reapro_matrix[i, j] -= stoich
-
-        return site_matrix, reapro_matrix
-        # }}}
+        return self._owner.reaction_network.get_stoichiometry_matrices()
+
+    def get_reaction_order_matrices(self):
+        """
+        Return copies of reaction order matrices of forward and reverse rates
+        for all elementary reactions.
+
+        :returns forward_matrix: reaction orders of species in forward rates,
+            row vector: :obj:`[self.adsorbate_names + self.site_names + self.gas_names + self.liquid_names]`
+        :rtype: numpy.ndarray
+
+        :returns reverse_matrix: reaction orders of species in reverse rates,
+            row vector: :obj:`[self.adsorbate_names + self.site_names + self.gas_names + self.liquid_names]`
+        :rtype: numpy.ndarray
+        """
+        reaction_network = self._owner.reaction_network
+
+        return (reaction_network.forward_orders.copy(),
+                reaction_network.reverse_orders.copy())
 
     def get_total_rxn_equation(self):
         """ Function to get total reaction expression of the kinetic model.
@@ -394,6 +363,6 @@ class ParserBase(ModelShell):
     def species_definitions(self):
         """ Query function for parser's species definitions.
         """
-        # Use deep copy to avoid modification of the model's attribution.
-        return self.__species_definitions
+        # Read-only snapshot of the model's species definitions.
+        return self._owner.species_definitions
 
@@ -0,0 +1,166 @@
+''' Module for the precompiled index of reaction network topology.
+'''
+
+import numpy as np
+
+from ..descriptors.descriptors import FrozenDict
+from ..errors.error import ParameterError
+from .rxn_parser import ChemFormula
+
+
+class ReactionNetwork(object):
+    """
+    Immutable array-backed index of a reaction network, which is built only once
+    from the parsed elementary reactions and shared by parser, solvers and corrector.
+
+    Species are indexed in the order of
+    :obj:`adsorbate_names + site_names + gas_names + liquid_names`.
+
+    :param rxn_expressions: Elementary reaction expressions
+    :type rxn_expressions: list of str
+
+    :param parsed_rxns: Return of :obj:`ParserBase.parse_elementary_rxns`, (adsorbate_names,
+                        gas_names, liquid_names, site_names, transition_state_names,
+                        elementary_rxns_list)
+    :type parsed_rxns: tuple
+
+    Example::
+
+        >>> network = ReactionNetwork(rxn_expressions,
+                                      parser.parse_elementary_rxns(rxn_expressions))
+        >>> network.species_indices["CO_s"]
+        0
+    """
+
+    def __init__(self, rxn_expressions, parsed_rxns):
+        # {{{
+        (adsorbate_names, gas_names, liquid_names,
+         site_names, transition_state_names, elementary_rxns_list) = parsed_rxns
+
+        self.rxn_expressions = tuple(rxn_expressions)
+        self.adsorbate_names = tuple(adsorbate_names)
+        self.gas_names = tuple(gas_names)
+        self.liquid_names = tuple(liquid_names)
+        self.site_names = tuple(site_names)
+        self.transition_state_names = tuple(transition_state_names)
+        self.elementary_rxns_list = tuple([tuple([tuple(state) for state in rxn_list])
+                                           for rxn_list in elementary_rxns_list])
+
+        self.species_names = (self.adsorbate_names + self.site_names +
+                              self.gas_names + self.liquid_names)
+        self.species_indices = FrozenDict([(name, i)
+                                           for i, name in enumerate(self.species_names)])
+        self.rxn_indices = FrozenDict([(rxn_expression, i)
+                                       for i, rxn_expression in enumerate(self.rxn_expressions)])
+
+        nrxns, nspecies = len(self.elementary_rxns_list), len(self.species_names)
+        nads, nsites = len(self.adsorbate_names), len(self.site_names)
+
+        # Reaction orders of initial and final states.
+        forward_orders = np.zeros((nrxns, nspecies))
+        reverse_orders = np.zeros((nrxns, nspecies))
+        for i, rxn_list in enumerate(self.elementary_rxns_list):
+            for orders, formula_list in zip([forward_orders, reverse_orders],
+                                            [rxn_list[0], rxn_list[-1]]):
+                for formula in formula_list:
+                    orders[i, self.species_indices[formula.species_site()]] += formula.stoichiometry()
+        self.forward_orders = forward_orders
+        self.reverse_orders = reverse_orders
+
+        # Net production of adsorbates in each elementary reaction.
+        self.adsorbate_stoichiometry = (reverse_orders - forward_orders)[:, :nads]
+
+        # Adsorbates on each type of site.
+        classified_adsorbates = dict([(site_name, []) for site_name in self.site_names])
+        for adsorbate_name in self.adsorbate_names:
+            site_name = "*_{}".format(ChemFormula(adsorbate_name).site())
+            classified_adsorbates[site_name].append(adsorbate_name)
+        self.classified_adsorbates = FrozenDict([(k, tuple(v))
+                                                 for k, v in classified_adsorbates.items()])
+
+        site_matrix = np.zeros((nsites, nads))
+        for i, site_name in enumerate(self.site_names):
+            for adsorbate_name in self.classified_adsorbates[site_name]:
+                site_matrix[i, self.species_indices[adsorbate_name]] = 1.0
+        self.site_matrix = site_matrix
+
+        # Gases consumed in forward and reverse directions.
+        gases = slice(nads + nsites, nads + nsites + len(self.gas_names))
+        self.adsorption_mask = forward_orders[:, gases] > 0
+        self.desorption_mask = reverse_orders[:, gases] > 0
+        self.gas_rxn_mask = np.logical_or(self.adsorption_mask, self.desorption_mask).any(axis=1)
+
+        # Freeze all arrays.
+        for value in self.__dict__.values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+        self.__frozen = True
+        # }}}
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_ReactionNetwork__frozen", False):
+            raise AttributeError("ReactionNetwork object is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("ReactionNetwork object is immutable")
+
+    def get_rxn_index(self, rxn_expression):
+        """
+        Function to get the index of an elementary reaction.
+
+        :param rxn_expression: Elementary reaction expression
+        :type rxn_expression: str
+
+        :return: Index of the reaction
+        :rtype: int
+        """
+        try:
+            return self.rxn_indices[rxn_expression]
+        except KeyError:
+            msg = "'{}' is not an elementary reaction in model".format(rxn_expression)
+            raise ParameterError(msg)
+
+    def get_stoichiometry_matrices(self):
+        """
+        Function to get sites and gases stoichiometry matrices, which are new
+        copies and could be modified by caller, see
+        :obj:`ParserBase.get_stoichiometry_matrices`.
+
+        :returns: site_matrix with row vector :obj:`[site_names + adsorbate_names]`,
+            reapro_matrix with row vector :obj:`[gas_names + liquid_names]`
+        :rtype: tuple of numpy.matrix
+        """
+        nads, nsites = len(self.adsorbate_names), len(self.site_names)
+        stoichiometry = self.forward_orders - self.reverse_orders
+
+        site_matrix = np.hstack([stoichiometry[:, nads: nads+nsites],
+                                 stoichiometry[:, :nads]])
+        reapro_matrix = stoichiometry[:, nads+nsites:]
+
+        return np.matrix(site_matrix), np.matrix(reapro_matrix)
+
+    def get_adsorption_gases(self, idx):
+        """
+        Function to get names of gases in initial state of an elementary reaction.
+
+        :param idx: Index of the elementary reaction
+        :type idx: int
+
+        :return: Gas names
+        :rtype: tuple of str
+        """
+        return tuple([self.gas_names[i] for i in np.nonzero(self.adsorption_mask[idx])[0]])
+
+    def get_desorption_gases(self, idx):
+        """
+        Function to get names of gases in final state of an elementary reaction.
+
+        :param idx: Index of the elementary reaction
+        :type idx: int
+
+        :return: Gas names
+        :rtype: tuple of str
+        """
+        return tuple([self.gas_names[i] for i in np.nonzero(self.desorption_mask[idx])[0]])
@@ -91,10 +91,7 @@ class RelativeEnergyParser(ParserBase):
 
         # Get relative energies and pass it to model.
         relative_energies = self.__get_relative_energies(energy_data)
-        self._owner._relative_energies = relative_energies
-
-        # Set flags in model.
-        self._owner._has_relative_energy = True
+        self._owner.set_relative_energies(relative_energies)
 
         return
         # }}}
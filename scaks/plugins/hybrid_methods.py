@@ -14,12 +14,11 @@ def ODE_integration(model, N):
         model.logger.info('Use ODE integration to get new initial coverages...')
 
     end = 10
-    span = 1e-2
     init_cvgs = model.solver.coverages
 
-    new_cvgs = model.solver.solve_ode(time_end=end,
-                                      time_span=span,
-                                      initial_cvgs=init_cvgs)[-1]
+    # Stop as soon as steady state is reached.
+    new_cvgs = model.solver.integrate_to_steady_state(time_end=end,
+                                                      initial_cvgs=init_cvgs)[-1]
 
     if model.log_allowed:
         model.logger.info('generate new initial coverages - success')
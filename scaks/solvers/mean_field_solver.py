@@ -4,11 +4,14 @@ import logging
 import mpmath as mp
 import numpy as np
 import sympy as sym
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import spsolve, splu
 
 from ..compatutil import merge_two_dicts
 from ..descriptors.descriptors import Memoized, Property
 from ..functions import *
-from ..parsers.rxn_parser import RxnEquation, ChemFormula
+from .rootfinding_iterators import Broyden
 from .solver_base import SolverBase
 
 
@@ -34,7 +37,7 @@ class MeanFieldSolver(SolverBase):
         self._has_symbols = False
 
         # Set essential attrs for solver
-        self._rxns_list = self._owner.elementary_rxns_list
+        self._rxns_list = self._owner.reaction_network.elementary_rxns_list
         self._rxns_num = len(self._rxns_list)
 
         # set constants symbol dict
@@ -64,7 +67,61 @@ class MeanFieldSolver(SolverBase):
             self._mpf = mp.mpf
             self._matrix = mp.matrix
             self._Axb_solver = mp.lu_solve
+            self._inverse = mp.inverse
+            self._lu_factorize = Broyden.lu_factorize
             self._norm = lambda x: mp.norm(x, p=2)
+            self._vectorized = False
+        # Numpy.
+        elif self._owner.numerical_representation == 'numpy':
+            self._math = np
+            self._linalg = np.linalg
+            self._mpf = np.float64
+
+            def cus_matrix(*args):
+                # Vectors are 1-D arrays and matrices are 2-D arrays.
+                if len(args) == 1:
+                    return np.array(args[0], dtype=np.float64)
+                elif len(args) == 2:
+                    return np.zeros(args)
+
+            def cus_Axb_solver(A, b):
+                # Sparse direct solver for sparse Jacobian.
+                if sparse.issparse(A):
+                    x = spsolve(A.tocsc(), np.asarray(b, dtype=np.float64).ravel())
+                    if not np.all(np.isfinite(x)):
+                        raise ZeroDivisionError("Singular Jacobian matrix.")
+                    return x
+                # Keep the same exception as mpmath for singular matrix.
+                try:
+                    return np.linalg.solve(A, b)
+                except np.linalg.LinAlgError:
+                    raise ZeroDivisionError("Singular Jacobian matrix.")
+
+            def cus_inverse(A):
+                try:
+                    return np.linalg.inv(A)
+                except np.linalg.LinAlgError:
+                    raise ZeroDivisionError("Singular Jacobian matrix.")
+
+            def cus_lu_factorize(A):
+                # Factorize once, solve with the factors for every right hand side.
+                if sparse.issparse(A):
+                    try:
+                        lu = splu(A.tocsc())
+                    except RuntimeError:
+                        raise ZeroDivisionError("Singular Jacobian matrix.")
+                    return lambda b: lu.solve(np.asarray(b, dtype=np.float64).ravel())
+                lu = lu_factor(np.asarray(A, dtype=np.float64))
+                if not np.all(np.diag(lu[0])):
+                    raise ZeroDivisionError("Singular Jacobian matrix.")
+                return lambda b: lu_solve(lu, np.asarray(b, dtype=np.float64))
+
+            self._matrix = cus_matrix
+            self._Axb_solver = cus_Axb_solver
+            self._inverse = cus_inverse
+            self._lu_factorize = cus_lu_factorize
+            self._norm = lambda x: np.linalg.norm(np.asarray(x, dtype=np.float64), ord=2)
+            self._vectorized = True
 #        # Gmpy2.
 #        elif self._owner.numerical_representation == 'gmpy':
 #            gmpy2.get_context().precision = 3*self._owner.decimal_precision
@@ -117,16 +174,9 @@ class MeanFieldSolver(SolverBase):
         """
         Private helper function to classify coverages according to type of site.
         """
-        classified_adsorbates = {}
-        for site_name in self._owner.site_names:
-            classified_adsorbates.setdefault(site_name, [])
-
-        for adsorbate_name in self._owner.adsorbate_names:
-            formula = ChemFormula(adsorbate_name)
-            site_name = "*_{}".format(formula.site())
-            classified_adsorbates[site_name].append(adsorbate_name)
-
-        return classified_adsorbates
+        classified_adsorbates = self._owner.reaction_network.classified_adsorbates
+        return {site_name: list(adsorbates)
+                for site_name, adsorbates in classified_adsorbates.items()}
 
     def _cvg_tuple2dict(self, cvgs_tuple):
         """
@@ -137,18 +187,15 @@ class MeanFieldSolver(SolverBase):
         #       which is so small that we can ignore it
 
         # Create cvgs_dict containing adsorbates
-        cvgs_dict = {}
-        adsorbate_names = self._owner.adsorbate_names
-        for adsorbate_name in adsorbate_names:
-            idx = adsorbate_names.index(adsorbate_name)
-            cvgs_dict.setdefault(adsorbate_name, cvgs_tuple[idx])
+        reaction_network = self._owner.reaction_network
+        cvgs_dict = dict(zip(reaction_network.adsorbate_names, cvgs_tuple))
 
         # Add free site coverages
         species_definitions = self._owner.species_definitions
-        for site_name in self._owner.site_names:
+        for site_name in reaction_network.site_names:
             total_cvg = species_definitions[site_name]['total']
             sum_cvg = 0.0
-            for sp in self._classified_adsorbates[site_name]:
+            for sp in reaction_network.classified_adsorbates[site_name]:
                 sum_cvg += cvgs_dict[sp]
             free_site_cvg = total_cvg - sum_cvg
             cvgs_dict.setdefault(site_name, free_site_cvg)
@@ -183,6 +230,14 @@ class MeanFieldSolver(SolverBase):
             c_dict.setdefault(liquid_name, self._mpf(concentration))
         self._c = c_dict
 
+    def update_conditions(self):
+        """ Function to update temperature and pressures data from model,
+        the memoized rate constants will be removed.
+        """
+        self._constants_subs_dict[self._T_sym] = self._mpf(self._owner.temperature)
+        self.get_data()
+        self.get_rate_constants.clear()
+
     @Memoized
     def get_rate_constants(self, relative_energies=None, log=False):
         """ Function to get rate constants for all elementary reactions
@@ -217,19 +272,24 @@ class MeanFieldSolver(SolverBase):
             msg = "'Gaf' and 'Gar' must be in relative_energies."
             raise ParameterError(msg)
 
-        if self._owner.rate_algo == "TST":
-            rate_func = self.get_rxn_rates_TST
-        elif self._owner.rate_algo == "CT":
-            rate_func = self.get_rxn_rates_CT
+        # All rate constants in one pass for numpy representation.
+        if self._vectorized:
+            kfs, krs = self.get_rate_constants_array(relative_energies=relative_energies)
+            kfs, krs = list(kfs[0]), list(krs[0])
         else:
-            msg = "Unknown method type '{}'".format(self._owner.rate_algo)
-            raise ValueError(msg)
+            if self._owner.rate_algo == "TST":
+                rate_func = self.get_rxn_rates_TST
+            elif self._owner.rate_algo == "CT":
+                rate_func = self.get_rxn_rates_CT
+            else:
+                msg = "Unknown method type '{}'".format(self._owner.rate_algo)
+                raise ValueError(msg)
 
-        kfs, krs = [], []
-        for rxn_expression in self._owner.rxn_expressions:
-            kf, kr = rate_func(rxn_expression, relative_energies)
-            kfs.append(kf)
-            krs.append(kr)
+            kfs, krs = [], []
+            for rxn_expression in self._owner.rxn_expressions:
+                kf, kr = rate_func(rxn_expression, relative_energies)
+                kfs.append(kf)
+                krs.append(kr)
 
         if self._owner.log_allowed and log:
             self.__log_rates(kfs, krs, "k_forward", "k_reverse")
@@ -322,7 +382,7 @@ class MeanFieldSolver(SolverBase):
             >>> ("kf[1]*p['O2_g']*theta['*_s']**2", "kr[1]*theta['O_s']**2")
         """
         # {{{
-        idx = self._owner.rxn_expressions.index(rxn_expression)
+        idx = self._owner.reaction_network.get_rxn_index(rxn_expression)
 
         # Local function.
         def list2string(formula_list, direction):
@@ -382,6 +442,361 @@ class MeanFieldSolver(SolverBase):
 
         return f_rate_expressions, r_rate_expressions
 
+    def _compile_function(self, func_name, arg_names, body_lines, return_expr):
+        """
+        Protected helper function to compile expression strings into a function object.
+
+        :param func_name: The name of the generated function
+        :type func_name: str
+
+        :param arg_names: Argument names of the generated function
+        :type arg_names: list of str
+
+        :param body_lines: Statements in function body
+        :type body_lines: list of str
+
+        :param return_expr: The expression to be returned
+        :type return_expr: str
+
+        :return: The compiled function
+        :rtype: function
+        """
+        source = "def {}({}):\n".format(func_name, ", ".join(arg_names))
+        for line in body_lines:
+            source += "    {}\n".format(line)
+        source += "    return {}\n".format(return_expr)
+
+        namespace = {}
+        exec(compile(source, "<{}>".format(func_name), "exec"), namespace)
+
+        return namespace[func_name]
+
+    def get_rate_function(self):
+        """ Get the compiled function to calculate forward and reverse rates.
+
+        The rate expressions are compiled only once, the returned function
+        has the signature ``rate_function(theta, kf, kr, p, c)``.
+
+        :return: The compiled rate function
+        :rtype: function
+        """
+        try:
+            return self.__rate_function
+        except AttributeError:
+            f_rate_expressions, r_rate_expressions = self.get_rate_expressions()
+            body_lines = (["rfs, rrs = [0]*{n}, [0]*{n}".format(n=self._rxns_num)] +
+                          f_rate_expressions + r_rate_expressions)
+            self.__rate_function = self._compile_function("rate_function",
+                                                          ["theta", "kf", "kr", "p", "c"],
+                                                          body_lines,
+                                                          "rfs, rrs")
+            return self.__rate_function
+
+    def _get_vectorized_arrays(self):
+        """
+        Protected helper function to get reaction order and stoichiometry
+        arrays used by the vectorized rate kernels.
+
+        :return: forward reaction orders, reverse reaction orders,
+            net stoichiometry of adsorbates, adsorbates-site matrix, total site coverages
+        :rtype: tuple of numpy.ndarray
+        """
+        # {{{
+        try:
+            return self.__vectorized_arrays
+        except AttributeError:
+            reaction_network = self._owner.reaction_network
+            species_definitions = self._owner.species_definitions
+
+            site_totals = np.array([species_definitions[site_name]['total']
+                                    for site_name in reaction_network.site_names],
+                                   dtype=np.float64)
+
+            # Read-only arrays are shared with the reaction network.
+            self.__vectorized_arrays = (reaction_network.forward_orders,
+                                        reaction_network.reverse_orders,
+                                        reaction_network.adsorbate_stoichiometry,
+                                        reaction_network.site_matrix,
+                                        site_totals)
+
+            return self.__vectorized_arrays
+        # }}}
+
+    def _get_species_vector(self, cvgs_tuple):
+        """
+        Protected helper function to get float64 vector of adsorbate coverages,
+        free site coverages, gas pressures and liquid concentrations.
+        """
+        return self._get_species_vectors([[float(cvg) for cvg in cvgs_tuple]])[0]
+
+    def _get_species_vectors(self, cvgs, pressures=None):
+        """
+        Protected helper function to get float64 species vectors for a batch of points.
+
+        :param cvgs: adsorbate coverages of N points
+        :type cvgs: N x M array-like, M is the number of adsorbates
+
+        :param pressures: gas pressures of N points in the order of gas names,
+            use pressures in model if not provided
+        :type pressures: N x G array-like, G is the number of gases
+
+        :return: species vectors in the order of
+            :obj:`[adsorbate_names + site_names + gas_names + liquid_names]`
+        :rtype: numpy.ndarray
+        """
+        _, _, _, site_matrix, site_totals = self._get_vectorized_arrays()
+
+        theta = np.array(cvgs, dtype=np.float64)
+        npoints = theta.shape[0]
+        free_sites = site_totals - theta.dot(site_matrix.T)
+
+        if pressures is None:
+            pressures = [float(self._p[gas_name]) for gas_name in self._owner.gas_names]
+        p = np.broadcast_to(np.array(pressures, dtype=np.float64),
+                            (npoints, len(self._owner.gas_names)))
+
+        c = [float(self._c[liquid_name]) for liquid_name in self._owner.liquid_names]
+        c = np.broadcast_to(np.array(c, dtype=np.float64), (npoints, len(c)))
+
+        return np.hstack([theta, free_sites, p, c])
+
+    def _vectorized_rates(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate forward and reverse rates with
+        float64 array operations over reaction orders.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: Forward rates and reverse rates
+        :rtype: tuple of numpy.ndarray
+        """
+        x = self._get_species_vector(cvgs_tuple)
+        rfs, rrs = self._batch_rates(x[np.newaxis, :], [kf], [kr])
+
+        return rfs[0], rrs[0]
+
+    def _batch_rates(self, x, kfs, krs):
+        """
+        Protected function to calculate forward and reverse rates for a batch of points.
+
+        :param x: species vectors of N points, see :obj:`_get_species_vectors`
+        :type x: numpy.ndarray
+
+        :param kfs: forward rate constants of N points
+        :type kfs: N x R array-like, R is the number of reactions
+
+        :param krs: reverse rate constants of N points
+        :type krs: N x R array-like
+
+        :return: Forward rates and reverse rates, N x R arrays
+        :rtype: tuple of numpy.ndarray
+        """
+        forward_orders, reverse_orders, _, _, _ = self._get_vectorized_arrays()
+        x = x[:, np.newaxis, :]
+
+        rfs = (np.array(kfs, dtype=np.float64) *
+               np.prod(np.power(x, forward_orders), axis=-1))
+        rrs = (np.array(krs, dtype=np.float64) *
+               np.prod(np.power(x, reverse_orders), axis=-1))
+
+        return rfs, rrs
+
+    def _vectorized_rate_derivatives(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate derivatives of forward and reverse rates
+        wrt adsorbate coverages with float64 array operations. Free site coverages
+        are taken as functions of adsorbate coverages.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: Derivatives of forward rates and reverse rates,
+            M x N arrays, M is the number of reactions and N the number of adsorbates.
+        :rtype: tuple of numpy.ndarray
+        """
+        x = self._get_species_vector(cvgs_tuple)
+        drfs, drrs = self._batch_rate_derivatives(x[np.newaxis, :], [kf], [kr])
+
+        return drfs[0], drrs[0]
+
+    def _batch_rate_derivatives(self, x, kfs, krs):
+        """
+        Protected function to calculate derivatives of forward and reverse rates
+        wrt adsorbate coverages for a batch of points.
+
+        :param x: species vectors of N points, see :obj:`_get_species_vectors`
+        :type x: numpy.ndarray
+
+        :param kfs: forward rate constants of N points
+        :type kfs: N x R array-like, R is the number of reactions
+
+        :param krs: reverse rate constants of N points
+        :type krs: N x R array-like
+
+        :return: Derivatives of forward rates and reverse rates, N x R x M arrays,
+            M is the number of adsorbates
+        :rtype: tuple of numpy.ndarray
+        """
+        # {{{
+        forward_orders, reverse_orders, _, site_matrix, _ = self._get_vectorized_arrays()
+        nsites, nads = site_matrix.shape
+        x = x[:, np.newaxis, :]
+
+        def monomial_derivatives(orders):
+            powers = np.power(x, orders)
+            ones = np.ones(powers.shape[:-1] + (1, ))
+
+            # Products of the factors before and after each species,
+            # no division is needed so zero coverages are safe.
+            before = np.cumprod(np.concatenate([ones, powers[..., :-1]], axis=-1), axis=-1)
+            after = np.cumprod(np.concatenate([ones, powers[..., :0:-1]], axis=-1),
+                               axis=-1)[..., ::-1]
+            factors = np.where(orders > 0,
+                               orders*np.power(x, np.maximum(orders - 1, 0)),
+                               0.0)
+            derivatives = factors*before*after
+
+            # Chain rule for free site coverages.
+            return (derivatives[..., :nads] -
+                    derivatives[..., nads: nads+nsites].dot(site_matrix))
+
+        drfs = np.array(kfs, dtype=np.float64)[..., np.newaxis]*monomial_derivatives(forward_orders)
+        drrs = np.array(krs, dtype=np.float64)[..., np.newaxis]*monomial_derivatives(reverse_orders)
+
+        return drfs, drrs
+        # }}}
+
+    def _get_sparse_arrays(self):
+        """
+        Protected helper function to get the sparsity pattern of rate derivatives,
+        which is determined by the species in each elementary reaction.
+
+        :return: reaction indices and species indices of forward and reverse
+            (reaction, species) pairs, species indices and orders of each reaction
+            padded to the same length, sparse adsorbates-site matrix and sparse
+            transposed net stoichiometry of adsorbates
+        :rtype: tuple
+        """
+        # {{{
+        try:
+            return self.__sparse_arrays
+        except AttributeError:
+            (forward_orders, reverse_orders, adsorbate_stoichiometry,
+             site_matrix, _) = self._get_vectorized_arrays()
+            nsites, nads = site_matrix.shape
+            nspecies = forward_orders.shape[1]
+
+            def pattern(orders):
+                # Only coverages of adsorbates and free sites are variables.
+                rxn_indices, species_indices = np.nonzero(orders[:, :nads+nsites])
+
+                # Species with non-zero orders in each reaction, padded with
+                # an extra species whose value is always 1.
+                nonzeros = [np.nonzero(row)[0] for row in orders]
+                width = max([len(idx) for idx in nonzeros] + [1])
+                padded_indices = np.full((orders.shape[0], width), nspecies, dtype=int)
+                padded_orders = np.zeros((orders.shape[0], width))
+                for i, idx in enumerate(nonzeros):
+                    padded_indices[i, :len(idx)] = idx
+                    padded_orders[i, :len(idx)] = orders[i, idx]
+
+                return rxn_indices, species_indices, padded_indices, padded_orders
+
+            self.__sparse_arrays = (pattern(forward_orders), pattern(reverse_orders),
+                                    sparse.csr_matrix(site_matrix),
+                                    sparse.csr_matrix(adsorbate_stoichiometry.T))
+
+            return self.__sparse_arrays
+        # }}}
+
+    def _sparse_rate_derivatives(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate derivatives of forward and reverse rates
+        wrt adsorbate coverages as sparse matrices, only the entries in the
+        sparsity pattern of the reaction network are calculated.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: Derivatives of forward rates and reverse rates,
+            M x N sparse matrices, M is the number of reactions and N the number of adsorbates.
+        :rtype: tuple of scipy.sparse.csr_matrix
+        """
+        # {{{
+        forward_pattern, reverse_pattern, site_matrix, _ = self._get_sparse_arrays()
+        nsites, nads = site_matrix.shape
+        x = np.append(self._get_species_vector(cvgs_tuple), 1.0)
+
+        def derivatives(k, pattern):
+            rxn_indices, species_indices, padded_indices, padded_orders = pattern
+            indices, orders = padded_indices[rxn_indices], padded_orders[rxn_indices]
+
+            # Monomial derivative wrt the species in each pair.
+            is_variable = (indices == species_indices[:, np.newaxis])
+            coefficients = np.sum(np.where(is_variable, orders, 0.0), axis=1)
+            values = (np.array(k, dtype=np.float64)[rxn_indices]*coefficients*
+                      np.prod(np.power(x[indices], orders - is_variable), axis=1))
+
+            derivatives = sparse.csr_matrix((values, (rxn_indices, species_indices)),
+                                            shape=(len(padded_indices), nads+nsites))
+
+            # Chain rule for free site coverages.
+            return derivatives[:, :nads] - derivatives[:, nads:].dot(site_matrix)
+
+        return derivatives(kf, forward_pattern), derivatives(kr, reverse_pattern)
+        # }}}
+
+    def _vectorized_log_rates(self, log_cvgs, log_kf, log_kr):
+        """
+        Protected function to calculate logarithms of forward and reverse rates
+        with float64 array operations.
+
+        :param log_cvgs: logarithms of adsorbate and free site coverages,
+            in the order of :obj:`self._owner.adsorbate_names + self._owner.site_names`
+        :type log_cvgs: numpy.ndarray
+
+        :param log_kf: logarithms of forward rate constants
+        :type log_kf: numpy.ndarray
+
+        :param log_kr: logarithms of reverse rate constants
+        :type log_kr: numpy.ndarray
+
+        :return: Logarithms of forward rates and reverse rates
+        :rtype: tuple of numpy.ndarray
+        """
+        forward_orders, reverse_orders, _, _, _ = self._get_vectorized_arrays()
+
+        p = [float(self._p[gas_name]) for gas_name in self._owner.gas_names]
+        c = [float(self._c[liquid_name]) for liquid_name in self._owner.liquid_names]
+
+        # NOTE: zero pressure gives -inf, species not in the reaction
+        #       are skipped to avoid 0*log(0).
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_x = np.concatenate([log_cvgs, np.log(p), np.log(c)])
+            lrfs = log_kf + np.where(forward_orders > 0, forward_orders*log_x, 0.0).sum(axis=1)
+            lrrs = log_kr + np.where(reverse_orders > 0, reverse_orders*log_x, 0.0).sum(axis=1)
+
+        return lrfs, lrrs
+
     def get_rates(self, cvgs_tuple, relative_energies=None, log=False):
         """ Function to get forward and reverse rates list.
 
@@ -400,28 +815,16 @@ class MeanFieldSolver(SolverBase):
         :return: Forward rates and reverse rates
         :rtype: tuple of float.
         """
-        # Coverages(theta).
-        theta = self._cvg_tuple2dict(cvgs_tuple)
-
         # Rate constants(kf, kr).
         kf, kr = self.get_rate_constants(relative_energies=relative_energies)
 
-        # Pressure.
-        p = self._p
-
-        # Concentration.
-        c = self._c
-
-        # Rate list.
-        rfs, rrs = [0]*self._rxns_num, [0]*self._rxns_num
-
-        # Rate expressions.
-        rate_expressions = self.get_rate_expressions()
-
         # Calculate rates.
-        for exprs_list in rate_expressions:
-            exprs_str = '\n'.join(exprs_list)
-            exec(exprs_str)
+        if self._vectorized:
+            rfs, rrs = [rates.tolist() for rates in self._vectorized_rates(cvgs_tuple, kf, kr)]
+        else:
+            theta = self._cvg_tuple2dict(cvgs_tuple)
+            rate_function = self.get_rate_function()
+            rfs, rrs = rate_function(theta, kf, kr, self._p, self._c)
 
         if self._owner.log_allowed and log:
             self.__log_rates(rfs, rrs, "R_forward", "R_reverse")
@@ -784,15 +1187,14 @@ class MeanFieldSolver(SolverBase):
         """
         # {{{
         # Get expression index.
-        rxn_idx = self._owner.rxn_expressions.index(rxn_expression)
+        rxn_idx = self._owner.reaction_network.get_rxn_index(rxn_expression)
 
         # Get rate constant symbols.
         kf_syms, kr_syms = self.get_rate_constant_syms()
         k_syms = (kf_syms[rxn_idx], kr_syms[rxn_idx])
 
         # Get formula list.
-        rxn_equation = RxnEquation(rxn_expression)
-        elementary_rxn_list = rxn_equation.to_formula_list()
+        elementary_rxn_list = self._owner.reaction_network.elementary_rxns_list[rxn_idx]
 
         rate_syms = []
 
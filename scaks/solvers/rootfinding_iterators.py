@@ -129,11 +129,13 @@ class ConstrainedNewton(RootfindingIterator):
                 raise ValueError("ZeroDivisionError!")
 
             #use golden method to get optimal step size
+            # NOTE: golden() works on float, the step size must be converted
+            #       before being multiplied with the step vector.
             def fl(l):
-                x1 = self._matrix(x0) + l*s
+                x1 = self._matrix(x0) + self._mpfloat(float(l))*s
                 fx = self._matrix(f(tuple(x1)))
-                return norm(fx)
-            l = golden(fl)
+                return float(norm(fx))
+            l = self._mpfloat(float(golden(fl)))
 #            print l
 #            l = mp.mpf('1.0')
             x1 = self._matrix(x0) + l*s  # matrix
@@ -157,24 +159,25 @@ class MDNewton(RootfindingIterator):
     :param x0: Starting point close to the root
     :type x0: tuple of float
 
-    kwargs MUST contains:
+    kwargs could contain:
 
     :param J: a function returning the Jacobian matrix for a point
     :type J: function
 
-    :param constraint: a coverages tuple constraint function to set limit to x
-    :type constraint: function
+    :param verbose: output Jacobian and step in debug log or not
+    :type verbose: bool
 
-    :param norm: a function to get a norm
+    :param norm: a function to get a norm, default is mpmath.norm
     :type norm: function
 
-    :param mpfloat: high-precision float type, e.g. mpmath.mpfloat
+    :param mpfloat: float type, default is mpmath.mpf
     :type mpfloat: type
 
-    :param matrix: matrix type, e.g. mpmath.matrix
+    :param matrix: matrix type, default is mpmath.matrix
     :type matrix: type
 
-    :param Axb_solver: a function to solve system of linear equations by solving Ax=b
+    :param Axb_solver: a function to solve system of linear equations by solving Ax=b,
+        default is mpmath.lu_solve
     :type Axb_solver: function
 
     .. note::
@@ -199,9 +202,16 @@ class MDNewton(RootfindingIterator):
 
     def __init__(self, f, x0, **kwargs):
         self.f = f
+
+        # Numerical representation, mpmath by default.
+        self.matrix = kwargs.get('matrix', mp.matrix)
+        self.mpfloat = kwargs.get('mpfloat', mp.mpf)
+        self.Axb_solver = kwargs.get('Axb_solver', mp.lu_solve)
+        self.norm = kwargs.get('norm', mp.norm)
+
         if isinstance(x0, (tuple, list)):
-            x0 = mp.matrix(x0)
-        assert x0.cols == 1, 'need a vector'
+            x0 = self.matrix(x0)
+        assert getattr(x0, 'cols', 1) == 1 and getattr(x0, 'ndim', 1) == 1, 'need a vector'
         self.x0 = x0
         if 'J' in kwargs:
             self.J = kwargs['J']
@@ -209,8 +219,7 @@ class MDNewton(RootfindingIterator):
             def J(*x):
                 return mp.jacobian(f, x)
             self.J = J
-        self.norm = mp.norm
-        self.verbose = kwargs['verbose']
+        self.verbose = kwargs.get('verbose', False)
 
         # set logger
         self.logger = logging.getLogger('model.solvers.MDNewton')
@@ -230,26 +239,26 @@ class MDNewton(RootfindingIterator):
         x0 = self.x0
         norm = self.norm
         J = self.J
-        fx = mp.matrix(f(x0))
+        fx = self.matrix(f(x0))
         fxnorm = norm(fx)
         cancel = False
         while not cancel:
             # get direction of descent
             fxn = -fx
             Jx = J(x0)
-            s = mp.lu_solve(Jx, fxn)
+            s = self.Axb_solver(Jx, fxn)
             if self.verbose:
                 self.logger.debug('Jx = \n%s', str(Jx))
                 self.logger.debug('s = \n%s', str(s))
             # damping step size TODO: better strategy (hard task)
-            l = mp.mpf('1.0')
+            l = self.mpfloat('1.0')
             x1 = x0 + s
             while True:
-                if x1 == x0:
+                if tuple(x1) == tuple(x0):
                     self.logger.info("Found stationary point.")
                     cancel = True
                     break
-                fx = mp.matrix(f(x1))
+                fx = self.matrix(f(x1))
                 newnorm = norm(fx)
                 if newnorm < fxnorm:
                     # new x accepted
@@ -261,3 +270,365 @@ class MDNewton(RootfindingIterator):
 
             yield (tuple(x0), fxnorm, fx)
 
+
+class Broyden(RootfindingIterator):
+    """
+    Find the root of a vector function numerically using quasi-Newton method with
+    Broyden's (good) rank-one updates.
+
+    The analytical Jacobian is evaluated and LU factorized only at the start
+    point or when the quasi-Newton step stagnates. In the other iterations the
+    inverse Jacobian is never formed, the factorization is reused and the rank-one
+    corrections are kept as pairs of vectors, H = (I + u_k*s_k^T)...(I + u_1*s_1^T)*J^-1.
+
+    :param f: a vector function representing a nonlinear equation system
+    :type f: function
+
+    :param x0: Starting point close to the root
+    :type x0: tuple of float
+
+    kwargs could contain:
+
+    :param J: a function returning the Jacobian matrix for a point
+    :type J: function
+
+    :param factorize: a function factorizing a matrix once and returning a
+                      function which solves A*x = b for the factorized matrix,
+                      default is LU decomposition of mpmath
+    :type factorize: function
+
+    :param norm: a function to get a norm, default is mpmath.norm
+    :type norm: function
+
+    :param mpfloat: float type, default is mpmath.mpf
+    :type mpfloat: type
+
+    :param matrix: matrix type, default is mpmath.matrix
+    :type matrix: type
+
+    :param max_halvings: max times of step halving before the Jacobian is
+                         evaluated again, default is 4
+    :type max_halvings: int
+    """
+
+    def __init__(self, f, x0, **kwargs):
+        self.f = f
+        self.x0 = tuple(x0)
+
+        # Numerical representation, mpmath by default.
+        self.matrix = kwargs.get('matrix', mp.matrix)
+        self.mpfloat = kwargs.get('mpfloat', mp.mpf)
+        self.factorize = kwargs.get('factorize', self.lu_factorize)
+        self.norm = kwargs.get('norm', mp.norm)
+        self.max_halvings = kwargs.get('max_halvings', 4)
+
+        if 'J' in kwargs:
+            self.J = kwargs['J']
+        else:
+            def J(*x):
+                return mp.jacobian(f, x)
+            self.J = J
+
+        # Number of Jacobian evaluations.
+        self.jacobian_evaluations = 0
+
+        # set logger
+        self.logger = logging.getLogger('model.solvers.Broyden')
+
+    @staticmethod
+    def lu_factorize(A):
+        """
+        Function to LU factorize a mpmath matrix once.
+
+        :param A: The matrix to be factorized
+        :type A: mpmath.matrix
+
+        :return: a function solving A*x = b with the factorization
+        :rtype: function
+        """
+        # Same extra working precision as mpmath.lu_solve.
+        with mp.extraprec(10):
+            LU, p = mp.mp.LU_decomp(mp.matrix(A))
+
+        def solve(b):
+            with mp.extraprec(10):
+                x = mp.mp.U_solve(LU, mp.mp.L_solve(LU, mp.matrix(b), p))
+            return [+i for i in x]
+
+        return solve
+
+    def __factorize_jacobian(self, x):
+        """
+        Private helper function to factorize the Jacobian at point x.
+        """
+        self.jacobian_evaluations += 1
+        return self.factorize(self.J(x))
+
+    @staticmethod
+    def __apply_inverse(solve, updates, y):
+        """
+        Private helper function to multiply the approximate inverse Jacobian
+        by vector y, H*y = (I + u_k*s_k^T)...(I + u_1*s_1^T)*J^-1*y.
+        """
+        z = solve(y)
+        z = [z[i] for i in range(len(y))]
+        for u, s in updates:
+            c = sum([a*b for a, b in zip(s, z)])
+            z = [a + b*c for a, b in zip(z, u)]
+        return z
+
+    def __iter__(self):
+        '''
+        :return: x0, current x vector
+        :rtype: tuple of float
+
+        :return: fxnorm norm of f(x)
+        :rtype: float
+
+        :return: fx, value of f(x)
+        :rtype: list of float
+        '''
+        # {{{
+        f = self.f
+        norm = self.norm
+        x0 = list(self.x0)
+        fx = list(f(tuple(x0)))
+        fxnorm = norm(self.matrix(fx))
+        solve = self.__factorize_jacobian(tuple(x0))
+        updates = []  # rank-one corrections since the last factorization
+        fresh = True  # Jacobian is factorized at current point
+        cancel = False
+
+        while not cancel:
+            # Quasi-Newton step.
+            s = [-i for i in self.__apply_inverse(solve, updates, fx)]
+
+            # Halve the step size until the residual decreases.
+            l = self.mpfloat('1.0')
+            halvings = 0
+            while True:
+                x1 = [x + l*si for x, si in zip(x0, s)]
+                if x1 == x0:
+                    if fresh:
+                        self.logger.info("Found stationary point.")
+                        cancel = True
+                    break
+                fx1 = list(f(tuple(x1)))
+                newnorm = norm(self.matrix(fx1))
+                if newnorm < fxnorm:
+                    break
+                halvings += 1
+                # Stagnation, use the true Jacobian.
+                if halvings > self.max_halvings and not fresh:
+                    break
+                l /= 2
+
+            if cancel:
+                break
+
+            if x1 == x0 or not newnorm < fxnorm:
+                solve = self.__factorize_jacobian(tuple(x0))
+                updates = []
+                fresh = True
+                continue
+
+            # Broyden's update of the inverse Jacobian:
+            # H += (dx - H*df)*(dx^T*H)/(dx^T*H*df) = (I + u*dx^T)*H
+            dx = [b - a for a, b in zip(x0, x1)]
+            df = [b - a for a, b in zip(fx, fx1)]
+            Hdf = self.__apply_inverse(solve, updates, df)
+            denominator = sum([a*b for a, b in zip(dx, Hdf)])
+            if denominator != 0:
+                u = [(a - b)/denominator for a, b in zip(dx, Hdf)]
+                updates.append((u, dx))
+            fresh = False
+
+            x0, fx, fxnorm = x1, fx1, newnorm
+
+            yield (tuple(x0), fxnorm, self.matrix(fx))
+        # }}}
+
+
+class TrustRegionNewton(RootfindingIterator):
+    """
+    Find the root of a vector function numerically using trust-region Newton's
+    method with dogleg steps.
+
+    The step is the Newton step if it lies in the trust region, otherwise the
+    dogleg path between Cauchy point and Newton step is cut by the trust region
+    boundary. The trust region radius is adapted by the ratio of actual and
+    predicted reduction of the merit function 0.5*||f(x)||^2, so that only one
+    or two function evaluations are needed in one step.
+
+    :param f: a vector function representing a nonlinear equation system
+    :type f: function
+
+    :param x0: Starting point close to the root
+    :type x0: tuple of float
+
+    kwargs could contain:
+
+    :param J: a function returning the Jacobian matrix for a point
+    :type J: function
+
+    :param constraint: a coverages tuple constraint function to set limit to x,
+                       default is no constraint
+    :type constraint: function
+
+    :param norm: a function to get a norm, default is mpmath.norm
+    :type norm: function
+
+    :param mpfloat: float type, default is mpmath.mpf
+    :type mpfloat: type
+
+    :param matrix: matrix type, default is mpmath.matrix
+    :type matrix: type
+
+    :param Axb_solver: a function to solve system of linear equations by solving Ax=b,
+        default is mpmath.lu_solve
+    :type Axb_solver: function
+
+    :param radius: initial trust region radius, default is the length of the
+                   first Newton step
+    :type radius: float
+
+    :param max_radius: max trust region radius, default is 1.0
+    :type max_radius: float
+    """
+
+    def __init__(self, f, x0, **kwargs):
+        self.f = f
+        self.x0 = tuple(x0)
+
+        # Numerical representation, mpmath by default.
+        self.matrix = kwargs.get('matrix', mp.matrix)
+        self.mpfloat = kwargs.get('mpfloat', mp.mpf)
+        self.Axb_solver = kwargs.get('Axb_solver', mp.lu_solve)
+        self.norm = kwargs.get('norm', mp.norm)
+
+        if 'J' in kwargs:
+            self.J = kwargs['J']
+        else:
+            def J(*x):
+                return mp.jacobian(f, x)
+            self.J = J
+
+        if 'constraint' in kwargs:
+            self.constraint = kwargs['constraint']
+        else:
+            self.constraint = lambda x: x
+
+        self.radius = kwargs.get('radius', None)
+        self.max_radius = self.mpfloat(kwargs.get('max_radius', 1.0))
+
+        # set logger
+        self.logger = logging.getLogger('model.solvers.TrustRegionNewton')
+
+    def __length(self, v):
+        """
+        Private helper function to get the length of a vector.
+        """
+        return self.norm(self.matrix(v))
+
+    def __dogleg(self, pN, pN_length, pC, g, radius):
+        """
+        Private helper function to get the dogleg step in trust region.
+        """
+        # Newton step in trust region.
+        if pN is not None and pN_length <= radius:
+            return pN
+
+        # Steepest descent direction cut by the boundary.
+        pC_length = self.__length(pC)
+        if pN is None or pC_length >= radius:
+            g_length = self.__length(g)
+            return [-radius/g_length*gi for gi in g]
+
+        # Solve ||pC + t*(pN - pC)|| = radius for t in [0, 1].
+        d = [a - b for a, b in zip(pN, pC)]
+        a = sum([di*di for di in d])
+        b = 2*sum([ci*di for ci, di in zip(pC, d)])
+        c = pC_length**2 - radius**2
+        t = (-b + (b*b - 4*a*c)**0.5)/(2*a)
+
+        return [ci + t*di for ci, di in zip(pC, d)]
+
+    def __iter__(self):
+        '''
+        :return: x0, current x vector
+        :rtype: tuple of float
+
+        :return: fxnorm norm of f(x)
+        :rtype: float
+
+        :return: fx, value of f(x)
+        :rtype: list of float
+        '''
+        # {{{
+        f = self.f
+        x0 = self.constraint(self.x0)
+        fx = list(f(x0))
+        fxnorm = self.norm(self.matrix(fx))
+        phi = sum([fi*fi for fi in fx])/2
+        n = len(x0)
+        radius = self.radius
+        cancel = False
+
+        while not cancel:
+            Jx = self.J(x0)
+            Jl = [[Jx[i, j] for j in range(n)] for i in range(len(fx))]
+
+            # Newton step.
+            try:
+                pN = list(self.Axb_solver(Jx, -self.matrix(fx)))
+                pN_length = self.__length(pN)
+            except ZeroDivisionError:
+                pN, pN_length = None, None
+
+            # Gradient of merit function and Cauchy point.
+            g = [sum([Jl[i][j]*fx[i] for i in range(len(fx))]) for j in range(n)]
+            Jg = [sum([Jij*gj for Jij, gj in zip(row, g)]) for row in Jl]
+            gg, JgJg = sum([gi*gi for gi in g]), sum([i*i for i in Jg])
+            if gg == 0 or JgJg == 0:
+                self.logger.info("Found stationary point.")
+                break
+            pC = [-gg/JgJg*gi for gi in g]
+
+            if radius is None:
+                radius = pN_length if pN is not None else self.__length(pC)
+            radius = min(self.mpfloat(radius), self.max_radius)
+
+            # Shrink trust region until the step is accepted.
+            while True:
+                p = self.__dogleg(pN, pN_length, pC, g, radius)
+                x1 = self.constraint(tuple([x + pi for x, pi in zip(x0, p)]))
+                if tuple(x1) == tuple(x0):
+                    self.logger.info("Found stationary point.")
+                    cancel = True
+                    break
+
+                # Actual step after constraining.
+                p = [b - a for a, b in zip(x0, x1)]
+                p_length = self.__length(p)
+                fx1 = list(f(x1))
+                phi1 = sum([fi*fi for fi in fx1])/2
+
+                # Predicted reduction by linear model.
+                Jp = [sum([Jij*pj for Jij, pj in zip(row, p)]) for row in Jl]
+                predicted = phi - sum([(a + b)**2 for a, b in zip(fx, Jp)])/2
+                actual = phi - phi1
+                rho = actual/predicted if predicted > 0 else -1
+
+                # Update trust region radius.
+                if rho < 0.25:
+                    radius = p_length/4
+                elif rho > 0.75 and p_length >= radius*0.99:
+                    radius = min(2*radius, self.max_radius)
+
+                if rho > 1e-4:
+                    x0, fx, phi = x1, fx1, phi1
+                    fxnorm = self.norm(self.matrix(fx))
+                    break
+
+            yield (tuple(x0), fxnorm, self.matrix(fx))
+        # }}}
@@ -2,6 +2,8 @@ import logging
 from math import exp, pi, sqrt, log
 from operator import mul
 
+import numpy as np
+
 from .. import ModelShell
 from ..compatutil import reduce
 from ..database.thermo_data import kB_J, kB_eV, h_eV, P0
@@ -23,6 +25,13 @@ class SolverBase(ModelShell):
         # Set logger.
         self.__logger = logging.getLogger("model.solver.SolverBase")
 
+    def update_conditions(self):
+        """ Function to be called when the reaction conditions (temperature,
+        pressures) of the owner model are changed, should be overridden in
+        sub-class which holds condition-dependent data.
+        """
+        pass
+
     def get_kTST(self, Ga, T):
         """ Calculate rate constants according to Transition State Theory.
 
@@ -146,18 +155,19 @@ class SolverBase(ModelShell):
 
         # Include pressures.
         if include_pressure:
-            rxn_equation = RxnEquation(rxn_expression)
+            reaction_network = self._owner.reaction_network
+            idx = reaction_network.get_rxn_index(rxn_expression)
             f = lambda gas: self._owner.species_definitions[gas]["pressure"]
 
             # Forward rate.
-            adsorption_gases = rxn_equation.adsorption_gases()
-            pressures = [f(gas.formula()) for gas in adsorption_gases]
+            adsorption_gases = reaction_network.get_adsorption_gases(idx)
+            pressures = [f(gas) for gas in adsorption_gases]
             p = reduce(mul, pressures) if pressures else 1.0
             rf = p*rf
 
             # Reverse rate.
-            desorption_gases = rxn_equation.desorption_gases()
-            pressures = [f(gas.formula()) for gas in desorption_gases]
+            desorption_gases = reaction_network.get_desorption_gases(idx)
+            pressures = [f(gas) for gas in desorption_gases]
             p = reduce(mul, pressures) if pressures else 1.0
             rr = p*rr
 
@@ -201,8 +211,9 @@ class SolverBase(ModelShell):
             self.__logger.info("{} (Gaf={}, Gar={}, dG={})".format(rxn_expression, Gaf, Gar, dG))
 
         # Get reactants and product types.
-        rxn_equation = RxnEquation(rxn_expression)
-        formula_list = rxn_equation.to_formula_list()
+        reaction_network = self._owner.reaction_network
+        rxn_idx = reaction_network.get_rxn_index(rxn_expression)
+        formula_list = reaction_network.elementary_rxns_list[rxn_idx]
         istate, fstate = formula_list[0], formula_list[-1]
         is_types = [formula.type() for formula in istate]
         fs_types = [formula.type() for formula in fstate]
@@ -343,13 +354,178 @@ class SolverBase(ModelShell):
         return rf, rr
         # }}}
 
+    def get_rate_constants_array(self, temperatures=None, relative_energies=None):
+        """
+        Function to get rate constants of all elementary reactions for a batch of
+        temperatures and/or relative energy sets in one pass, using the rate
+        algorithm ('TST' or 'CT') of the model.
+
+        :param temperatures: Temperatures (K), model's temperature by default
+        :type temperatures: float or 1-D array of float
+
+        :param relative_energies: Relative energies, the values of "Gaf", "Gar" and
+                                  "dG" could be lists of all elementary reactions or
+                                  (n_sets, n_rxns) arrays, model's energies by default
+        :type relative_energies: dict
+
+        :return: Forward and reverse rate constants with shape (n_points, n_rxns),
+                 the temperatures and energy sets are broadcast against each other
+        :rtype: tuple of numpy.ndarray
+
+        Example::
+
+            >>> kf, kr = solver.get_rate_constants_array(temperatures=[400.0, 450.0, 500.0])
+            >>> kf.shape
+            (3, 3)
+        """
+        # {{{
+        if temperatures is None:
+            temperatures = self._owner.temperature
+        T = np.atleast_1d(np.array(temperatures, dtype=np.float64))
+        if T.ndim != 1 or not np.all(T > 0.0):
+            raise ParameterError("Invalid temperatures: {}".format(temperatures))
+        T = T[:, np.newaxis]
+
+        if not relative_energies:
+            if self._owner.has_relative_energy:
+                relative_energies = self._owner.relative_energies
+            else:
+                msg = "Solver must have relative energies to get rate constants."
+                raise AttributeError(msg)
+
+        # Energies with shape (n_sets, n_rxns).
+        nrxns = len(self._owner.rxn_expressions)
+        energies = {}
+        for key in ("Gaf", "Gar", "dG"):
+            if key not in relative_energies:
+                continue
+            energy = np.atleast_2d(np.array(relative_energies[key], dtype=np.float64))
+            if energy.ndim != 2 or energy.shape[1] != nrxns:
+                msg = "Shape of '{}' must be (n_sets, {})".format(key, nrxns)
+                raise ParameterError(msg)
+            energies[key] = energy
+
+        if "Gaf" not in energies or "Gar" not in energies:
+            msg = "'Gaf' and 'Gar' must be in relative_energies."
+            raise ParameterError(msg)
+
+        try:
+            shape = np.broadcast(T, energies["Gaf"], energies["Gar"]).shape
+        except ValueError:
+            msg = "Temperatures ({}) and energy sets ({}) could not be broadcast"
+            msg = msg.format(T.shape[0], energies["Gaf"].shape[0])
+            raise ParameterError(msg)
+
+        kBT = kB_eV*T
+        kTST = lambda Ga: np.broadcast_to(kBT/h_eV*np.exp(-Ga/kBT), shape).copy()
+
+        # Use Transition State Theory for all reactions.
+        kf, kr = kTST(energies["Gaf"]), kTST(energies["Gar"])
+
+        if self._owner.rate_algo == "TST":
+            return kf, kr
+        elif self._owner.rate_algo != "CT":
+            msg = "Unknown method type '{}'".format(self._owner.rate_algo)
+            raise ValueError(msg)
+
+        # Collision Theory for adsorption and desorption reactions.
+        ads_cols, des_cols, ads_gases, des_gases = self.__get_CT_reactions()
+        if not (ads_cols or des_cols):
+            return kf, kr
+
+        Auc = self._owner.unitcell_area
+        if not Auc > 0.0:
+            raise AttributeError("Invalid unitcell area: {}".format(Auc))
+
+        act_ratio = self._owner.active_ratio
+        if act_ratio > 1.0:
+            msg = "active area ratio must be less than 1.0"
+            raise ParameterError(msg)
+
+        corrector = self._owner.corrector
+        if type(corrector) == str:
+            msg = "No instantialized corrector, try to modify '{}'"
+            msg = msg.format(self._owner.setup_file)
+            raise SetupError(msg)
+
+        if "dG" not in energies:
+            raise ParameterError("'dG' must be in relative_energies for CT.")
+
+        Gaf, Gar, dG = [np.broadcast_to(energies[key], shape) for key in ("Gaf", "Gar", "dG")]
+
+        # Free energy corrections of gases at standard pressure, shape (n_T, n_gases).
+        Ts = T[:, 0]
+
+        def get_corrections(gases):
+            return np.array([corrector.entropy_correction(gas_name, m, P0, Ts)
+                             for gas_name, m, _ in gases], dtype=np.float64).T
+
+        T, kBT = np.broadcast_to(T, shape), np.broadcast_to(kBT, shape)
+
+        # Adsorption: forward rate from Collision Theory and reverse rate from
+        # the equivalent TST barriers.
+        if ads_cols:
+            m = np.array([gas[1] for gas in ads_gases])
+            stoichiometry = np.array([gas[2] for gas in ads_gases])
+            cols = (slice(None), ads_cols)
+
+            # Equivalent TST barrier of kCT, see get_TST_barrier_from_CT.
+            prefactor = act_ratio*P0*Auc*h_eV/(kBT[cols]*np.sqrt(2*pi*m*kB_J*T[cols]))
+            Gaf_TST = Gaf[cols] - kBT[cols]*np.log(prefactor)
+
+            corrections = np.broadcast_to(get_corrections(ads_gases), Gaf_TST.shape)
+            Gar_TST = np.maximum(Gaf_TST - (dG[cols] - stoichiometry*corrections), 0.0)
+
+            kf[cols] = kBT[cols]/h_eV*np.exp(-Gaf_TST/kBT[cols])
+            kr[cols] = kBT[cols]/h_eV*np.exp(-Gar_TST/kBT[cols])
+
+        # Desorption: reverse barrier corrected by gas entropy.
+        if des_cols:
+            stoichiometry = np.array([gas[2] for gas in des_gases])
+            cols = (slice(None), des_cols)
+
+            corrections = np.broadcast_to(get_corrections(des_gases), Gar[cols].shape)
+            Gar_TST = Gar[cols] - stoichiometry*corrections
+            kr[cols] = kBT[cols]/h_eV*np.exp(-Gar_TST/kBT[cols])
+
+        return kf, kr
+        # }}}
+
+    def __get_CT_reactions(self):
+        """
+        Private helper function to get indices of adsorption and desorption
+        reactions and the (gas name, absolute mass, stoichiometry) of their gases.
+        """
+        # {{{
+        try:
+            return self.__CT_reactions
+        except AttributeError:
+            ads_cols, des_cols, ads_gases, des_gases = [], [], [], []
+
+            reaction_network = self._owner.reaction_network
+            for idx, formula_list in enumerate(reaction_network.elementary_rxns_list):
+                istate, fstate = formula_list[0], formula_list[-1]
+                for state, cols, gases in [(istate, ads_cols, ads_gases),
+                                           (fstate, des_cols, des_gases)]:
+                    types = [formula.type() for formula in state]
+                    if "gas" in types:
+                        formula = state[types.index("gas")]
+                        m = ParserBase.get_molecular_mass(formula.species(), absolute=True)
+                        cols.append(idx)
+                        gases.append((formula.formula(), m, formula.stoichiometry()))
+                        break
+
+            self.__CT_reactions = (ads_cols, des_cols, ads_gases, des_gases)
+
+            return self.__CT_reactions
+        # }}}
+
     def _get_relative_energies(self, rxn_expression, relative_energies):
         """
         Private helper function to get relative energies for an elementary reaction.
         """
         # Get raw relative energies.
-        rxn_expressions = self._owner.rxn_expressions
-        idx = rxn_expressions.index(rxn_expression)
+        idx = self._owner.reaction_network.get_rxn_index(rxn_expression)
 
         Gaf = relative_energies["Gaf"][idx]
         Gar = relative_energies["Gar"][idx]
@@ -1,21 +1,56 @@
 import copy
 import logging
+import multiprocessing
 import random
 import re
 
+import mpmath as mp
+import numpy as np
+from scipy import integrate
 from scipy.integrate import odeint, ode
-from scipy.linalg import norm
+from scipy.linalg import norm, lu_factor, lu_solve
+from scipy.sparse.linalg import splu
 from scipy.optimize import fsolve
+from scipy.special import logsumexp
 
 from .. import file_header
 from ..descriptors.descriptors import Memoized, Property
 from ..errors.error import *
+from ..mpicommons import mpi
 from ..utilities.format_utilities import get_list_string
 from ..parsers.rxn_parser import *
 from .rootfinding_iterators import *
 from .mean_field_solver import MeanFieldSolver
 
 
+# Solver and arguments shared with forked XRC worker processes.
+_XRC_task = None
+
+
+def _perturbed_XRC(idx):
+    """
+    Worker function to calculate XRC for a single elementary reaction in a forked process.
+    """
+    solver, args = _XRC_task
+    # Perturbed steady states are not archived by worker processes.
+    solver.archive_data = lambda data_name, data: None
+    return solver._get_perturbed_XRC(idx, *args)
+
+
+# Solver, initial guesses and relative energies shared with forked multi-start workers.
+_multistart_task = None
+
+
+def _single_start_root(idx):
+    """
+    Worker function to run Newton's iterations from a single initial guess in a forked process.
+    """
+    solver, candidates, relative_energies = _multistart_task
+    ret = solver._get_single_start_root(candidates[idx], relative_energies)
+    if ret is not None:
+        return (idx,) + ret
+
+
 class SteadyStateSolver(MeanFieldSolver):
     ''' MicroKinetic model solver using steady state approximation.
 
@@ -130,8 +165,9 @@ class SteadyStateSolver(MeanFieldSolver):
             raise ValueError("'{}' is not an adsorbate!".format(adsorbate_name))
 
         # Get formula object list of the rxn_expression.
-        rxn_equation = RxnEquation(rxn_expression)
-        elementary_rxn_list = rxn_equation.to_formula_list()
+        reaction_network = self._owner.reaction_network
+        idx = reaction_network.get_rxn_index(rxn_expression)
+        elementary_rxn_list = reaction_network.elementary_rxns_list[idx]
 
         # Find formula list index.
         for formula_list in elementary_rxn_list:
@@ -219,6 +255,29 @@ class SteadyStateSolver(MeanFieldSolver):
             return dtheta_dt_expressions
         # }}}
 
+    def get_dtheta_dt_function(self):
+        """ Get the compiled function to calculate dtheta/dt for all adsorbates.
+
+        The dtheta/dt expressions are compiled only once, the returned function
+        has the signature ``dtheta_dt_function(theta, kf, kr, p, c)``.
+
+        :return: The compiled dtheta/dt function
+        :rtype: function
+        """
+        # {{{
+        try:
+            return self.__dtheta_dt_function
+        except AttributeError:
+            nads = len(self._owner.adsorbate_names)
+            body_lines = (["dtheta_dt = [0.0]*{}".format(nads)] +
+                          self.get_dtheta_dt_expressions())
+            self.__dtheta_dt_function = self._compile_function("dtheta_dt_function",
+                                                               ["theta", "kf", "kr", "p", "c"],
+                                                               body_lines,
+                                                               "tuple(dtheta_dt)")
+            return self.__dtheta_dt_function
+        # }}}
+
     def steady_state_function(self, cvgs_tuple, relative_energies=None):
         """
         Recieve a coverages tuple containing coverages of adsorbates, calculate 
@@ -231,28 +290,102 @@ class SteadyStateSolver(MeanFieldSolver):
         :type relative_energies: dict
         """
         # {{{
-        # Set theta, kf, kr, p, dtheta_dt
-        # Coverages(theta).
-        theta = self._cvg_tuple2dict(cvgs_tuple)
-
         # Rate constants(kf, kr).
         kf, kr = self.get_rate_constants(relative_energies=relative_energies)
 
-        # Pressure.
-        p = self._p
+        if self._vectorized:
+            return tuple(self._vectorized_dtheta_dt(cvgs_tuple, kf, kr).tolist())
 
-        # Concentration.
-        c = self._c
+        # Coverages(theta).
+        theta = self._cvg_tuple2dict(cvgs_tuple)
 
         # Rate of coverage change(dtheta_dt).
-        dtheta_dt = [0.0]*len(self._owner.adsorbate_names)
-
-        dtheta_dt_expressions = '\n'.join(self.get_dtheta_dt_expressions())
-        exec(dtheta_dt_expressions, globals(), locals())
+        dtheta_dt_function = self.get_dtheta_dt_function()
 
-        return tuple(dtheta_dt)
+        return dtheta_dt_function(theta, kf, kr, self._p, self._c)
         # }}}
 
+    def _vectorized_dtheta_dt(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate dtheta/dt of all adsorbates with
+        float64 array operations.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: dtheta/dt in the order of adsorbate names
+        :rtype: numpy.ndarray
+        """
+        _, _, adsorbate_stoichiometry, _, _ = self._get_vectorized_arrays()
+        rfs, rrs = self._vectorized_rates(cvgs_tuple, kf, kr)
+
+        return adsorbate_stoichiometry.T.dot(rfs - rrs)
+
+    def _vectorized_jacobian(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate the analytical Jacobian matrix with
+        float64 array operations.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: N x N Jacobian matrix, N is the number of adsorbates
+        :rtype: numpy.ndarray
+        """
+        _, _, adsorbate_stoichiometry, _, _ = self._get_vectorized_arrays()
+        drfs, drrs = self._vectorized_rate_derivatives(cvgs_tuple, kf, kr)
+
+        return adsorbate_stoichiometry.T.dot(drfs - drrs)
+
+    def _sparse_jacobian(self, cvgs_tuple, kf, kr):
+        """
+        Protected function to calculate the analytical Jacobian matrix as a
+        float64 sparse matrix, whose pattern is determined by the reaction network.
+
+        :param cvgs_tuple: adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param kf: forward rate constants
+        :type kf: list of float
+
+        :param kr: reverse rate constants
+        :type kr: list of float
+
+        :return: N x N Jacobian matrix, N is the number of adsorbates
+        :rtype: scipy.sparse.csc_matrix
+        """
+        _, _, _, stoichiometry_T = self._get_sparse_arrays()
+        drfs, drrs = self._sparse_rate_derivatives(cvgs_tuple, kf, kr)
+
+        return stoichiometry_T.dot(drfs - drrs).tocsc()
+
+    def __get_newton_jacobian(self, relative_energies=None):
+        """
+        Private helper function to get the Jacobian function for Newton's iterations,
+        the sparse Jacobian is used in numpy representation if :obj:`sparse_jacobian`
+        is set and the rootfinding iterator only solves linear equations with it.
+        """
+        if (self._vectorized and self._owner.sparse_jacobian and
+                self._owner.rootfinding in ('ConstrainedNewton', 'MDNewton')):
+            def J(x):
+                kf, kr = self.get_rate_constants(relative_energies=relative_energies)
+                return self._sparse_jacobian(x, kf, kr)
+            return J
+
+        return lambda x: self.analytical_jacobian(x, relative_energies=relative_energies)
+
     @staticmethod
     def __term_adsorbate_derivation(adsorbate_name, term_expression):
         """
@@ -396,7 +529,7 @@ class SteadyStateSolver(MeanFieldSolver):
         return derivation_expression
         # }}}
 
-    @Memoized
+    @Memoized(maxsize=None)
     def poly_adsorbate_derivation(self, adsorbate_name, poly_expression):
         """
         Expect a polynomial expression of dtheta_dt and an adsorbate_name,
@@ -451,7 +584,7 @@ class SteadyStateSolver(MeanFieldSolver):
             keys ":obj:`Gaf` and G:obj:`Gar` must be in relative energies dict
 
         :return: The analytical Jacobian matrix, N x N matrix of float, N is the number of adsorbates.
-        :rtype: numpy.matrix
+        :rtype: mpmath.matrix or numpy.ndarray
         """
         # {{{
         # Check input parameter.
@@ -462,38 +595,459 @@ class SteadyStateSolver(MeanFieldSolver):
             msg = "{} coverages are expected, but {} are provided.".format(m, n)
             raise ParameterError(msg)
 
-        # Set theta, kf, kr, p, dtheta_dt
+        # Rate constants(kf, kr).
+        kf, kr = self.get_rate_constants(relative_energies=relative_energies)
+
+        if self._vectorized:
+            return self._vectorized_jacobian(cvgs_tuple, kf, kr)
+
         # Coverages(theta).
         theta = self._cvg_tuple2dict(cvgs_tuple)
 
-        # Rate constants(kf, kr).
+        # Fill the Jacobian matrix in a single pass.
+        jacobian_function = self.get_jacobian_function()
+        J = self._matrix(m, n)
+
+        return jacobian_function(theta, kf, kr, self._p, self._c, J)
+        # }}}
+
+    def get_jacobian_function(self):
+        """ Get the compiled function to fill the analytical Jacobian matrix.
+
+        All derivation expressions are generated and compiled only once,
+        the returned function has the signature
+        ``jacobian_function(theta, kf, kr, p, c, J)``, which fills all
+        non-zero entries of a zero matrix J and returns it.
+
+        :return: The compiled Jacobian function
+        :rtype: function
+        """
+        # {{{
+        try:
+            return self.__jacobian_function
+        except AttributeError:
+            dtheta_dt_expressions = self.get_dtheta_dt_expressions()
+            adsorbate_names = self._owner.adsorbate_names
+
+            body_lines = []
+            for i, poly_expression in enumerate(dtheta_dt_expressions):
+                for j, adsorbate_name in enumerate(adsorbate_names):
+                    derivation = self.poly_adsorbate_derivation(adsorbate_name=adsorbate_name,
+                                                                poly_expression=poly_expression)
+                    # Skip the entries which are always zero.
+                    if not re.search(r"k[fr]\[", derivation):
+                        continue
+                    body_lines.append("J[{}, {}] = {}".format(i, j, derivation))
+
+            self.__jacobian_function = self._compile_function("jacobian_function",
+                                                              ["theta", "kf", "kr", "p", "c", "J"],
+                                                              body_lines,
+                                                              "J")
+            return self.__jacobian_function
+        # }}}
+
+    def get_net_rate_derivatives_function(self):
+        """ Get the compiled function to fill the derivatives of net rates wrt
+        adsorbate coverages.
+
+        The returned function has the signature
+        ``net_rate_derivatives_function(theta, kf, kr, p, c, D)``, which fills all
+        non-zero entries of a zero matrix D and returns it.
+
+        :return: The compiled net rate derivatives function
+        :rtype: function
+        """
+        # {{{
+        try:
+            return self.__net_rate_derivatives_function
+        except AttributeError:
+            adsorbate_names = self._owner.adsorbate_names
+            f_rate_expressions, r_rate_expressions = self.get_rate_expressions()
+
+            body_lines = []
+            for i, (f_expr, r_expr) in enumerate(zip(f_rate_expressions, r_rate_expressions)):
+                # e.g. "net_rates[0] = kf[0]*p['CO_g']*theta['*_s'] - kr[0]*theta['CO_s']"
+                poly_expression = "net_rates[{}] = {} - {}".format(i,
+                                                                   f_expr.split(' = ')[-1],
+                                                                   r_expr.split(' = ')[-1])
+                for j, adsorbate_name in enumerate(adsorbate_names):
+                    derivation = self.poly_adsorbate_derivation(adsorbate_name=adsorbate_name,
+                                                                poly_expression=poly_expression)
+                    # Skip the entries which are always zero.
+                    if not re.search(r"k[fr]\[", derivation):
+                        continue
+                    body_lines.append("D[{}, {}] = {}".format(i, j, derivation))
+
+            self.__net_rate_derivatives_function = \
+                self._compile_function("net_rate_derivatives_function",
+                                       ["theta", "kf", "kr", "p", "c", "D"],
+                                       body_lines,
+                                       "D")
+            return self.__net_rate_derivatives_function
+        # }}}
+
+    def get_net_rate_derivatives(self, cvgs_tuple, relative_energies=None):
+        """
+        Function to get derivatives of net rates of all elementary reactions
+        wrt adsorbate coverages.
+
+        :param cvgs_tuple: Adsorbate coverages
+        :type cvgs_tuple: tuple of float
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :rtype relative_energies: dict
+
+        :return: R x N matrix, R is the number of reactions and N the number of adsorbates.
+        :rtype: mpmath.matrix or numpy.ndarray
+        """
         kf, kr = self.get_rate_constants(relative_energies=relative_energies)
 
-        # Pressure.
-        p = self._p
+        if self._vectorized:
+            drfs, drrs = self._vectorized_rate_derivatives(cvgs_tuple, kf, kr)
+            return drfs - drrs
 
-        # Concentration.
-        c = self._c
+        theta = self._cvg_tuple2dict(cvgs_tuple)
+        net_rate_derivatives_function = self.get_net_rate_derivatives_function()
+        D = self._matrix(self._rxns_num, len(cvgs_tuple))
 
-        # Generate Jacobian matrix.
-        J = self._matrix(m, n)
-        adsorbate_names = self._owner.adsorbate_names
+        return net_rate_derivatives_function(theta, kf, kr, self._p, self._c, D)
 
-        # Fill matrix.
-        for i in range(m):
-            poly_expression = dtheta_dt_expressions[i]
-            for j in range(n):
-                # Get adsorbate_name.
-                adsorbate_name = adsorbate_names[j]
-                # Fill the matrix
-                derivation = self.poly_adsorbate_derivation(adsorbate_name=adsorbate_name,
-                                                            poly_expression=poly_expression)
-                J[i, j] = eval(derivation)
-
-        # Return Jacobian matrix.
-        return J
+    def get_tof_sensitivities(self, cvgs_tuple, dlnkf, dlnkr, relative_energies=None):
+        """
+        Function to get derivatives of TOFs wrt a set of parameters at steady state
+        by linear response (implicit function theorem).
+
+        The steady state Jacobian is factorized only once and the coverage responses
+        to all parameters are obtained from a multi-right-hand-side solve:
+        :math:`d\\theta/dx = -J^{-1} \\partial f/\\partial x`.
+
+        :param cvgs_tuple: Steady state coverages
+        :type cvgs_tuple: tuple of float
+
+        :param dlnkf: Derivatives of logarithms of forward rate constants wrt
+                      parameters, R x P, R is the number of reactions and P the
+                      number of parameters
+        :type dlnkf: list of list of float
+
+        :param dlnkr: Derivatives of logarithms of reverse rate constants wrt parameters, R x P
+        :type dlnkr: list of list of float
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :return: G x P matrix, G is the number of gases in the order of gas names
+        :rtype: mpmath.matrix or numpy.ndarray
+        """
+        # {{{
+        nrxns = self._rxns_num
+        nparams = len(dlnkf[0])
+
+        rfs, rrs = self.get_rates(cvgs_tuple, relative_energies)
+        J = self.analytical_jacobian(cvgs_tuple, relative_energies)
+        D = self.get_net_rate_derivatives(cvgs_tuple, relative_energies)
+
+        # Net production of adsorbates and gases in elementary reactions.
+        _, _, adsorbate_stoichiometry, _, _ = self._get_vectorized_arrays()
+        _, reapro_matrix = self._owner.parser.get_stoichiometry_matrices()
+        gas_stoichiometry = -np.asarray(reapro_matrix)
+
+        # Explicit dependence of net rates on parameters.
+        N = [[rfs[i]*self._mpf(dlnkf[i][j]) - rrs[i]*self._mpf(dlnkr[i][j])
+              for j in range(nparams)] for i in range(nrxns)]
+
+        if self._vectorized:
+            N = np.array(N)
+            dtheta = np.linalg.solve(J, -adsorbate_stoichiometry.T.dot(N))
+            dnet = N + D.dot(dtheta)
+            return gas_stoichiometry.T.dot(dnet)
+
+        N = self._matrix(N)
+        B = -self._matrix(adsorbate_stoichiometry.T.tolist())*N
+
+        # Factorize once and solve for all right-hand sides.
+        LU, p = mp.mp.LU_decomp(J)
+        dtheta = self._matrix(J.rows, nparams)
+        for j in range(nparams):
+            column = mp.mp.U_solve(LU, mp.mp.L_solve(LU, B.column(j), p))
+            for i in range(J.rows):
+                dtheta[i, j] = column[i]
+
+        dnet = N + D*dtheta
+
+        return self._matrix(gas_stoichiometry.T.tolist())*dnet
+        # }}}
+
+    def batch_steady_state_function(self, cvgs, kfs, krs, pressures=None, jacobian=True):
+        """
+        Function to get dtheta/dt and analytical Jacobian matrices of a batch of
+        points in one vectorized float64 evaluation.
+
+        :param cvgs: adsorbate coverages of N points
+        :type cvgs: N x M array-like, M is the number of adsorbates
+
+        :param kfs: forward rate constants of N points or shared by all points
+        :type kfs: N x R or R array-like, R is the number of reactions
+
+        :param krs: reverse rate constants of N points or shared by all points
+        :type krs: N x R or R array-like
+
+        :param pressures: gas pressures in the order of gas names,
+            use pressures in model if not provided
+        :type pressures: N x G or G array-like, G is the number of gases
+
+        :param jacobian: return Jacobian matrices or not, default is True
+        :type jacobian: bool
+
+        :return: dtheta/dt (N x M array) and Jacobian matrices (N x M x M array)
+        :rtype: tuple of numpy.ndarray
+        """
+        # {{{
+        _, _, adsorbate_stoichiometry, _, _ = self._get_vectorized_arrays()
+        x = self._get_species_vectors(cvgs, pressures)
+
+        rfs, rrs = self._batch_rates(x, kfs, krs)
+        dtheta_dt = (rfs - rrs).dot(adsorbate_stoichiometry)
+
+        if not jacobian:
+            return dtheta_dt
+
+        drfs, drrs = self._batch_rate_derivatives(x, kfs, krs)
+        J = np.einsum('rm,nrk->nmk', adsorbate_stoichiometry, drfs - drrs)
+
+        return dtheta_dt, J
+        # }}}
+
+    def batch_steady_state_cvgs(self, c0, kfs, krs, pressures=None):
+        """
+        Function to solve steady state coverages of a batch of independent points.
+
+        Damped Newton iterations in float64 run for all points together,
+        converged and stalled points are masked out of following iterations.
+
+        :param c0: initial coverages of N points
+        :type c0: N x M array-like, M is the number of adsorbates
+
+        :param kfs: forward rate constants of N points or shared by all points
+        :type kfs: N x R or R array-like, R is the number of reactions
+
+        :param krs: reverse rate constants of N points or shared by all points
+        :type krs: N x R or R array-like
+
+        :param pressures: gas pressures in the order of gas names,
+            use pressures in model if not provided
+        :type pressures: N x G or G array-like, G is the number of gases
+
+        :return: coverages (N x M array), converged flags (N array of bool)
+            and norms of dtheta/dt (N array)
+        :rtype: tuple of numpy.ndarray
+        """
+        # {{{
+        tolerance = self._owner.tolerance
+        max_iterations = self._owner.max_rootfinding_iterations
+
+        cvgs = np.array(c0, dtype=np.float64)
+        npoints = cvgs.shape[0]
+        kfs = np.broadcast_to(np.array(kfs, dtype=np.float64), (npoints, self._rxns_num))
+        krs = np.broadcast_to(np.array(krs, dtype=np.float64), (npoints, self._rxns_num))
+        if pressures is not None:
+            pressures = np.broadcast_to(np.array(pressures, dtype=np.float64),
+                                        (npoints, len(self._owner.gas_names)))
+
+        def evaluate(idx, x, jacobian):
+            p = None if pressures is None else pressures[idx]
+            return self.batch_steady_state_function(x, kfs[idx], krs[idx], p, jacobian)
+
+        errors = np.linalg.norm(evaluate(slice(None), cvgs, False), axis=1)
+        stalled = np.zeros(npoints, dtype=bool)
+
+        # Points with negative coverages are not regarded as converged.
+        unconverged = lambda: (errors > tolerance) | np.any(cvgs < 0.0, axis=1)
+        active = unconverged()
+
+        iterations = 0
+        while active.any() and iterations < max_iterations:
+            iterations += 1
+            idx = np.flatnonzero(active)
+            fx, J = evaluate(idx, cvgs[idx], True)
+            steps = self.__batch_solve(J, -fx)
+
+            # Halve step sizes of the points whose residuals do not decrease.
+            l = np.ones(len(idx))
+            pending = np.all(np.isfinite(steps), axis=1)
+            stalled[idx[~pending]] = True
+
+            while pending.any():
+                k = np.flatnonzero(pending)
+                x1 = cvgs[idx[k]] + l[k, np.newaxis]*steps[k]
+                with np.errstate(all='ignore'):
+                    errors1 = np.linalg.norm(evaluate(idx[k], x1, False), axis=1)
+                accepted = errors1 < errors[idx[k]]
+
+                cvgs[idx[k[accepted]]] = x1[accepted]
+                errors[idx[k[accepted]]] = errors1[accepted]
+                pending[k[accepted]] = False
+
+                l[k[~accepted]] /= 2
+                # Double precision limit reached.
+                too_small = pending & (l < 1e-10)
+                stalled[idx[too_small]] = True
+                pending &= ~too_small
+
+            active = unconverged() & ~stalled
+
+        converged = ~unconverged()
+
+        if self._owner.log_allowed:
+            self.__logger.info('Batch Newton iterations: %d, %d of %d points converged',
+                               iterations, np.count_nonzero(converged), npoints)
+
+        return cvgs, converged, errors
+        # }}}
+
+    @staticmethod
+    def __batch_solve(A, b):
+        """
+        Private helper function to solve a stack of linear systems,
+        solutions of singular systems are filled with nan.
+        """
+        try:
+            return np.linalg.solve(A, b[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            x = np.full(b.shape, np.nan)
+            for i, (Ai, bi) in enumerate(zip(A, b)):
+                try:
+                    x[i] = np.linalg.solve(Ai, bi)
+                except np.linalg.LinAlgError:
+                    pass
+            return x
+
+    def __get_log_balance_arrays(self):
+        """
+        Private helper function to get the coefficient arrays for the log coverage
+        formulation: production and consumption weights of adsorbates, the reaction
+        orders of the unknowns and the site balance membership.
+        """
+        # {{{
+        try:
+            return self.__log_balance_arrays
+        except AttributeError:
+            (forward_orders, reverse_orders,
+             adsorbate_stoichiometry, site_matrix, _) = self._get_vectorized_arrays()
+            nsites, nads = site_matrix.shape
+
+            # Columns are forward rates followed by reverse rates.
+            produced = np.maximum(adsorbate_stoichiometry, 0.0).T
+            consumed = np.maximum(-adsorbate_stoichiometry, 0.0).T
+            production_weights = np.hstack([produced, consumed])
+            consumption_weights = np.hstack([consumed, produced])
+
+            # Reaction orders of log adsorbate and free site coverages.
+            orders = np.vstack([forward_orders, reverse_orders])[:, :nads+nsites]
+
+            # Adsorbates and free site on each type of site.
+            site_members = np.hstack([site_matrix, np.eye(nsites)])
+
+            # Weights are added in log space, -inf for absent terms.
+            with np.errstate(divide='ignore'):
+                self.__log_balance_arrays = tuple([np.log(weights) for weights in
+                                                   [production_weights, consumption_weights]] +
+                                                  [orders, np.log(site_members)])
+
+            return self.__log_balance_arrays
+        # }}}
+
+    def __get_log_rate_constants(self, relative_energies=None):
+        """
+        Private helper function to get logarithms of rate constants in float64.
+        """
+        # NOTE: use mpmath to avoid underflow of tiny rate constants.
+        kf, kr = self.get_rate_constants(relative_energies=relative_energies)
+        log_kf = np.array([float(mp.log(k)) for k in kf])
+        log_kr = np.array([float(mp.log(k)) for k in kr])
+
+        return log_kf, log_kr
+
+    def __log_balance(self, log_cvgs, log_kf, log_kr, jacobian=False):
+        """
+        Private helper function to calculate residuals and Jacobian matrix of the
+        log coverage formulation.
+        """
+        # {{{
+        (log_production_weights, log_consumption_weights,
+         orders, log_site_members) = self.__get_log_balance_arrays()
+        site_totals = self._get_vectorized_arrays()[-1]
+
+        lrfs, lrrs = self._vectorized_log_rates(log_cvgs, log_kf, log_kr)
+        log_rates = np.concatenate([lrfs, lrrs])
+
+        # NOTE: non-finite values for unphysical trial points are
+        #       rejected by the line search in iterations.
+        with np.errstate(all='ignore'):
+            # Terms of production and consumption rates of adsorbates, terms of site sums.
+            production_terms = log_rates + log_production_weights
+            consumption_terms = log_rates + log_consumption_weights
+            site_terms = log_cvgs + log_site_members
+
+            log_production = logsumexp(production_terms, axis=1)
+            log_consumption = logsumexp(consumption_terms, axis=1)
+            log_sums = logsumexp(site_terms, axis=1)
+
+            residuals = np.concatenate([log_production - log_consumption,
+                                        log_sums - np.log(site_totals)])
+
+            if not jacobian:
+                return residuals
+
+            # Derivatives of logsumexp are the softmax weights.
+            production_softmax = np.exp(production_terms - log_production[:, np.newaxis])
+            consumption_softmax = np.exp(consumption_terms - log_consumption[:, np.newaxis])
+            site_softmax = np.exp(site_terms - log_sums[:, np.newaxis])
+
+        J = np.vstack([(production_softmax - consumption_softmax).dot(orders), site_softmax])
+
+        return residuals, J
         # }}}
 
+    def log_steady_state_function(self, log_cvgs, relative_energies=None):
+        """
+        Function to get residuals of steady state equations in log coverages.
+
+        The residual of an adsorbate is the logarithm of the ratio between its
+        production and consumption rates, followed by the site balance
+        residuals of all types of sites.
+
+        :param log_cvgs: logarithms of adsorbate and free site coverages,
+            in the order of :obj:`adsorbate_names + site_names`
+        :type log_cvgs: list of float
+
+        :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
+        :type relative_energies: dict
+
+        :return: residuals
+        :rtype: numpy.ndarray
+        """
+        log_kf, log_kr = self.__get_log_rate_constants(relative_energies)
+        return self.__log_balance(np.array(log_cvgs, dtype=np.float64), log_kf, log_kr)
+
+    def log_analytical_jacobian(self, log_cvgs, relative_energies=None):
+        """
+        Function to get analytical Jacobian matrix of steady state equations in log coverages.
+
+        :param log_cvgs: logarithms of adsorbate and free site coverages,
+            in the order of :obj:`adsorbate_names + site_names`
+        :type log_cvgs: list of float
+
+        :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
+        :type relative_energies: dict
+
+        :return: N x N Jacobian matrix, N is the number of adsorbates and sites
+        :rtype: numpy.ndarray
+        """
+        log_kf, log_kr = self.__get_log_rate_constants(relative_energies)
+        _, J = self.__log_balance(np.array(log_cvgs, dtype=np.float64),
+                                  log_kf, log_kr, jacobian=True)
+        return J
+
     ######################################################
     ######                                          ######
     ###### calculate micro kinetic model with Sympy ######
@@ -521,8 +1075,9 @@ class SteadyStateSolver(MeanFieldSolver):
             raise ParameterError(msg)
 
         # Get formula list.
-        rxn_equation = RxnEquation(rxn_expression)
-        elementary_rxn_list = rxn_equation.to_formula_list()
+        reaction_network = self._owner.reaction_network
+        idx = reaction_network.get_rxn_index(rxn_expression)
+        elementary_rxn_list = reaction_network.elementary_rxns_list[idx]
 
         for state_list in elementary_rxn_list:
             for formula in state_list:
@@ -755,102 +1310,462 @@ class SteadyStateSolver(MeanFieldSolver):
         '''
         return self.coarse_steady_state_cvgs(c0, relative_energies)
 
-    def get_steady_state_cvgs(self, c0=None, single_pt=False, relative_energies=None):
-        """ Function to get steady state coverages.
+    def log_steady_state_cvgs(self, c0, relative_energies=None):
+        """ Solve steady state coverages in log coverages with float64.
 
-        Expect an inital coverages tuple, use Newton Method to solving nonlinear equations, return steady state coverages, if converged.
+        Coverages spanning many orders of magnitude are well scaled in log space,
+        free sites are extra unknowns constrained by site balances. Damped Newton
+        iterations run until the residual stops decreasing.
 
         :param c0: initial coverages
         :type c0: tuple of float
 
-        :param single_pt : if True, no initial guess check will be done
-        :type single_pt: bool
-
         :param relative_energies: Relative eneriges of elementary reactions.
         :type relative_energies: dict
 
         .. note::
             keys ":obj:`Gaf` and ":obj:`Gar` must be in relative energies dict
 
+        .. note::
+            The log formulation is not defined if an adsorbate is not produced or
+            not consumed by any elementary reaction, the initial coverages are
+            returned with an infinite residual in this case.
+
+        :return: coverages and the max residual in log space
+        :rtype: tuple of float, float
         """
         # {{{
-        if c0 is None:
-            c0 = self._owner.hybrid_method(self._owner, 0)
-        # Intial coverage must have physical meaning.
-        c0 = self.__constrain_coverages(c0)
-        self.__initial_guess = c0
+        nads = len(self._owner.adsorbate_names)
+        max_iterations = self._owner.max_rootfinding_iterations
+
+        # Guard against log(0) of rates for one-way adsorbates.
+        log_production_weights, log_consumption_weights = self.__get_log_balance_arrays()[:2]
+        one_way = (np.all(np.isneginf(log_production_weights), axis=1) |
+                   np.all(np.isneginf(log_consumption_weights), axis=1))
+        if np.any(one_way):
+            names = [name for name, skip in zip(self._owner.adsorbate_names, one_way) if skip]
+            msg = "Log coverages are not defined for {}, skip log coverage solving."
+            self.__logger.warning(msg.format(", ".join(names)))
+            return tuple([self._mpf(c) for c in c0]), float("inf")
+
+        log_kf, log_kr = self.__get_log_rate_constants(relative_energies)
+        G = lambda z: self.__log_balance(z, log_kf, log_kr)
+
+        # Start point including free sites.
+        x = self._get_species_vector(c0)[: nads+len(self._owner.site_names)]
+        z = np.log(np.maximum(x, np.finfo(np.float64).tiny))
+        gz = G(z)
+        gnorm = np.linalg.norm(gz)
+
+        iterations = 0
+        while gnorm > 0.0 and iterations < max_iterations:
+            _, J = self.__log_balance(z, log_kf, log_kr, jacobian=True)
+            try:
+                step = np.linalg.solve(J, -gz)
+            except np.linalg.LinAlgError:
+                break
 
-        # Start root finding algorithm.
-        f = lambda x: self.steady_state_function(x, relative_energies=relative_energies)
-        f_resid = lambda x: self.get_residual(x, relative_energies=relative_energies)
-        constraint = self.__constrain_coverages
-        J = lambda x: self.analytical_jacobian(x, relative_energies=relative_energies)
+            # Halve the step size until the residual decreases.
+            l, stalled = 1.0, True
+            while l > 1e-10:
+                z1 = z + l*step
+                gz1 = G(z1)
+                if np.linalg.norm(gz1) < gnorm:
+                    stalled = False
+                    break
+                l /= 2
 
-        ############    Main Loop with changed initial guess   ##############
-        if self._owner.log_allowed:
-            self.__logger.info('Entering main loop...')
-        icvg_counter = 1  # initial coverage counter, outer
-        cancel = False
+            # Double precision limit reached.
+            if stalled:
+                break
 
-        converged = False  # Flag for convergence.
-        while not cancel:  # outer loop
-            try:
-            # {{{
-                # Good initial coverages.
-                if f_resid(c0) <= self._owner.tolerance and not single_pt:
-                    converged = True
-                    self._coverages = c0
-                    if self._owner.log_allowed:
-                        self.__logger.info('Good initial guess: \n%s', str([float(i) for i in c0]))
+            iterations += 1
+            z, gz, gnorm = z1, gz1, np.linalg.norm(gz1)
 
-                    # log steady state coverages
-                    self.__log_sscvg(c0, self._owner.adsorbate_names)
+        cvgs = tuple([self._mpf(cvg) for cvg in np.exp(z[:nads]).tolist()])
+        error = float(np.max(np.abs(gz)))
 
-                    # Get error.
-                    fx = self.steady_state_function(c0, relative_energies)  # dtheta/dts
-                    norm = self._norm(fx)
-                    resid = self.get_residual(c0)
-                    error = min(norm, resid)
-                    self._error = error
-                    if self._owner.log_allowed:
-                        self.__logger.info('error = %e', error)
-                    break
+        if self._owner.log_allowed:
+            self.__logger.info('Log coverage iterations: %d, max log residual: %e',
+                               iterations, error)
 
-                # Instantiate rootfinding iterator
-                # ConstrainedNewton iterator
-                if self._owner.rootfinding == 'ConstrainedNewton':
-                    iterator_parameters = dict(J=J,
-                                               constraint=constraint,
-                                               norm=self._norm,
-                                               mpfloat=self._mpf,
-                                               matrix=self._matrix,
-                                               Axb_solver=self._Axb_solver)
-                    newton_iterator = ConstrainedNewton(f, c0, **iterator_parameters)
-                # MDNewton iterator
-                elif self._owner.rootfinding == 'MDNewton':
-                    iterator_parameters = dict(J=J, verbose=False)
-                    newton_iterator = MDNewton(f, c0, **iterator_parameters)
-                else:
-                    msg='Unrecognized rootfinding iterator name [{}]'.format(self._owner.rootfinding)
-                    raise ParameterError(msg)
+        return cvgs, error
+        # }}}
 
-                if self._owner.log_allowed:
-                    msg = "{} Iterator instantiation - success!".format(self._owner.rootfinding)
-                    self.__logger.info(msg)
+    def mixed_precision_steady_state_cvgs(self, c0, relative_energies=None):
+        """ Solve steady state coverages with mixed precision.
 
-                x = c0
-                old_error = 1e99
-                if c0:
-                    # log initial guess
-                    if self._owner.log_allowed:
-                        self.__logger.info('initial guess coverage - success')
-                        self.__logger.debug(str([float(c) for c in c0]))
+        Damped Newton iterations run in float64 until the tolerance is reached or
+        the residual stops decreasing. The float64 root is then polished at the
+        mpmath precision by iterative refinement: residuals are evaluated in
+        mpmath while corrections reuse the last float64 LU factorization. A full
+        precision Newton step is taken only when the refinement contracts too slowly.
 
-                #####    Sub LOOP for a c0    #####
+        :param c0: initial coverages
+        :type c0: tuple of float
 
-                nt_counter = 0    # newton loop counter, inner
-                if self._owner.log_allowed:
-                    self.__logger.info('entering Newton Iteration( %d )...', icvg_counter)
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        .. note::
+            keys ":obj:`Gaf` and ":obj:`Gar` must be in relative energies dict
+
+        :return: converged coverages, None if not converged
+        :rtype: tuple of float
+        """
+        # {{{
+        tolerance = self._owner.tolerance
+        max_iterations = self._owner.max_rootfinding_iterations
+
+        # Rate constants in both precisions.
+        kf, kr = self.get_rate_constants(relative_energies=relative_energies)
+        kf_float, kr_float = [float(k) for k in kf], [float(k) for k in kr]
+
+        f_float = lambda x: self._vectorized_dtheta_dt(x, kf_float, kr_float)
+
+        # Solver function of the float64 LU factorization.
+        if self._owner.sparse_jacobian:
+            def factorize(x):
+                try:
+                    return splu(self._sparse_jacobian(x, kf_float, kr_float)).solve
+                except RuntimeError:
+                    # Singular matrix gives non-finite steps as dense LU.
+                    return lambda b: np.full(len(b), np.nan)
+        else:
+            def factorize(x):
+                lu = lu_factor(self._vectorized_jacobian(x, kf_float, kr_float),
+                               check_finite=False)
+                return lambda b: lu_solve(lu, b, check_finite=False)
+
+        # Damped Newton iterations in float64.
+        x = np.array([float(c) for c in c0])
+        fx = f_float(x)
+        fxnorm = np.linalg.norm(fx)
+        lu = factorize(x)
+        float_iterations = 0
+
+        while fxnorm > tolerance and float_iterations < max_iterations:
+            step = lu(-fx)
+            if not np.all(np.isfinite(step)):
+                break
+
+            # Halve the step size until the residual decreases.
+            l, stalled = 1.0, True
+            while l > 1e-10:
+                x1 = x + l*step
+                fx1 = f_float(x1)
+                if np.linalg.norm(fx1) < fxnorm:
+                    stalled = False
+                    break
+                l /= 2
+
+            # Double precision limit reached.
+            if stalled:
+                break
+
+            float_iterations += 1
+            x, fx, fxnorm = x1, fx1, np.linalg.norm(fx1)
+            lu = factorize(x)
+
+        # Iterative refinement with mpmath.
+        mp_iterations = 0
+
+        if self._vectorized:
+            # No higher precision in numpy representation.
+            x, error = tuple(x.tolist()), fxnorm
+        else:
+            f = lambda x: self._matrix(self.steady_state_function(tuple(x), relative_energies))
+
+            x = self._matrix([self._mpf(c) for c in x.tolist()])
+            fx = f(x)
+            fxnorm = self._norm(fx)
+
+            while fxnorm > tolerance and mp_iterations < max_iterations:
+                mp_iterations += 1
+
+                # Correction with the float64 factorization.
+                correction = lu(np.array([-float(i) for i in fx]))
+                x1 = x + self._matrix([self._mpf(i) for i in correction.tolist()])
+                fx1 = f(x1)
+                fx1norm = self._norm(fx1)
+
+                # Full precision Newton step if refinement does not work well.
+                if not fx1norm < fxnorm/2:
+                    J = self.analytical_jacobian(tuple(x), relative_energies)
+                    x1 = x + self._Axb_solver(J, -fx)
+                    fx1 = f(x1)
+                    fx1norm = self._norm(fx1)
+                    if not fx1norm < fxnorm:
+                        break
+
+                x, fx, fxnorm = x1, fx1, fx1norm
+
+            x, error = tuple(x), fxnorm
+
+        self._precision_iterations = {"float64": float_iterations, "mpmath": mp_iterations}
+
+        if self._owner.log_allowed:
+            self.__logger.info("Mixed precision iterations: float64 %d, mpmath %d",
+                               float_iterations, mp_iterations)
+
+        # Check convergence.
+        if error > tolerance or self.get_residual(x, relative_energies) > tolerance:
+            return None
+
+        if any([cvg < 0.0 for cvg in x]):
+            if self._owner.log_allowed:
+                self.__logger.warning('bad root: %s', str([float(i) for i in x]))
+            return None
+
+        self._coverages = x
+        self._error = error
+
+        return x
+        # }}}
+
+    def _get_cached_steady_state(self, relative_energies=None):
+        """
+        Protected function to load the steady state of current reaction conditions
+        from the cache of model, the coverages and error of solver are updated if found.
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :return: Cached coverages, error and TOFs in strings, None if not cached
+        :rtype: dict
+        """
+        cache = self._owner.steady_state_cache
+        if cache is None:
+            return None
+
+        cached = cache.get(cache.get_key(self._owner, relative_energies))
+        if cached is not None:
+            self._coverages = tuple([self._mpf(c) for c in cached["coverages"]])
+            self._error = self._mpf(cached["error"])
+
+        return cached
+
+    def _cache_steady_state(self, relative_energies=None, tofs=None):
+        """
+        Protected function to store current steady state coverages and error
+        of solver to the cache of model.
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :param tofs: TOFs of gases, optional
+        :type tofs: list of float
+        """
+        cache = self._owner.steady_state_cache
+        if cache is not None:
+            point = self._owner.warm_start_index.get_point(self._owner, relative_energies)
+            cache.put(cache.get_key(self._owner, relative_energies),
+                      self._coverages, self._error, tofs, conditions=point)
+
+    def _get_warm_start_cvgs(self, relative_energies=None):
+        """
+        Protected function to get initial coverages from the steady states of
+        the closest solved reaction conditions.
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :return: Initial coverages, None if warm start is disabled or no
+                 reaction conditions solved
+        :rtype: tuple of float
+        """
+        neighbors = self._owner.warm_start_neighbors
+        if neighbors < 1:
+            return None
+
+        index = self._owner.warm_start_index
+        point = index.get_point(self._owner, relative_energies)
+        c0 = index.get_initial_guess(point, k=neighbors)
+        if c0 is None:
+            return None
+        return tuple([self._mpf(c) for c in c0])
+
+    def __get_rootfinding_iterator(self, f, c0, J, constraint):
+        """
+        Private helper function to instantiate the rootfinding iterator of the model.
+
+        :param f: Steady state function
+        :type f: function
+
+        :param c0: Initial coverages
+        :type c0: tuple of float
+
+        :param J: Jacobian matrix function
+        :type J: function
+
+        :param constraint: Coverages constraint function
+        :type constraint: function
+
+        :return: The rootfinding iterator
+        :rtype: :obj:`RootfindingIterator`
+        """
+        # ConstrainedNewton iterator
+        if self._owner.rootfinding == 'ConstrainedNewton':
+            iterator_parameters = dict(J=J,
+                                       constraint=constraint,
+                                       norm=self._norm,
+                                       mpfloat=self._mpf,
+                                       matrix=self._matrix,
+                                       Axb_solver=self._Axb_solver)
+            return ConstrainedNewton(f, c0, **iterator_parameters)
+        # MDNewton iterator
+        elif self._owner.rootfinding == 'MDNewton':
+            iterator_parameters = dict(J=J,
+                                       verbose=False,
+                                       norm=self._norm,
+                                       mpfloat=self._mpf,
+                                       matrix=self._matrix,
+                                       Axb_solver=self._Axb_solver)
+            return MDNewton(f, c0, **iterator_parameters)
+        # Broyden iterator
+        elif self._owner.rootfinding == 'Broyden':
+            iterator_parameters = dict(J=J,
+                                       norm=self._norm,
+                                       mpfloat=self._mpf,
+                                       matrix=self._matrix,
+                                       factorize=self._lu_factorize)
+            return Broyden(f, c0, **iterator_parameters)
+        # Trust region Newton iterator
+        elif self._owner.rootfinding == 'TrustRegionNewton':
+            iterator_parameters = dict(J=J,
+                                       constraint=constraint,
+                                       norm=self._norm,
+                                       mpfloat=self._mpf,
+                                       matrix=self._matrix,
+                                       Axb_solver=self._Axb_solver)
+            return TrustRegionNewton(f, c0, **iterator_parameters)
+        else:
+            msg='Unrecognized rootfinding iterator name [{}]'.format(self._owner.rootfinding)
+            raise ParameterError(msg)
+
+    def get_steady_state_cvgs(self, c0=None, single_pt=False, relative_energies=None):
+        """ Function to get steady state coverages.
+
+        Expect an inital coverages tuple, use Newton Method to solving nonlinear equations, return steady state coverages, if converged.
+
+        :param c0: initial coverages
+        :type c0: tuple of float
+
+        :param single_pt : if True, no initial guess check will be done
+        :type single_pt: bool
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        .. note::
+            keys ":obj:`Gaf` and ":obj:`Gar` must be in relative energies dict
+
+        """
+        # {{{
+        # Converged steady state in cache.
+        if self._get_cached_steady_state(relative_energies) is not None:
+            if self._owner.log_allowed:
+                self.__logger.info('Steady state coverages found in cache.')
+                self.__log_sscvg(self._coverages, self._owner.adsorbate_names)
+            return self._coverages
+
+        # Start from the closest solved reaction conditions if possible.
+        if c0 is None:
+            c0 = self._get_warm_start_cvgs(relative_energies)
+            if c0 is not None and self._owner.log_allowed:
+                self.__logger.info('Use coverages of the closest solved conditions as initial guess.')
+        if c0 is None:
+            c0 = self._owner.hybrid_method(self._owner, 0)
+        # Intial coverage must have physical meaning.
+        c0 = self.__constrain_coverages(c0)
+        self.__initial_guess = c0
+
+        # Start root finding algorithm.
+        f = lambda x: self.steady_state_function(x, relative_energies=relative_energies)
+        f_resid = lambda x: self.get_residual(x, relative_energies=relative_energies)
+        constraint = self.__constrain_coverages
+        J = self.__get_newton_jacobian(relative_energies)
+
+        ############    Main Loop with changed initial guess   ##############
+        if self._owner.log_allowed:
+            self.__logger.info('Entering main loop...')
+        icvg_counter = 1  # initial coverage counter, outer
+        cancel = False
+
+        converged = False  # Flag for convergence.
+
+        # Solve in log coverages, the root is accepted directly only in float64,
+        # otherwise it is used as initial guess for polishing.
+        # NOTE: the log residual is a relative measure, the root is accepted
+        #       by the residual of the original steady state equations.
+        if self._owner.log_coverage:
+            log_cvgs, _ = self.log_steady_state_cvgs(c0, relative_energies)
+            error = f_resid(log_cvgs) if self._vectorized else None
+            if error is not None and error <= self._owner.tolerance:
+                self._coverages, self._error = log_cvgs, error
+                # log steady state coverages
+                self.__log_sscvg(self._coverages, self._owner.adsorbate_names)
+                cancel = True
+                converged = True
+            else:
+                c0 = log_cvgs
+
+        # Converge in float64 and polish in high precision first.
+        if self._owner.mixed_precision and not converged:
+            if self._owner.log_allowed:
+                self.__logger.info('Mixed precision solving...')
+
+            if self.mixed_precision_steady_state_cvgs(c0, relative_energies) is not None:
+                # log steady state coverages
+                self.__log_sscvg(self._coverages, self._owner.adsorbate_names)
+                if self._owner.log_allowed:
+                    self.__logger.info('error = %e', self._error)
+                cancel = True
+                converged = True
+
+        while not cancel:  # outer loop
+            try:
+            # {{{
+                # Good initial coverages.
+                if f_resid(c0) <= self._owner.tolerance and not single_pt:
+                    converged = True
+                    self._coverages = c0
+                    if self._owner.log_allowed:
+                        self.__logger.info('Good initial guess: \n%s', str([float(i) for i in c0]))
+
+                    # log steady state coverages
+                    self.__log_sscvg(c0, self._owner.adsorbate_names)
+
+                    # Get error.
+                    fx = self.steady_state_function(c0, relative_energies)  # dtheta/dts
+                    norm = self._norm(fx)
+                    resid = self.get_residual(c0)
+                    error = min(norm, resid)
+                    self._error = error
+                    if self._owner.log_allowed:
+                        self.__logger.info('error = %e', error)
+                    break
+
+                # Instantiate rootfinding iterator
+                newton_iterator = self.__get_rootfinding_iterator(f, c0, J, constraint)
+
+                if self._owner.log_allowed:
+                    msg = "{} Iterator instantiation - success!".format(self._owner.rootfinding)
+                    self.__logger.info(msg)
+
+                x = c0
+                old_error = 1e99
+                if c0:
+                    # log initial guess
+                    if self._owner.log_allowed:
+                        self.__logger.info('initial guess coverage - success')
+                        self.__logger.debug(str([float(c) for c in c0]))
+
+                #####    Sub LOOP for a c0    #####
+
+                nt_counter = 0    # newton loop counter, inner
+                if self._owner.log_allowed:
+                    self.__logger.info('entering Newton Iteration( %d )...', icvg_counter)
                     # log title
                     self.__logger.info('  %-10s   %5s  %18s  %18s',
                                        'status', 'N', 'residual', 'norm')
@@ -961,6 +1876,9 @@ class SteadyStateSolver(MeanFieldSolver):
             # Archive converged root and error.
             self.archive_data('steady_state_coverages', self._coverages)
             self.archive_data('steady_state_error', self._error)
+            self._cache_steady_state(relative_energies)
+            point = self._owner.warm_start_index.get_point(self._owner, relative_energies)
+            self._owner.warm_start_index.add(point, self._coverages)
             self._good_guess = c0
 
             # Archive initial guess.
@@ -969,6 +1887,603 @@ class SteadyStateSolver(MeanFieldSolver):
             return self._coverages
     # }}}
 
+    def get_initial_guesses(self, n, c0=None, relative_energies=None, seed=None):
+        """
+        Function to generate candidate initial coverages for multi-start root finding.
+
+        The candidates are the given initial coverages, Boltzmann coverages (if
+        absolute energies are available), snapshots of an ODE integration at
+        logarithmically increasing times and random points uniformly distributed
+        on the coverage simplex of each site.
+
+        :param n: Number of candidates
+        :type n: int
+
+        :param c0: Initial coverages put in front of the candidates, optional
+        :type c0: tuple of float
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :param seed: Seed for random simplex points, optional
+        :type seed: int
+
+        :return: Candidate initial coverages
+        :rtype: list of tuple of float
+        """
+        # {{{
+        adsorbate_names = self._owner.adsorbate_names
+        species_definitions = self._owner.species_definitions
+        candidates = []
+
+        if c0 is not None:
+            candidates.append(tuple(c0))
+
+        # Boltzmann coverages.
+        if len(candidates) < n:
+            try:
+                candidates.append(tuple(self.boltzmann_coverages()))
+            except IOError:
+                pass
+
+        # Snapshots of ODE integration from clean surface at t = 1e-4, 1e-2, 1.
+        for time_end in (1e-4, 1e-2, 1.0):
+            if len(candidates) >= n:
+                break
+            _, cvgs = self.integrate_to_steady_state(initial_cvgs=[0.0]*len(adsorbate_names),
+                                                     time_end=time_end,
+                                                     relative_energies=relative_energies)
+            candidates.append(tuple(cvgs))
+
+        # Random points on coverage simplex of each site (free site included).
+        rand = random.Random(seed)
+        while len(candidates) < n:
+            cvgs_dict = {}
+            for site_name in self._owner.site_names:
+                total = species_definitions[site_name]['total']
+                adsorbates = self._classified_adsorbates[site_name]
+                weights = [rand.expovariate(1.0) for i in range(len(adsorbates) + 1)]
+                for adsorbate_name, w in zip(adsorbates, weights):
+                    cvgs_dict[adsorbate_name] = self._mpf(total*w/sum(weights))
+            candidates.append(self._cvg_dict2tuple(cvgs_dict))
+
+        return [self.__constrain_coverages(c) for c in candidates[:n]]
+        # }}}
+
+    def _get_single_start_root(self, c0, relative_energies=None, deflated_roots=None,
+                               power=2, shift=1e4):
+        """
+        Protected function to run the rootfinding iterator from a single initial
+        guess without changing the guess on failure.
+
+        :param c0: Initial coverages
+        :type c0: tuple of float
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :param deflated_roots: Known roots deflated from the steady state function, optional
+        :type deflated_roots: list of tuple of float
+
+        :param power: Power of the deflation operator, default is 2
+        :type power: int
+
+        :param shift: Shift of the deflation operator, default is 1e4
+        :type shift: float
+
+        :return: Physically valid root and its error, None if not converged
+        :rtype: tuple
+        """
+        # {{{
+        f = lambda x: self.steady_state_function(x, relative_energies=relative_energies)
+        tolerance = self._owner.tolerance
+
+        if deflated_roots:
+            # The deflated Jacobian is dense.
+            J = lambda x: self.analytical_jacobian(x, relative_energies=relative_energies)
+            deflated_f, deflated_J = self.__deflate(f, J, deflated_roots, power, shift)
+        else:
+            deflated_f, deflated_J = f, self.__get_newton_jacobian(relative_energies)
+
+        try:
+            newton_iterator = self.__get_rootfinding_iterator(deflated_f, c0, deflated_J,
+                                                              self.__constrain_coverages)
+            for nt_counter, (x, error, fx) in enumerate(newton_iterator):
+                if nt_counter >= self._owner.max_rootfinding_iterations:
+                    break
+                # Converged to a root of the undeflated function.
+                if deflated_roots:
+                    error = self._norm(self._matrix(list(f(x))))
+                if (error < tolerance and
+                        self.get_residual(x, relative_energies=relative_energies) < tolerance):
+                    if all([cvg >= 0.0 for cvg in x]):
+                        return x, error
+                    break
+        except (ZeroDivisionError, ValueError):
+            pass
+
+        return None
+        # }}}
+
+    def __deflate(self, f, J, roots, power, shift):
+        """
+        Private helper function to get the deflated steady state function
+        G(x) = M(x)*f(x) and its Jacobian, where M(x) = prod(1/||x - r||^p + shift)
+        for all known roots r.
+        """
+        # {{{
+        def M(x):
+            """ Deflation operator and its gradient. """
+            m, dm = 1, [0]*len(x)
+            for root in roots:
+                d = [a - b for a, b in zip(x, root)]
+                n2 = sum([di*di for di in d])
+                mi = n2**(-power/2.0) + shift
+                coeff = -power*n2**(-power/2.0 - 1)/mi
+                m *= mi
+                dm = [a + coeff*di for a, di in zip(dm, d)]
+            return m, [m*i for i in dm]
+
+        def deflated_f(x):
+            m, _ = M(x)
+            return [m*fi for fi in f(x)]
+
+        def deflated_J(x):
+            m, dm = M(x)
+            fx, Jx = list(f(x)), J(x)
+            n = len(x)
+            return self._matrix([[m*Jx[i, j] + fx[i]*dm[j] for j in range(n)]
+                                 for i in range(len(fx))])
+
+        return deflated_f, deflated_J
+        # }}}
+
+    def get_multiple_steady_state_cvgs(self, c0s=None, n_starts=8, max_roots=None,
+                                       relative_energies=None, **kwargs):
+        """
+        Function to enumerate multiple steady states using deflated Newton's method.
+        Once a root is found, it is deflated from the steady state function and the
+        Newton's iterations from the same initial guess are run again, so the known
+        roots would not be converged to again.
+
+        :param c0s: Initial coverages to start from, default is generated by
+                    :obj:`get_initial_guesses`
+        :type c0s: list of tuple of float
+
+        :param n_starts: Number of generated initial guesses, default is 8
+        :type n_starts: int
+
+        :param max_roots: Max number of steady states, default is no limit
+        :type max_roots: int
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        kwargs could contain:
+
+        :param power: Power of the deflation operator, default is 2
+        :type power: int
+
+        :param shift: Shift of the deflation operator, default is 1e4
+        :type shift: float
+
+        :param seed: Seed for random initial guesses, optional
+        :type seed: int
+
+        .. note::
+            The deflation operator is M(x) = prod(1/||x - r||^power + shift), the default
+            shift localizes the deflation within about 1e-2 of known roots, so that basins
+            of other roots close to them are kept.
+
+        :return: steady state coverages, errors and stability flags (all real parts of
+                 Jacobian eigenvalues are negative) in dict with keys 'coverages',
+                 'errors' and 'stable'
+        :rtype: dict
+        """
+        # {{{
+        power = kwargs.pop("power", 2)
+        shift = kwargs.pop("shift", 1e4)
+        seed = kwargs.pop("seed", None)
+
+        if kwargs:
+            for key in kwargs:
+                msg = "Found redundant keyword argument: {}".format(key)
+                self.__logger.warning(msg)
+
+        if c0s is None:
+            c0s = self.get_initial_guesses(n_starts, relative_energies=relative_energies,
+                                           seed=seed)
+
+        roots, errors = [], []
+        for c0 in c0s:
+            if max_roots is not None and len(roots) >= max_roots:
+                break
+            while max_roots is None or len(roots) < max_roots:
+                ret = self._get_single_start_root(c0, relative_energies,
+                                                  deflated_roots=roots,
+                                                  power=power, shift=shift)
+                if ret is None:
+                    break
+                root, error = ret
+                # Known root could be reached again when deflation is not strong enough.
+                if any([max([abs(a - b) for a, b in zip(root, r)]) < 1e-6 for r in roots]):
+                    break
+                roots.append(root)
+                errors.append(error)
+
+        # Stability from Jacobian eigenvalues.
+        stable = []
+        for root in roots:
+            Jx = self.analytical_jacobian(root, relative_energies=relative_energies)
+            n = len(root)
+            Jx = np.array([[float(Jx[i, j]) for j in range(n)] for i in range(n)])
+            stable.append(bool(np.all(np.linalg.eigvals(Jx).real < 0.0)))
+
+        if self._owner.log_allowed:
+            self.__logger.info("{} steady states found.".format(len(roots)))
+            for root, is_stable in zip(roots, stable):
+                self.__log_sscvg(root, self._owner.adsorbate_names)
+                self.__logger.info("stable = {}".format(is_stable))
+
+        return dict(coverages=roots, errors=errors, stable=stable)
+        # }}}
+
+    def multistart_steady_state_cvgs(self, c0=None, n_starts=8, processes=1,
+                                     relative_energies=None, seed=None):
+        """
+        Function to get steady state coverages by running Newton's iterations
+        from multiple initial guesses, the first physically valid root is returned
+        and the other iterations are cancelled.
+
+        :param c0: Initial coverages, the first candidate, optional
+        :type c0: tuple of float
+
+        :param n_starts: Number of initial guesses, default is 8
+        :type n_starts: int
+
+        :param processes: Number of worker processes, default is 1
+        :type processes: int
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :param seed: Seed for random initial guesses, optional
+        :type seed: int
+
+        :return: Steady state coverages, None if no initial guess converges
+        :rtype: tuple of float
+        """
+        # {{{
+        global _multistart_task
+
+        candidates = self.get_initial_guesses(n_starts, c0=c0,
+                                              relative_energies=relative_energies,
+                                              seed=seed)
+        if self._owner.log_allowed:
+            msg = "Multi-start root finding with {} initial guesses..."
+            self.__logger.info(msg.format(len(candidates)))
+
+        root = None
+        context = None
+        if processes > 1:
+            try:
+                context = multiprocessing.get_context("fork")
+            except ValueError:
+                self.__logger.warning("Process forking is not supported, initial guesses are tried serially.")
+
+        if context is None:
+            for idx, c in enumerate(candidates):
+                ret = self._get_single_start_root(c, relative_energies)
+                if ret is not None:
+                    root = (idx,) + ret
+                    break
+        else:
+            # Forked processes inherit the solver, only indices are sent.
+            _multistart_task = (self, candidates, relative_energies)
+            try:
+                pool = context.Pool(min(processes, len(candidates)))
+                try:
+                    for ret in pool.imap_unordered(_single_start_root, range(len(candidates))):
+                        if ret is not None:
+                            root = ret
+                            break
+                finally:
+                    # Cancel the remaining iterations.
+                    pool.terminate()
+                    pool.join()
+            finally:
+                _multistart_task = None
+
+        if root is None:
+            if self._owner.log_allowed:
+                self.__logger.warning("No initial guess converges in multi-start root finding.")
+            return None
+
+        idx, self._coverages, self._error = root
+        if self._owner.log_allowed:
+            self.__logger.info("Initial guess {} converges.".format(idx))
+            self.__log_sscvg(self._coverages, self._owner.adsorbate_names)
+            self.__logger.info('error = %e', self._error)
+
+        # Archive converged root and error.
+        self.archive_data('steady_state_coverages', self._coverages)
+        self.archive_data('steady_state_error', self._error)
+        self._good_guess = candidates[idx]
+        self.archive_data('initial_guess', candidates[idx])
+
+        return self._coverages
+        # }}}
+
+    def trace_steady_state_cvgs(self, parameter, end, c0=None, relative_energies=None, **kwargs):
+        """ Trace steady state coverages along a parameter path by pseudo-arclength
+        continuation.
+
+        The steady state at the current value of the parameter is solved first,
+        then the branch is followed by tangent predictor and Newton corrector steps
+        on the parameter-augmented system in float64 with the analytical Jacobian.
+        The step size is adapted to the corrector convergence, and turning points
+        are located where the parameter direction of the tangent changes its sign,
+        so the branch is followed through folds instead of jumping to another one.
+
+        :param parameter: Parameter to be continued, could be 'temperature', a gas name
+                          for its pressure, or ('Gaf', idx) to shift the transition state
+                          energy and ('dG', idx) to shift the reaction energy of the
+                          idx-th elementary reaction
+        :type parameter: str or tuple
+
+        :param end: The end value of the parameter
+        :type end: float
+
+        :param c0: initial coverages for the first steady state
+        :type c0: tuple of float
+
+        :param relative_energies: Relative eneriges of elementary reactions.
+        :type relative_energies: dict
+
+        :param step: Initial arclength step size, default is 0.05
+        :type step: float
+
+        :param max_step: Max arclength step size, default is 0.2
+        :type max_step: float
+
+        :param min_step: Min arclength step size, default is 1e-6
+        :type min_step: float
+
+        :param max_steps: Max number of continuation steps, default is 1000
+        :type max_steps: int
+
+        :param corrector_tolerance: Convergence tolerance for Newton corrections, default is 1e-10
+        :type corrector_tolerance: float
+
+        .. note::
+            The parameter is scaled to [0, 1] between its current value and the end
+            value. Steps are measured in the scaled parameter and coverages, and the
+            coverages are float64 estimates which could be polished by
+            :obj:`get_steady_state_cvgs` if high precision is needed.
+
+        :return: the continued parameter values (N,), coverages (N x number of adsorbates)
+                 and indices of turning points in dict with keys 'parameters', 'coverages'
+                 and 'turning_points'
+        :rtype: dict
+        """
+        # {{{
+        step = kwargs.pop("step", 0.05)
+        max_step = kwargs.pop("max_step", 0.2)
+        min_step = kwargs.pop("min_step", 1e-6)
+        max_steps = kwargs.pop("max_steps", 1000)
+        corrector_tolerance = kwargs.pop("corrector_tolerance", 1e-10)
+        max_corrections = 8
+
+        if kwargs:
+            for key in kwargs:
+                msg = "Found redundant keyword argument: {}".format(key)
+                self.__logger.warning(msg)
+
+        set_parameter, start = self.__get_continuation_parameter(parameter, relative_energies)
+        span = float(end) - float(start)
+        if span == 0.0:
+            raise ParameterError("End value of {} is equal to the start value".format(parameter))
+
+        value = lambda mu: (1.0 - mu)*start + mu*float(end)
+
+        # Steady state at the start point.
+        cvgs = self.get_steady_state_cvgs(c0=c0, relative_energies=set_parameter(start))
+        if cvgs is None:
+            raise ValueError("Steady state coverages at the start point are not converged.")
+
+        nads = len(self._owner.adsorbate_names)
+        h = 1e-7  # perturbation size of the scaled parameter
+
+        def evaluate(u):
+            """ Get F(u) and the augmented Jacobian [dF/dx, dF/dmu]. """
+            x, mu = u[:nads], u[-1]
+            kf, kr = self.get_rate_constants(relative_energies=set_parameter(value(mu)))
+            kf, kr = [float(k) for k in kf], [float(k) for k in kr]
+            F = self._vectorized_dtheta_dt(x, kf, kr)
+            J = self._vectorized_jacobian(x, kf, kr)
+
+            # Backward difference at the end of parameter path.
+            dmu = h if mu + h <= 1.0 else -h
+            kf, kr = self.get_rate_constants(relative_energies=set_parameter(value(mu + dmu)))
+            kf, kr = [float(k) for k in kf], [float(k) for k in kr]
+            dF = (self._vectorized_dtheta_dt(x, kf, kr) - F)/dmu
+
+            return F, np.column_stack((J, dF))
+
+        def solve(A, b):
+            """ Solve the bordered system with rows equilibrated. """
+            scale = np.max(np.abs(A[:nads]), axis=1)
+            scale[scale == 0.0] = 1.0
+            A, b = A.copy(), b.copy()
+            A[:nads] /= scale[:, None]
+            b[:nads] /= scale
+            return np.linalg.solve(A, b)
+
+        def tangent(u, t0):
+            """ Unit tangent of the branch oriented as t0. """
+            _, A = evaluate(u)
+            rhs = np.zeros(nads + 1)
+            rhs[-1] = 1.0
+            t = solve(np.vstack((A, t0)), rhs)
+            t /= np.linalg.norm(t)
+            return t if t.dot(t0) > 0 else -t
+
+        def correct(u_pred, t):
+            """ Newton's corrections on the pseudo-arclength hyperplane. """
+            u = u_pred.copy()
+            for n in range(1, max_corrections + 1):
+                try:
+                    F, A = evaluate(u)
+                except ParameterError:
+                    # Invalid parameter value, e.g. negative pressure.
+                    return None, n
+                G = np.append(F, t.dot(u - u_pred))
+                du = solve(np.vstack((A, t)), -G)
+                u = u + du
+                if not np.all(np.isfinite(u)):
+                    return None, n
+                if np.max(np.abs(du)) < corrector_tolerance:
+                    return u, n
+            return None, max_corrections
+
+        def land(u_pred):
+            """ Newton's corrections at the end value of parameter. """
+            x = u_pred[:nads]
+            for _ in range(max_corrections):
+                F, A = evaluate(np.append(x, 1.0))
+                dx = solve(A[:, :nads], -F)
+                x = x + dx
+                if not np.all(np.isfinite(x)):
+                    return None
+                if np.max(np.abs(dx)) < corrector_tolerance:
+                    return np.append(x, 1.0)
+            return None
+
+        try:
+            u = np.append([float(c) for c in cvgs], 0.0)
+            t = np.zeros(nads + 1)
+            t[-1] = 1.0
+            t = tangent(u, t)
+
+            branch, turning_points = [u], []
+            ds, n_steps = step, 0
+
+            while n_steps < max_steps:
+                n_steps += 1
+
+                # Reach the end value.
+                if t[-1] > 0.0 and u[-1] + ds*t[-1] >= 1.0:
+                    u1 = land(u + (1.0 - u[-1])/t[-1]*t)
+                    if u1 is not None:
+                        branch.append(u1)
+                        break
+                    ds = (1.0 - u[-1])/t[-1]/2.0
+                    continue
+
+                # Predictor-corrector step.
+                u1, n_corrections = correct(u + ds*t, t)
+                if u1 is not None:
+                    t1 = tangent(u1, t)
+                    # Reject the step jumping to another branch.
+                    if t1.dot(t) < 0.8:
+                        u1 = None
+
+                if u1 is None:
+                    ds /= 2.0
+                    if ds < min_step:
+                        if self._owner.log_allowed:
+                            self.__logger.warning("Continuation stopped: step size too small.")
+                        break
+                    continue
+
+                # Pass the end value in correction.
+                if u1[-1] > 1.0:
+                    u1 = land(u1)
+                    if u1 is not None:
+                        branch.append(u1)
+                        break
+                    ds /= 2.0
+                    continue
+
+                # Out of the parameter range.
+                if u1[-1] < 0.0:
+                    if self._owner.log_allowed:
+                        self.__logger.warning("Continuation stopped: branch leaves the parameter range.")
+                    break
+
+                # Turning point of the parameter.
+                if t1[-1]*t[-1] < 0.0:
+                    turning_points.append(len(branch))
+                    if self._owner.log_allowed:
+                        msg = "Turning point found: {} = {:e}"
+                        self.__logger.info(msg.format(parameter, value(u1[-1])))
+
+                branch.append(u1)
+                u, t = u1, t1
+
+                # Adapt step size.
+                if n_corrections <= 3:
+                    ds = min(1.5*ds, max_step)
+                elif n_corrections >= 6:
+                    ds = max(0.7*ds, min_step)
+        finally:
+            # Restore the parameter.
+            set_parameter(start)
+
+        branch = np.array(branch)
+
+        if self._owner.log_allowed:
+            msg = "Continuation of {}: {} points, {} turning points"
+            self.__logger.info(msg.format(parameter, len(branch), len(turning_points)))
+
+        return dict(parameters=value(branch[:, -1]),
+                    coverages=branch[:, :nads],
+                    turning_points=turning_points)
+        # }}}
+
+    def __get_continuation_parameter(self, parameter, relative_energies=None):
+        """
+        Private helper function to get a function which sets the continuation
+        parameter and returns the relative energies to be used, and the current
+        value of the parameter.
+        """
+        # {{{
+        if relative_energies is None:
+            relative_energies = self._owner.relative_energies
+
+        # Temperature.
+        if parameter == "temperature":
+            def set_parameter(value):
+                self._owner.set_temperature(value)
+                return relative_energies
+            start = self._owner.temperature
+
+        # Gas pressure.
+        elif parameter in self._owner.gas_names:
+            def set_parameter(value):
+                self._owner.set_pressures({parameter: value})
+                return relative_energies
+            start = self._owner.species_definitions[parameter]["pressure"]
+
+        # Relative energy of an elementary reaction.
+        elif (isinstance(parameter, tuple) and len(parameter) == 2 and
+                parameter[0] in ("Gaf", "dG")):
+            key, idx = parameter
+            def set_parameter(value):
+                energies = copy.deepcopy(relative_energies)
+                delta = value - energies[key][idx]
+                energies[key][idx] = value
+                # Shift of transition state or final state energy.
+                energies["Gar"][idx] += delta if key == "Gaf" else -delta
+                return energies
+            start = relative_energies[key][idx]
+
+        else:
+            raise ParameterError("Invalid continuation parameter: {}".format(parameter))
+
+        return set_parameter, float(start)
+        # }}}
+
     def __log_sscvg(self, cvgs_tuple, ads_names):
         """
         Private helper function to log steady state coverage of every species.
@@ -1000,7 +2515,7 @@ class SteadyStateSolver(MeanFieldSolver):
         """
         # {{{
         head_str = "\n {:<10s}{:<25s}{:<30s}\n".format("index", "intermediate", "XTRC")
-        head_str = "Degree of Rate Control for {}:\n".format(gas_name) + head_str
+        head_str = "Degree of Thermodynamic Rate Control for {}:\n".format(gas_name) + head_str
         line_str = '-'*60 + '\n'
 
         all_data = ''
@@ -1049,7 +2564,144 @@ class SteadyStateSolver(MeanFieldSolver):
         return all_data
         # }}}
 
-    def get_single_XRC(self, gas_name, epsilon=None, relative_energies=None):
+    def __get_barrier_derivatives(self, relative_energies):
+        """
+        Private helper function to get derivatives of forward and reverse barriers
+        of all elementary reactions wrt free energies of intermediates, which are
+        in the order of :obj:`adsorbate_names + transition_state_names`.
+
+        .. note::
+            For the reaction without transition state, the barrier is pinned to
+            the initial (final) state if the forward (reverse) barrier is zero,
+            otherwise the implicit transition state energy is unchanged.
+        """
+        # {{{
+        adsorbate_names = self._owner.adsorbate_names
+        intermediates = adsorbate_names + self._owner.transition_state_names
+        nints = len(intermediates)
+
+        def counts(state):
+            """ Numbers of intermediates in a state. """
+            n = [0]*nints
+            for formula in state:
+                species_name = formula.species_site()
+                if species_name in intermediates:
+                    n[intermediates.index(species_name)] += formula.stoichiometry()
+            return n
+
+        dGafs, dGars = [], []
+        for idx, states in enumerate(self._rxns_list):
+            n_is, n_fs = counts(states[0]), counts(states[-1])
+
+            # Explicit transition state.
+            if len(states) == 3:
+                n_ts = counts(states[1])
+                dGaf = [ts - i for ts, i in zip(n_ts, n_is)]
+                dGar = [ts - f for ts, f in zip(n_ts, n_fs)]
+            # Transition state pinned to the initial state.
+            elif abs(relative_energies["Gaf"][idx]) < 1e-10:
+                dGaf = [0]*nints
+                dGar = [i - f for i, f in zip(n_is, n_fs)]
+            # Transition state pinned to the final state.
+            elif abs(relative_energies["Gar"][idx]) < 1e-10:
+                dGaf = [f - i for i, f in zip(n_is, n_fs)]
+                dGar = [0]*nints
+            # Implicit transition state.
+            else:
+                dGaf = [-i for i in n_is]
+                dGar = [-f for f in n_fs]
+
+            dGafs.append(dGaf)
+            dGars.append(dGar)
+
+        return dGafs, dGars
+        # }}}
+
+    def get_XTRC(self, relative_energies=None):
+        """
+        Function to get degree of thermodynamic rate control (XTRC) of all intermediates
+        for all gas species.
+
+        The XTRC of intermediate n is :math:`(1/r)\\partial r/\\partial(-G_n/k_BT)`. As the
+        logarithms of rate constants are linear in barriers, the whole matrix is obtained
+        from one factorization of the steady state Jacobian by linear response.
+
+        :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
+        :type relative_energies: dict
+
+        :return: XTRC matrix, G x M, G is the number of gases and M the number of
+                 intermediates in the order of :obj:`adsorbate_names + transition_state_names`
+        :rtype: list of list of float
+        """
+        # {{{
+        # Get correct relative energies.
+        if relative_energies is None:
+            relative_energies = self._owner.relative_energies
+
+        if self._owner.log_allowed:
+            self.__logger.info("Calculating Degree of Thermodynamic Rate Control(XTRC)...")
+            self.__logger.info("-"*55 + "\n")
+
+        if hasattr(self, "_coverages"):
+            cvgs = self._coverages
+        else:
+            msg = ("Converged coverages are needed to calculate XTRC, " +
+                   "so try to get steady state coverages first.")
+            raise AttributeError(msg)
+
+        # d(ln k)/d(-G/kT) is the derivative of barrier wrt G.
+        dGafs, dGars = self.__get_barrier_derivatives(relative_energies)
+        sensitivities = self.get_tof_sensitivities(cvgs, dGafs, dGars, relative_energies)
+        tofs = self.get_tof(cvgs=cvgs, relative_energies=relative_energies)
+
+        XTRC_matrix = []
+        for i, tof in enumerate(tofs):
+            XTRCs = []
+            for j in range(len(dGafs[0])):
+                try:
+                    XTRC = sensitivities[i, j]/tof
+                except ZeroDivisionError:
+                    self.__logger.error("ZeroDivisionError exception detected when " +
+                                        "calculating XTRC, the XTRC is set to inf")
+                    XTRC = 'inf'
+                XTRCs.append(XTRC)
+            XTRC_matrix.append(XTRCs)
+
+        # Ouput log info.
+        if mpi.is_master:
+            self.__log_XTRC(XTRC_matrix)
+
+        return XTRC_matrix
+        # }}}
+
+    def get_single_XTRC(self, gas_name, relative_energies=None):
+        """
+        Function to get XTRC of all intermediates for one gas species.
+
+        :param gas_name: The gas name whose XTRC would be calculated
+        :type gas_name: str
+
+        :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
+        :type relative_energies: dict
+
+        :return: XTRCs in the order of :obj:`adsorbate_names + transition_state_names`
+        :rtype: list of float
+        """
+        gas_names = self._owner.gas_names
+        if gas_name not in gas_names:
+            msg = "'{}' is not a gas species in model".format(gas_name)
+            raise ParameterError(msg)
+
+        XTRCs = self.get_XTRC(relative_energies)[gas_names.index(gas_name)]
+
+        # Ouput log info.
+        if mpi.is_master:
+            self.__log_single_XTRC(XTRCs, gas_name)
+
+        return XTRCs
+
+    def get_single_XRC(self, gas_name, epsilon=None, relative_energies=None,
+                       method="finite_difference", processes=1):
         """
         Function to get XRC for one gas species.
 
@@ -1061,8 +2713,20 @@ class SteadyStateSolver(MeanFieldSolver):
 
         :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
         :type relative_energies: dict
+
+        :param method: 'finite_difference' to solve steady state again for every perturbed
+                       reaction, or 'linear_response' to get all XRCs from one Jacobian
+                       factorization at the steady state, default is 'finite_difference'
+        :type method: str
+
+        :param processes: Number of forked processes for finite difference XRCs, default is 1.
+                          When running under MPI, reactions are distributed over MPI ranks instead.
+        :type processes: int
         """
         # {{{
+        if method not in ("finite_difference", "linear_response"):
+            raise ParameterError("Unknown XRC method: {}".format(method))
+
         # Get correct relative energies.
         if relative_energies is None:
             relative_energies = self._owner.relative_energies
@@ -1082,6 +2746,21 @@ class SteadyStateSolver(MeanFieldSolver):
                          gas_name=gas_name,
                          relative_energies=relative_energies)
 
+        if method == "linear_response":
+            # Both forward and reverse rate constants change with the transition state.
+            n_rxns = self._rxns_num
+            identity = [[int(i == j) for j in range(n_rxns)] for i in range(n_rxns)]
+            sensitivities = self.get_tof_sensitivities(init_guess, identity, identity,
+                                                       relative_energies)
+            idx = self._owner.gas_names.index(gas_name)
+            XRCs = [sensitivities[idx, i]/r for i in range(n_rxns)]
+
+            # Ouput log info.
+            if mpi.is_master:
+                self.__log_single_XRC(XRCs=XRCs, gas_name=gas_name)
+
+            return XRCs
+
         # Original rate constants.
         kfs, _ = self.get_rate_constants(relative_energies=relative_energies)
 
@@ -1094,58 +2773,123 @@ class SteadyStateSolver(MeanFieldSolver):
         # Loop over all elementary reactions.
         rxn_expressions = self._owner.rxn_expressions
         n_rxns = len(rxn_expressions)
+        args = (gas_name, epsilon, init_guess, r, kfs, relative_energies)
+        error = self._error
+
+        # Distribute reactions over MPI ranks.
+        if mpi.size > 1:
+            local_XRCs = [(i, self._get_perturbed_XRC(i, *args))
+                          for i in range(mpi.rank, n_rxns, mpi.size)]
+            XRCs = [XRC for _, XRC in sorted(mpi.merge_seq(local_XRCs))]
+        # Dispatch reactions over forked processes.
+        elif processes > 1:
+            XRCs = self.__parallel_XRCs(n_rxns, args, processes)
+        else:
+            XRCs = [self._get_perturbed_XRC(i, *args) for i in range(n_rxns)]
 
-        def get_XRCi(idx):
-            """
-            Nested function to calculate XRC for a single elementary reaction.
-            """
-            # Add epsilon to relative energies.
-            relative_energies_copy = copy.deepcopy(relative_energies)
-            relative_energies_copy["Gaf"][idx] += epsilon
-            relative_energies_copy["Gar"][idx] += epsilon
-
-            # Rate constants change.
-            k = kfs[idx]
-            ks_prime, _ = self.get_rate_constants(relative_energies=relative_energies_copy)
-            k_prime = ks_prime[idx]
-            dk = k_prime - k
-
-            # Get steady state coverages.
-            steady_cvgs = self.get_steady_state_cvgs(c0=init_guess,
-                                                     relative_energies=relative_energies_copy)
-            r_prime = self.get_tof(cvgs=steady_cvgs,
-                                   relative_energies=relative_energies_copy,
-                                   gas_name=gas_name)
-            dr = r_prime - r
+        # Keep the unperturbed steady state.
+        self._coverages, self._error = init_guess, error
 
-            try:
-                XRCi = k/r*(dr/dk)
-            except ZeroDivisionError:
-                self.__logger.error("ZeroDivisionError exception detected when" +
-                                    "calculating XRC, the XRC is set to inf")
-                XRCi = 'inf'
+        # Ouput log info.
+        if mpi.is_master:
+            if self._owner.log_allowed:
+                for rxn_expression, XRC in zip(rxn_expressions, XRCs):
+                    self.__logger.info("XRC({}) = {:.2e}".format(rxn_expression, float(XRC)))
+            self.__log_single_XRC(XRCs=XRCs, gas_name=gas_name)
 
-            return XRCi
+        return XRCs
+        # }}}
 
-        XRCs = [None]*n_rxns
-        for i in range(n_rxns):
-            if self._owner.log_allowed:
-                self.__logger.info("Calculating XRC for {} ...".format(rxn_expressions[i]))
+    def _get_perturbed_XRC(self, idx, gas_name, epsilon, init_guess, r, kfs, relative_energies):
+        """
+        Protected function to calculate XRC for a single elementary reaction
+        by perturbing its transition state energy and solving steady state again.
 
-            # Get XRC for that elementary reaction.
-            XRC = get_XRCi(i)
-            XRCs[i] = XRC
+        :param idx: Index of the elementary reaction
+        :type idx: int
 
-            # Ouput log info.
-            if self._owner.log_allowed:
-                self.__logger.info("XRC({}) = {:.2e}\n".format(rxn_expressions[i], float(XRC)))
+        :param gas_name: The gas name whose XRC would be calculated
+        :type gas_name: str
 
-        # Ouput log info.
-        self.__log_single_XRC(XRCs=XRCs, gas_name=gas_name)
+        :param epsilon: The perturbation size of energy
+        :type epsilon: float
 
-        return XRCs
+        :param init_guess: Unperturbed steady state coverages
+        :type init_guess: tuple of float
+
+        :param r: Unperturbed TOF of the gas
+        :type r: float
+
+        :param kfs: Unperturbed forward rate constants
+        :type kfs: list of float
+
+        :param relative_energies: Unperturbed relative energies
+        :type relative_energies: dict
+
+        :return: XRC of the elementary reaction, 'inf' if the rate constant does not change
+        :rtype: float or str
+        """
+        # {{{
+        if self._owner.log_allowed:
+            rxn_expression = self._owner.rxn_expressions[idx]
+            self.__logger.info("Calculating XRC for {} ...".format(rxn_expression))
+
+        # Add epsilon to relative energies.
+        relative_energies_copy = copy.deepcopy(relative_energies)
+        relative_energies_copy["Gaf"][idx] += epsilon
+        relative_energies_copy["Gar"][idx] += epsilon
+
+        # Rate constants change.
+        k = kfs[idx]
+        ks_prime, _ = self.get_rate_constants(relative_energies=relative_energies_copy)
+        k_prime = ks_prime[idx]
+        dk = k_prime - k
+
+        # Get steady state coverages.
+        steady_cvgs = self.get_steady_state_cvgs(c0=init_guess,
+                                                 relative_energies=relative_energies_copy)
+        r_prime = self.get_tof(cvgs=steady_cvgs,
+                               relative_energies=relative_energies_copy,
+                               gas_name=gas_name)
+        dr = r_prime - r
+
+        try:
+            XRCi = k/r*(dr/dk)
+        except ZeroDivisionError:
+            self.__logger.error("ZeroDivisionError exception detected when" +
+                                "calculating XRC, the XRC is set to inf")
+            XRCi = 'inf'
+
+        return XRCi
         # }}}
 
+    def __parallel_XRCs(self, n_rxns, args, processes):
+        """
+        Private helper function to calculate XRCs of all elementary reactions
+        in a pool of forked processes, the results are in the reaction order.
+        """
+        global _XRC_task
+
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            self.__logger.warning("Process forking is not supported, XRCs are calculated serially.")
+            return [self._get_perturbed_XRC(i, *args) for i in range(n_rxns)]
+
+        # Forked processes inherit the solver, only indices are sent.
+        _XRC_task = (self, args)
+        try:
+            pool = context.Pool(min(processes, n_rxns))
+            try:
+                XRCs = pool.map(_perturbed_XRC, range(n_rxns))
+            finally:
+                pool.close()
+                pool.join()
+        finally:
+            _XRC_task = None
+
+        return XRCs
+
     def __log_single_XRC(self, XRCs, gas_name):
         """
         Private helper function to log XRC for a gas species.
@@ -1176,11 +2920,9 @@ class SteadyStateSolver(MeanFieldSolver):
         """
         if self._owner.log_allowed:
             self.__logger.info("Use ODE integration to get new initial coverages...")
-        end_time = random.randint(0, 10)
-
-        time_span = 10**(-random.randint(0, 5))
+        end_time = 10**(-random.randint(0, 5))*random.randint(1, 10)
 
-        new_cvgs = self.solve_ode(time_end=end_time, time_span=time_span)[-1]
+        new_cvgs = self.integrate_to_steady_state(time_end=end_time)[-1]
 
         if self._owner.log_allowed:
             self.__logger.info('modify initial coverage - success')
@@ -1359,6 +3101,120 @@ class SteadyStateSolver(MeanFieldSolver):
         return times, coverages
         # }}}
 
+    def integrate_to_steady_state(self, initial_cvgs=None, time_end=100.0,
+                                  relative_energies=None, method='BDF',
+                                  tolerance=None, relative_tolerance=1e-6):
+        """
+        Integrate the rate equations with an implicit stiff integrator using the
+        float64 right-hand side and analytical Jacobian, the integration stops
+        when the norm of dtheta/dt falls below the tolerance, or every dtheta/dt
+        is negligible compared with the gross rate of the adsorbate, or at time_end.
+        If the integrator fails, the last integrated state is returned with a warning.
+
+        :param initial_cvgs: initial coverages at t = 0, default is Boltzmann coverages
+        :type initial_cvgs: tuple of float
+
+        :param time_end: time when stop integration if steady state is not reached
+        :type time_end: float
+
+        :param relative_energies: Relative energies for calculation, if not provided, use model's relative energies, default is None
+        :type relative_energies: dict
+
+        :param method: implicit integrator in :obj:`scipy.integrate`,
+             possible values: 'BDF' | 'Radau' | 'LSODA', default is 'BDF'
+        :type method: str
+
+        :param tolerance: tolerance for norm of dtheta/dt, default is model's tolerance
+        :type tolerance: float
+
+        :param relative_tolerance: tolerance for dtheta/dt relative to the sum of
+                                   production and consumption rates, default is 1e-6
+        :type relative_tolerance: float
+
+        :return: the integrated time
+        :rtype: float
+
+        :return: integrated coverages
+        :rtype: list of float
+
+        Examples::
+            >>> m.solver.integrate_to_steady_state(initial_cvgs=(0.0, 0.0))
+        """
+        # {{{
+        if method not in ('BDF', 'Radau', 'LSODA'):
+            raise ParameterError("Invalid implicit ODE method: {}".format(method))
+
+        nads = len(self._owner.adsorbate_names)
+
+        if initial_cvgs is None:
+            try:
+                initial_cvgs = self.boltzmann_coverages()
+            except IOError:
+                initial_cvgs = [0.0]*nads
+        y0 = np.array([float(c) for c in initial_cvgs], dtype=np.float64)
+
+        if tolerance is None:
+            tolerance = self._owner.tolerance
+        tolerance = float(tolerance)
+
+        # Rate constants are fixed during integration.
+        kf, kr = self.get_rate_constants(relative_energies=relative_energies)
+        kf = np.array([float(k) for k in kf], dtype=np.float64)
+        kr = np.array([float(k) for k in kr], dtype=np.float64)
+
+        def f(t, y):
+            return self._vectorized_dtheta_dt(y, kf, kr)
+
+        if self._owner.sparse_jacobian:
+            def jac(t, y):
+                return self._sparse_jacobian(y, kf, kr)
+        else:
+            def jac(t, y):
+                return self._vectorized_jacobian(y, kf, kr)
+
+        # NOTE: float64 dtheta/dt is the difference of large gross rates,
+        #       whose round-off may be far above an absolute tolerance.
+        _, _, adsorbate_stoichiometry, _, _ = self._get_vectorized_arrays()
+
+        def steady(y):
+            dtheta_dt = f(None, y)
+            if np.linalg.norm(dtheta_dt) < tolerance:
+                return True
+            rfs, rrs = self._vectorized_rates(y, kf, kr)
+            gross_rates = np.abs(adsorbate_stoichiometry).T.dot(rfs + rrs)
+            return bool(np.all(np.abs(dtheta_dt) <= relative_tolerance*gross_rates))
+
+        if self._owner.log_allowed:
+            msg = 'entering {} ODE integration (end = {:.2e})...'.format(method, time_end)
+            self.__logger.info(msg)
+
+        integrator = getattr(integrate, method)(f, 0.0, y0, time_end, jac=jac,
+                                                rtol=1e-8, atol=1e-12)
+
+        # Check the residual after each step instead of locating an event,
+        # the noisy residual is not smooth enough for root finding.
+        reached = False
+        t, y = 0.0, y0
+        while integrator.status == 'running':
+            message = integrator.step()
+            # Return the last state if the stiff integration fails.
+            if integrator.status == 'failed' or not np.all(np.isfinite(integrator.y)):
+                msg = "ODE integration failed at t = {:e}: {}, return the last state"
+                self.__logger.warning(msg.format(integrator.t, message))
+                return t, y.tolist()
+            t, y = float(integrator.t), integrator.y.copy()
+            if steady(y):
+                reached = True
+                break
+
+        if self._owner.log_allowed:
+            state = "steady state reached" if reached else "end time reached"
+            msg = "{} at t = {:e} ({} function, {} Jacobian evaluations)"
+            self.__logger.info(msg.format(state, t, integrator.nfev, integrator.njev))
+
+        return t, y.tolist()
+        # }}}
+
     @Property
     def error(self):
         """ Query function for converged error.
@@ -1374,6 +3230,13 @@ class SteadyStateSolver(MeanFieldSolver):
         except AttributeError:
             return [0.0]*len(self._owner.adsorbate_names)
 
+    @Property
+    def precision_iterations(self):
+        """ Query function for iteration numbers at each precision of the last
+        mixed precision solving.
+        """
+        return self._precision_iterations
+
     @Property
     def good_guess(self):
         """ Query function for good initial coverages.
@@ -7,6 +7,7 @@ from mpmath import mpf
 
 from ...models.micro_kinetic_model import MicroKineticModel
 from ...correctors import *
+from ...database.thermo_data import P0
 
 from .. import *
 
@@ -96,6 +97,56 @@ class ThermodynamicCorrectorTest(unittest.TestCase):
         species = "O-O_s"
         self.assertEqual(corrector.entropy_correction(species), 0.0)
 
+    def test_corrections_for_temperature_arrays(self):
+        " Make sure corrections for temperature arrays are the same as scalar ones. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.ERROR)
+        corrector = model.corrector
+
+        temperatures = [250.0, 450.0, 1300.0, 1500.0, 2000.0]
+        for gas in ["CO_g", "O2_g", "O4_g", "O-O_s"]:
+            ret_deltas = corrector.shomate_correction(gas, T=temperatures)
+            ref_deltas = [corrector.shomate_correction(gas, T=T) for T in temperatures]
+            self.assertEqual(ret_deltas.shape, (5,))
+            for ret, ref in zip(ret_deltas, ref_deltas):
+                self.assertAlmostEqual(ret, ref, places=12)
+
+            ret_deltas = corrector.entropy_correction(gas, T=temperatures)
+            ref_deltas = [corrector.entropy_correction(gas, T=T) for T in temperatures]
+            self.assertEqual(ret_deltas.shape, (5,))
+            for ret, ref in zip(ret_deltas, ref_deltas):
+                self.assertAlmostEqual(ret, ref, places=12)
+
+        # No parameters for CO_g above 1600K.
+        self.assertEqual(corrector.shomate_correction("CO_g", T=2000.0), 0.0)
+
+    def test_cached_entropy_correction(self):
+        " Make sure cached entropy corrections follow the model's pressures. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.ERROR)
+        corrector = model.corrector
+
+        ref_delta = corrector.entropy_correction("O2_g")
+        self.assertEqual(corrector.entropy_correction("O2_g"), ref_delta)
+
+        model.set_pressures({"O2_g": 1.0})
+        ret_delta = corrector.entropy_correction("O2_g")
+        self.assertNotEqual(ret_delta, ref_delta)
+        self.assertEqual(ret_delta, corrector.entropy_correction("O2_g", p=P0))
+
+    def test_correct_model_relative_energies(self):
+        " Make sure model's relative energies are updated after correction. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.set_pressures({"CO2_g": 0.01})
+
+        version = model.relative_energies_version
+        kf, kr = model.solver.get_rate_constants()
+
+        model.corrector.correct_relative_energies(model.relative_energies, method="entropy")
+        self.assertEqual(model.relative_energies_version, version + 1)
+
+        new_kf, new_kr = model.solver.get_rate_constants()
+        self.assertNotEqual(kr, new_kr)
+
 #    def test_solvers_correction_energy(self):
 #        " Test solver's correction energy function. "
 #        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
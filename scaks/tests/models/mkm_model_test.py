@@ -4,6 +4,10 @@ import os
 from copy import deepcopy
 
 from ...models.micro_kinetic_model import MicroKineticModel
+from ...errors.error import ParameterError
+from ...database.warm_start_index import WarmStartIndex
+from ... import load_archived_data
+from ...compatutil import pickle
 from ...parsers import *
 
 from .. import *
@@ -121,6 +125,262 @@ class MicroKineticModelTest(unittest.TestCase):
         model.solver.get_data()
         model.run(init_cvgs=init_cvgs)
 
+    def test_run_with_ode_initial_guess(self):
+        " Test the initial guess of run is from ODE integration when there is data file. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        open(model.data_file, "wb").close()
+
+        model.run()
+        ref_cvgs = [0.9993009023315728, 0.0006990944289937246]
+        for ref, ret in zip(ref_cvgs, model.steady_state_coverages):
+            self.assertAlmostEqual(ref, float(ret), places=6)
+
+    def test_set_conditions(self):
+        " Make sure the reaction conditions can be changed in solved model. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        kfs, krs = model.solver.get_rate_constants(relative_energies=None)
+
+        model.set_temperature(500.0)
+        model.set_pressures({"CO_g": 0.5})
+        self.assertEqual(model.temperature, 500.0)
+        self.assertEqual(model.species_definitions["CO_g"]["pressure"], 0.5)
+        self.assertEqual(float(model.solver._p["CO_g"]), 0.5)
+
+        new_kfs, new_krs = model.solver.get_rate_constants(relative_energies=None)
+        self.assertNotEqual(kfs, new_kfs)
+
+        # Check the rate constants of a new model at the same conditions.
+        setup_dict = deepcopy(self.setup_dict)
+        setup_dict["temperature"] = 500.0
+        setup_dict["species_definitions"]["CO_g"]["pressure"] = 0.5
+        ref_model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        ref_model.parser.parse_data(filename=mkm_energy)
+        ref_model.solver.get_data()
+        ref_model.solver.get_rate_constants.clear()
+        ref_kfs, ref_krs = ref_model.solver.get_rate_constants(relative_energies=None)
+
+        for k, ref_k in zip(new_kfs + new_krs, ref_kfs + ref_krs):
+            self.assertAlmostEqual(float(k), float(ref_k))
+
+        self.assertRaises(ParameterError, model.set_pressures, {"H2_g": 1.0})
+        self.assertRaises(ParameterError, model.set_temperature, -1.0)
+
+    def test_species_definitions_snapshot(self):
+        " Make sure the species definitions are read-only and not copied in reading. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        descriptor = MicroKineticModel.species_definitions
+
+        snapshot = model.species_definitions
+        self.assertTrue(snapshot is model.species_definitions)
+        self.assertTrue(deepcopy(snapshot) is snapshot)
+        self.assertEqual(descriptor.get_version(model), 0)
+
+        self.assertRaises(TypeError, snapshot.__setitem__, "CO_g", {})
+        self.assertRaises(TypeError, snapshot["CO_g"].__setitem__, "pressure", 0.5)
+        self.assertRaises(TypeError, snapshot["CO_g"].update, {"pressure": 0.5})
+
+        # Changes go through the model and a new snapshot is created.
+        model.set_pressures({"CO_g": 0.5})
+        self.assertEqual(descriptor.get_version(model), 1)
+        self.assertEqual(snapshot["CO_g"]["pressure"], 1.0)
+        self.assertFalse(snapshot is model.species_definitions)
+        self.assertEqual(model.species_definitions["CO_g"]["pressure"], 0.5)
+        self.assertEqual(model.parser.species_definitions["CO_g"]["pressure"], 0.5)
+
+        # Setup dict of caller is not changed.
+        self.assertEqual(self.setup_dict["species_definitions"]["CO_g"]["pressure"], 1.0)
+
+    def test_sweep(self):
+        " Test micro kinetic model can sweep reaction conditions correctly. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        results = model.sweep(temperatures=[450.0, 490.0],
+                              pressures={"CO_g": [0.5, 1.0]},
+                              init_cvgs=[0.9, 0.1])
+
+        self.assertEqual(results["coverages"].shape, (4, 2))
+        self.assertEqual(results["TOFs"].shape, (4, 3))
+        self.assertTrue(all(results["converged"]))
+        self.assertListEqual(results["temperatures"].tolist(), [450.0, 450.0, 490.0, 490.0])
+        self.assertListEqual(results["pressures"][:, 1].tolist(), [0.5, 1.0, 0.5, 1.0])
+
+        # Conditions are restored after sweeping.
+        self.assertEqual(model.temperature, 450.0)
+        self.assertEqual(model.species_definitions["CO_g"]["pressure"], 1.0)
+
+        # Check with the model created at the same conditions.
+        setup_dict = deepcopy(self.setup_dict)
+        setup_dict["temperature"] = 490.0
+        setup_dict["species_definitions"]["CO_g"]["pressure"] = 0.5
+        ref_model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        ref_model.parser.parse_data(filename=mkm_energy)
+        ref_model.solver.get_data()
+        ref_model.run(init_cvgs=[0.9, 0.1])
+
+        for cvg, ref_cvg in zip(results["coverages"][2], ref_model.steady_state_coverages):
+            self.assertAlmostEqual(cvg, float(ref_cvg))
+        for tof, ref_tof in zip(results["TOFs"][2], ref_model.TOFs):
+            self.assertAlmostEqual(tof, float(ref_tof))
+
+    def test_steady_state_cache(self):
+        " Make sure converged steady states are cached for the same conditions. "
+        setup_dict = deepcopy(self.setup_dict)
+        setup_dict["cache_file"] = "auto_steady_states.db"
+        model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        model.run(init_cvgs=[0.9, 0.1])
+
+        # Run again without solving.
+        cached_model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        cached_model.parser.parse_data(filename=mkm_energy)
+        cached_model.solver.get_data()
+
+        def unexpected_solving(*args, **kwargs):
+            raise AssertionError("Steady state is solved again.")
+        cached_model.solver.coarse_steady_state_cvgs = unexpected_solving
+        cached_model.solver.get_tof = unexpected_solving
+        cached_model.run(init_cvgs=[0.9, 0.1])
+
+        self.assertTupleEqual(tuple(model.steady_state_coverages),
+                              tuple(cached_model.steady_state_coverages))
+        self.assertListEqual(list(model.TOFs), list(cached_model.TOFs))
+        self.assertEqual(model.error, cached_model.error)
+
+        # Solved conditions are loaded from cache file to warm start index.
+        self.assertEqual(len(cached_model.warm_start_index), 1)
+
+        # Solver consults the cache too.
+        cvgs = cached_model.solver.get_steady_state_cvgs(c0=[0.5, 0.5])
+        self.assertTupleEqual(tuple(model.steady_state_coverages), tuple(cvgs))
+
+        # Changed conditions are not in cache.
+        key = cached_model.steady_state_cache.get_key(cached_model)
+        cached_model.set_pressures({"CO_g": 0.5})
+        self.assertNotEqual(key, cached_model.steady_state_cache.get_key(cached_model))
+        self.assertIsNone(cached_model.solver._get_cached_steady_state())
+
+        # Inputs of rate constants and root finding are in the key.
+        key = cached_model.steady_state_cache.get_key(cached_model)
+        for name, value in [("unitcell_area", 1.0e-19),
+                            ("active_ratio", 0.5),
+                            ("ref_energies", {"CO_g": 0.1}),
+                            ("rootfinding", "Broyden"),
+                            ("max_rootfinding_iterations", 200)]:
+            new_setup_dict = deepcopy(setup_dict)
+            new_setup_dict[name] = value
+            new_model = MicroKineticModel(setup_dict=new_setup_dict,
+                                          logger_level=logging.WARNING)
+            new_model.parser.parse_data(filename=mkm_energy)
+            new_model.set_pressures({"CO_g": 0.5})
+            self.assertNotEqual(key, new_model.steady_state_cache.get_key(new_model))
+
+    def test_warm_start_index(self):
+        " Make sure initial coverages are from the closest solved conditions. "
+        # Warm start is disabled by default.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        model.run(init_cvgs=[0.9, 0.1])
+        self.assertEqual(len(model.warm_start_index), 1)
+        self.assertIsNone(model.solver._get_warm_start_cvgs())
+
+        setup_dict = deepcopy(self.setup_dict)
+        setup_dict["warm_start_neighbors"] = 1
+        model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        self.assertIsNone(model.solver._get_warm_start_cvgs())
+
+        model.run(init_cvgs=[0.9, 0.1])
+        index = model.warm_start_index
+        self.assertEqual(len(index), 1)
+        point = index.get_point(model)
+        self.assertEqual(len(point), 1 + 3 + 3 + 3)
+        self.assertAlmostEqual(point[0], 1000.0/450.0)
+
+        # Initial guess from the solved conditions.
+        model.set_pressures({"CO_g": 0.5})
+        c0 = model.solver._get_warm_start_cvgs()
+        for c, ref_c in zip(c0, model.steady_state_coverages):
+            self.assertAlmostEqual(float(c), float(ref_c))
+
+        # Solve without initial coverages.
+        model.run()
+        self.assertEqual(len(index), 2)
+        self.assertLess(model.error, model.tolerance)
+
+        # Inverse distance weighted coverages of the closest points.
+        index = WarmStartIndex()
+        index.add([0.0, 1.0], [0.2, 0.8])
+        index.add([0.0, 3.0], [0.6, 0.4])
+        c0 = index.get_initial_guess([0.0, 2.0], k=2)
+        self.assertAlmostEqual(c0[0], 0.4)
+        self.assertAlmostEqual(c0[1], 0.6)
+        self.assertTupleEqual(index.get_initial_guess([0.0, 2.9], k=1), (0.6, 0.4))
+        self.assertIsNone(index.get_initial_guess([0.0, 2.0, 1.0]))
+
+    def test_archive_data(self):
+        " Make sure data updates are buffered and appended to data file. "
+        setup_dict = deepcopy(self.setup_dict)
+        setup_dict["archived_variables"] = ["steady_state_coverages", "tofs"]
+        setup_dict["archive_buffer_size"] = 3
+        model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        solver = model.solver
+        if os.path.exists(model.data_file):
+            os.remove(model.data_file)
+
+        # Not archived variable.
+        solver.archive_data("rates", (1.0, 2.0))
+        solver.archive_data("steady_state_coverages", (0.2, 0.8))
+        solver.archive_data("tofs", [1.0])
+        self.assertFalse(os.path.exists(model.data_file))
+
+        # Buffer is full.
+        solver.archive_data("steady_state_coverages", (0.9, 0.1))
+        data = load_archived_data(model.data_file)
+        self.assertDictEqual(data, {"steady_state_coverages": (0.9, 0.1),
+                                    "tofs": [1.0]})
+
+        # Records are appended.
+        solver.archive_data("tofs", [2.0])
+        solver.flush_archive()
+        data = load_archived_data(model.data_file)
+        self.assertDictEqual(data, {"steady_state_coverages": (0.9, 0.1),
+                                    "tofs": [2.0]})
+
+        # Buffered data of all components are flushed before reading.
+        model.corrector.archive_data("tofs", [3.0])
+        solver.archive_data("steady_state_coverages", (0.8, 0.2))
+        data = load_archived_data(model.data_file)
+        self.assertDictEqual(data, {"steady_state_coverages": (0.8, 0.2),
+                                    "tofs": [3.0]})
+
+        # Data file of previous model is truncated to the latest values but not erased.
+        new_model = MicroKineticModel(setup_dict=setup_dict, logger_level=logging.WARNING)
+        with open(new_model.data_file, "rb") as f:
+            records = []
+            while True:
+                try:
+                    records.append(pickle.load(f))
+                except EOFError:
+                    break
+        self.assertDictEqual(dict(records), data)
+        self.assertEqual(len(records), 2)
+
+        # Data of run is written to data file.
+        new_model.parser.parse_data(filename=mkm_energy)
+        new_model.solver.get_data()
+        new_model.run(init_cvgs=[0.9, 0.1])
+        data = load_archived_data(new_model.data_file)
+        self.assertTupleEqual(tuple(data["steady_state_coverages"]),
+                              tuple(new_model.steady_state_coverages))
+
     def tearDown(self):
         cleanup()
 
@@ -107,6 +107,24 @@ class ParserBaseTest(unittest.TestCase):
         self.assertTrue(np.allclose(ref_reapro_matrix, ret_reapro_matrix))
         self.assertTrue(np.allclose(ref_site_matrix, ret_site_matrix))
 
+    def test_reaction_order_matrices(self):
+        " Make sure we can get the forward and reverse reaction order matrices correctly."
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+
+        # Columns: CO_s, O_s, *_s, CO2_g, CO_g, O2_g
+        ref_forward_matrix = np.array([[0.0, 0.0, 1.0, 0.0, 1.0, 0.0],
+                                       [0.0, 0.0, 2.0, 0.0, 0.0, 1.0],
+                                       [1.0, 1.0, 0.0, 0.0, 0.0, 0.0]])
+        ref_reverse_matrix = np.array([[1.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                                       [0.0, 2.0, 0.0, 0.0, 0.0, 0.0],
+                                       [0.0, 0.0, 2.0, 1.0, 0.0, 0.0]])
+        ret_forward_matrix, ret_reverse_matrix = parser.get_reaction_order_matrices()
+
+        self.assertTrue(np.allclose(ref_forward_matrix, ret_forward_matrix))
+        self.assertTrue(np.allclose(ref_reverse_matrix, ret_reverse_matrix))
+
     def test_elemtary_rxns_parse(self):
         " Test all elementary reaction equations can be parsed correctly. "
 
@@ -6,6 +6,7 @@ from .parser_base_test import ParserBaseTest
 from .relative_energy_parser_test import RelativeEnergyParserTest
 from .absolute_energy_parser_test import AbsoluteEnergyParserTest
 from .kmc_parser_test import KMCParserTest
+from .reaction_network_test import ReactionNetworkTest
 
 parser_test_cases = [
     ChemStateTest,
@@ -13,7 +14,8 @@ parser_test_cases = [
     ParserBaseTest,
     RelativeEnergyParserTest,
     AbsoluteEnergyParserTest,
-    KMCParserTest
+    KMCParserTest,
+    ReactionNetworkTest,
 ]
 
 
@@ -0,0 +1,92 @@
+import logging
+import unittest
+
+import numpy as np
+
+from ...models.micro_kinetic_model import MicroKineticModel
+from ...parsers.reaction_network import ReactionNetwork
+from ...errors.error import ParameterError
+
+from .. import *
+
+
+class ReactionNetworkTest(unittest.TestCase):
+
+    def setUp(self):
+        # Test case setting.
+        self.maxDiff = None
+        self.setup_dict = dict(
+            rxn_expressions = [
+                'CO_g + *_s -> CO_s',
+                'O2_g + 2*_s -> 2O_s',
+                'CO_s + O_s <-> CO-O_2s -> CO2_g + 2*_s',
+            ],
+
+            species_definitions = {
+                'CO_g': {'pressure': 1.0},
+                'O2_g': {'pressure': 1./3.},
+                'CO2_g': {'pressure': 0.00},
+                '*_s': {'site_name': '111', 'type': 'site', 'total': 1.0},
+            },
+
+            temperature = 450.0,
+            parser = "RelativeEnergyParser",
+            solver = "SteadyStateSolver",
+            corrector = "ThermodynamicCorrector",
+        )
+
+    def test_construction(self):
+        " Make sure the reaction network is indexed correctly. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        network = model.reaction_network
+
+        self.assertTrue(isinstance(network, ReactionNetwork))
+        self.assertTupleEqual(network.species_names,
+                              ('CO_s', 'O_s', '*_s', 'CO2_g', 'CO_g', 'O2_g'))
+        self.assertEqual(network.species_indices['O2_g'], 5)
+        self.assertEqual(network.get_rxn_index('O2_g + 2*_s -> 2O_s'), 1)
+        self.assertRaises(ParameterError, network.get_rxn_index, 'H2_g + 2*_s -> 2H_s')
+        self.assertDictEqual(dict(network.classified_adsorbates), {'*_s': ('CO_s', 'O_s')})
+
+        ref_site_matrix = np.array([[1.0, 1.0]])
+        self.assertTrue(np.allclose(network.site_matrix, ref_site_matrix))
+
+        ref_stoichiometry = np.array([[1.0, 0.0], [0.0, 2.0], [-1.0, -1.0]])
+        self.assertTrue(np.allclose(network.adsorbate_stoichiometry, ref_stoichiometry))
+
+        # Gases in elementary reactions.
+        self.assertListEqual(network.gas_rxn_mask.tolist(), [True, True, True])
+        self.assertTupleEqual(network.get_adsorption_gases(1), ('O2_g', ))
+        self.assertTupleEqual(network.get_desorption_gases(1), ())
+        self.assertTupleEqual(network.get_desorption_gases(2), ('CO2_g', ))
+
+        # Same elementary reactions are shared with model.
+        self.assertEqual(len(network.elementary_rxns_list), 3)
+        self.assertEqual(network.elementary_rxns_list[2][1][0].species_site(), 'CO-O_2s')
+
+    def test_immutable(self):
+        " Make sure the reaction network could not be changed. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        network = model.reaction_network
+
+        self.assertRaises(AttributeError, setattr, network, 'gas_names', ())
+        self.assertRaises(ValueError, network.forward_orders.__setitem__, (0, 0), 1.0)
+        self.assertRaises(TypeError, network.species_indices.__setitem__, 'H_s', 0)
+        self.assertRaises(TypeError, network.classified_adsorbates.pop, '*_s')
+
+        # Stoichiometry matrices are copies.
+        _, reapro_matrix = model.parser.get_stoichiometry_matrices()
+        reapro_matrix *= -1
+        _, ref_reapro_matrix = model.parser.get_stoichiometry_matrices()
+        self.assertTrue(np.allclose(reapro_matrix, -ref_reapro_matrix))
+
+        forward_orders, _ = model.parser.get_reaction_order_matrices()
+        forward_orders[0, 0] = 10.0
+        self.assertEqual(network.forward_orders[0, 0], 0.0)
+
+    def tearDown(self):
+        cleanup()
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(ReactionNetworkTest)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -6,6 +6,7 @@ import numpy as np
 from mpmath import mpf
 
 from ...models.micro_kinetic_model import MicroKineticModel
+from ...errors.error import ParameterError
 from ...parsers.rxn_parser import *
 from ...solvers import *
 
@@ -150,6 +151,113 @@ class MeanFieldSolverTest(unittest.TestCase):
         self.assertListEqual(ref_reverse_rate_constants, ret_reverse_rate_constants)
         # }}}
 
+    def test_get_rate_constants_array(self):
+        # {{{
+        " Make sure rate constants can be got for batch of temperatures and energies. "
+        for rate_algo in ["TST", "CT"]:
+            self.setup_dict.update(rate_algo=rate_algo, unitcell_area=9.0e-20,
+                                   active_ratio=4./9, numerical_representation="numpy")
+            model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+            model.parser.parse_data(filename=mkm_energy)
+            model.solver.get_data()
+            solver = model.solver
+            rate_func = getattr(solver, "get_rxn_rates_{}".format(rate_algo))
+
+            # Array of temperatures.
+            temperatures = [400.0, 450.0, 500.0]
+            kf, kr = solver.get_rate_constants_array(temperatures=temperatures)
+            self.assertEqual(kf.shape, (3, 3))
+            self.assertEqual(kr.shape, (3, 3))
+
+            for i, T in enumerate(temperatures):
+                model.set_temperature(T)
+                for j, rxn_expression in enumerate(model.rxn_expressions):
+                    ref_kf, ref_kr = rate_func(rxn_expression, model.relative_energies)
+                    self.assertAlmostEqual(kf[i, j]/float(ref_kf), 1.0, places=10)
+                    self.assertAlmostEqual(kr[i, j]/float(ref_kr), 1.0, places=10)
+
+            # Stack of relative energies at model's temperature.
+            relative_energies = model.relative_energies
+            shifts = np.array([[0.0], [0.1]])
+            energy_sets = dict([(key, np.array(value) + shifts)
+                                for key, value in relative_energies.items()])
+            kf, kr = solver.get_rate_constants_array(relative_energies=energy_sets)
+            self.assertEqual(kf.shape, (2, 3))
+
+            ref_kf, ref_kr = solver.get_rate_constants_array()
+            self.assertTrue(np.allclose(kf[0], ref_kf[0], rtol=1e-12))
+            self.assertTrue(np.allclose(kr[0], ref_kr[0], rtol=1e-12))
+
+            shifted_energies = dict([(key, list(value[1])) for key, value in energy_sets.items()])
+            ref_kf, ref_kr = solver.get_rate_constants_array(relative_energies=shifted_energies)
+            self.assertTrue(np.allclose(kf[1], ref_kf[0], rtol=1e-12))
+            self.assertTrue(np.allclose(kr[1], ref_kr[0], rtol=1e-12))
+
+            # Temperatures and energy sets are paired.
+            kf, kr = solver.get_rate_constants_array(temperatures=[450.0, 500.0],
+                                                     relative_energies=energy_sets)
+            self.assertEqual(kf.shape, (2, 3))
+            self.assertRaises(ParameterError, solver.get_rate_constants_array,
+                              temperatures=temperatures, relative_energies=energy_sets)
+            self.assertRaises(ParameterError, solver.get_rate_constants_array,
+                              temperatures=[-1.0])
+        # }}}
+
+    def test_rate_constants_cache(self):
+        # {{{
+        " Make sure the rate constants are memoized per solver with bounded size. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        solver = model.solver
+
+        cache = solver.get_rate_constants
+        self.assertTrue(cache is solver.get_rate_constants)
+        cache.clear()
+
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        self.assertTrue(solver.get_rate_constants() == (kf, kr))
+        self.assertTrue(solver.get_rate_constants(relative_energies=None) == (kf, kr))
+        self.assertEqual(cache.cache_info(), (2, 1, 128, 1))
+
+        # New version of model's relative energies.
+        relative_energies = model.relative_energies
+        model.set_relative_energies(relative_energies)
+        solver.get_rate_constants(relative_energies=None)
+        self.assertEqual(cache.cache_info().misses, 2)
+
+        # In-place changes are seen after the energies are set again.
+        relative_energies["Gaf"][2] += 0.1
+        model.set_relative_energies(relative_energies)
+        self.assertNotEqual(solver.get_rate_constants(relative_energies=None), (kf, kr))
+        relative_energies["Gaf"][2] -= 0.1
+        model.set_relative_energies(relative_energies)
+        self.assertTrue(solver.get_rate_constants(relative_energies=None) == (kf, kr))
+        self.assertEqual(cache.cache_info().misses, 4)
+
+        # Equal energies given explicitly share the result.
+        relative_energies = dict([(k, list(v)) for k, v in relative_energies.items()])
+        solver.get_rate_constants(relative_energies=relative_energies)
+        solver.get_rate_constants(relative_energies=dict(relative_energies))
+        self.assertEqual(cache.cache_info().hits, 3)
+
+        # Results are not shared by solvers of different models.
+        other_model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        other_model.parser.parse_data(filename=mkm_energy)
+        other_model.solver.get_data()
+        other_model.solver.get_rate_constants(relative_energies=None)
+        self.assertEqual(other_model.solver.get_rate_constants.cache_info().misses, 1)
+
+        # Least recently used results are removed.
+        cache.maxsize = 2
+        for Gaf in [0.1, 0.2, 0.3]:
+            energies = dict(relative_energies, Gaf=[0.0, 0.0, Gaf])
+            solver.get_rate_constants(relative_energies=energies)
+        self.assertEqual(cache.cache_info().currsize, 2)
+        solver.get_rate_constants(relative_energies=dict(relative_energies, Gaf=[0.0, 0.0, 0.3]))
+        self.assertEqual(cache.cache_info().hits, 4)
+        # }}}
+
     def test_boltzmann_coverages(self):
         # {{{
         " Test we can get the Boltzmann converages. "
@@ -248,6 +356,58 @@ class MeanFieldSolverTest(unittest.TestCase):
             self.assertAlmostEqual(ref, ret, places=4)
         # }}}
 
+    def test_get_rate_function(self):
+        # {{{
+        " Make sure the rate expressions are compiled only once. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        rate_function = solver.get_rate_function()
+        self.assertTrue(rate_function is solver.get_rate_function())
+
+        coverages = (0.5, 0.5)
+        theta = solver._cvg_tuple2dict(coverages)
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        ret_rfs, ret_rrs = rate_function(theta, kf, kr, solver.pressures, solver.concentrations)
+        ref_rfs, ref_rrs = solver.get_rates(coverages)
+        self.assertListEqual(ref_rfs, ret_rfs)
+        self.assertListEqual(ref_rrs, ret_rrs)
+        # }}}
+
+    def test_get_rates_numpy(self):
+        # {{{
+        " Make sure rates in numpy representation are the same as mpmath. "
+        # Construction.
+        # Reference rates must be more precise than float64.
+        self.setup_dict["decimal_precision"] = 30
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        self.setup_dict["numerical_representation"] = "numpy"
+        np_model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        np_model.parser.parse_data(filename=mkm_energy)
+        np_model.solver.get_data()
+
+        # Check.
+        coverages = (0.3, 0.2)
+        ref_rfs, ref_rrs = model.solver.get_rates(coverages, relative_energies=None)
+        ret_rfs, ret_rrs = np_model.solver.get_rates(coverages, relative_energies=None)
+
+        for ref_rates, ret_rates in zip([ref_rfs, ref_rrs], [ret_rfs, ret_rrs]):
+            for ref, ret in zip(ref_rates, ret_rates):
+                self.assertTrue(isinstance(ret, float))
+                if ref == 0.0:
+                    self.assertEqual(ret, 0.0)
+                else:
+                    self.assertAlmostEqual(1.0, ret/float(ref), places=10)
+        # }}}
+
     def test_get_reversibilities(self):
         # {{{
         " Make sure we can get the correct reversibilities. "
@@ -5,10 +5,15 @@ Test case for SteadyStateSolver.
 import logging
 import unittest
 
+import mpmath as mp
+import numpy as np
+from scipy import integrate, sparse
 from mpmath import mpf
 
 from ...models.micro_kinetic_model import MicroKineticModel
 from ...solvers import SteadyStateSolver
+from ...solvers.rootfinding_iterators import Broyden, TrustRegionNewton
+from ...errors.error import ParameterError
 
 from .. import *
 
@@ -153,6 +158,30 @@ class SteadyStateSolverTest(unittest.TestCase):
         for ref, ret in ref_dtheta_dt, ret_dtheta_dt:
             self.assertAlmostEqual(ret, ret)
 
+    def test_dtheta_dt_function(self):
+        " Make sure the dtheta/dt expressions are compiled only once. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Check the function is cached.
+        dtheta_dt_function = solver.get_dtheta_dt_function()
+        self.assertTrue(dtheta_dt_function is solver.get_dtheta_dt_function())
+
+        # Check values.
+        coverages = (0.2, 0.5)
+        theta = solver._cvg_tuple2dict(coverages)
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        ret_dtheta_dt = dtheta_dt_function(theta, kf, kr, solver.pressures,
+                                           solver.concentrations)
+        ref_dtheta_dt = solver.steady_state_function(coverages)
+        self.assertTupleEqual(ref_dtheta_dt, ret_dtheta_dt)
+        self.assertAlmostEqual(2812943317895.31469634/1e12, float(ret_dtheta_dt[0])/1e12)
+
     def test_term_adsorbate_derivation(self):
         " Test private function __term_adsorbate_derivation(). "
         # Construction.
@@ -242,6 +271,112 @@ class SteadyStateSolverTest(unittest.TestCase):
         #    for n in range(2):
         #        self.assertAlmostEqual(ref_jacobian[m][n], float(ret_jacobian[m][n]), places=1)
 
+    def test_jacobian_function(self):
+        " Make sure the Jacobian is filled by the compiled function. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        jacobian_function = solver.get_jacobian_function()
+        self.assertTrue(jacobian_function is solver.get_jacobian_function())
+
+        # Compare with the numerical Jacobian.
+        coverages = (mpf('0.5'), mpf('0.3'))
+        f = lambda *x: solver.steady_state_function(x)
+        ref_jacobian = mp.jacobian(f, coverages).tolist()
+        ret_jacobian = solver.analytical_jacobian(coverages).tolist()
+        for ref_row, ret_row in zip(ref_jacobian, ret_jacobian):
+            for ref, ret in zip(ref_row, ret_row):
+                self.assertAlmostEqual(1.0, float(ret/ref), places=10)
+
+    def test_numpy_representation(self):
+        " Make sure the vectorized float64 kernels agree with mpmath. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        self.setup_dict.update(numerical_representation="numpy", tolerance=1e-4)
+        np_model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        np_model.parser.parse_data(filename=mkm_energy)
+        np_model.solver.get_data()
+
+        coverages = (0.5, 0.3)
+
+        # Check dtheta/dt.
+        ref_dtheta_dt = model.solver.steady_state_function(coverages, relative_energies=None)
+        ret_dtheta_dt = np_model.solver.steady_state_function(coverages, relative_energies=None)
+        for ref, ret in zip(ref_dtheta_dt, ret_dtheta_dt):
+            self.assertAlmostEqual(1.0, ret/float(ref), places=10)
+
+        # Check Jacobian.
+        ref_jacobian = model.solver.analytical_jacobian(coverages, relative_energies=None).tolist()
+        ret_jacobian = np_model.solver.analytical_jacobian(coverages, relative_energies=None)
+        self.assertEqual(ret_jacobian.shape, (2, 2))
+        for ref_row, ret_row in zip(ref_jacobian, ret_jacobian.tolist()):
+            for ref, ret in zip(ref_row, ret_row):
+                self.assertAlmostEqual(1.0, ret/float(ref), places=10)
+
+        # Check steady state coverages with both iterators.
+        # NOTE: the Jacobian is ill-conditioned for this model, coverages can
+        #       only be resolved roughly within the float64 residual tolerance.
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        for rootfinding in ["MDNewton", "ConstrainedNewton", "Broyden"]:
+            self.setup_dict["rootfinding"] = rootfinding
+            np_model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+            np_model.parser.parse_data(filename=mkm_energy)
+            np_model.solver.get_data()
+            ret_sscvg = np_model.solver.get_steady_state_cvgs((0.9, 0.1),
+                                                              relative_energies=None)
+            self.assertLessEqual(np_model.solver.get_residual(ret_sscvg, relative_energies=None),
+                                 1e-4)
+            for ref, ret in zip(ref_sscvg, ret_sscvg):
+                self.assertAlmostEqual(ref, ret, delta=1e-3)
+
+    def test_sparse_jacobian(self):
+        " Make sure the sparse Jacobian agrees with the dense one. "
+        self.setup_dict.update(numerical_representation="numpy", tolerance=1e-4,
+                               sparse_jacobian=True)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        solver = model.solver
+        solver.get_data()
+
+        # Check Jacobian.
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        for coverages in [(0.5, 0.3), (0.0, 0.0), (0.0, 1.0)]:
+            ref_jacobian = solver._vectorized_jacobian(coverages, kf, kr)
+            ret_jacobian = solver._sparse_jacobian(coverages, kf, kr)
+            self.assertTrue(sparse.issparse(ret_jacobian))
+            self.assertTrue(np.allclose(ref_jacobian, ret_jacobian.toarray(),
+                                        rtol=1e-12, atol=0.0))
+
+        # Check steady state coverages with sparse solver.
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        for rootfinding in ["MDNewton", "ConstrainedNewton"]:
+            self.setup_dict["rootfinding"] = rootfinding
+            model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+            model.parser.parse_data(filename=mkm_energy)
+            model.solver.get_data()
+            ret_sscvg = model.solver.get_steady_state_cvgs((0.9, 0.1), relative_energies=None)
+            for ref, ret in zip(ref_sscvg, ret_sscvg):
+                self.assertAlmostEqual(ref, ret, delta=1e-3)
+
+        # Float64 iterations of mixed precision solving.
+        self.setup_dict.update(numerical_representation="mpmath", mixed_precision=True,
+                               rootfinding="MDNewton", tolerance=1e-50)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+        ret_sscvg = model.solver.get_steady_state_cvgs([0.9, 0.1], relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, float(ret))
+        self.assertLess(model.solver.error, 1e-50)
+
     def test_get_residual(self):
         " Test we can get correct residual. "
         # Construction.
@@ -292,6 +427,363 @@ class SteadyStateSolverTest(unittest.TestCase):
         for ref, ret in zip(ref_sscvg, ret_sscvg):
             self.assertAlmostEqual(ref, float(ret))
 
+    def test_integrate_to_steady_state(self):
+        " Test ODE integration with analytical Jacobian stops at steady state. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Stop when the residual is negligible.
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        t, ret_sscvg = solver.integrate_to_steady_state(initial_cvgs=(0.0, 0.0),
+                                                        time_end=1e4)
+        self.assertLess(t, 1e4)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, ret, places=7)
+
+        t, ret_sscvg = solver.integrate_to_steady_state(initial_cvgs=(0.0, 0.0),
+                                                        time_end=1e4, tolerance=1e-3,
+                                                        relative_tolerance=0.0)
+        self.assertLess(t, 1e4)
+        self.assertLess(solver._norm(solver.steady_state_function(ret_sscvg)), 1e-3)
+
+        # Integrate to the end time.
+        t, _ = solver.integrate_to_steady_state(initial_cvgs=(0.0, 0.0),
+                                                time_end=1e-4, tolerance=1e-3)
+        self.assertAlmostEqual(t, 1e-4)
+
+        self.assertRaises(ParameterError, solver.integrate_to_steady_state, method="RK45")
+
+        # The last state is returned when the integrator fails.
+        class FailedIntegrator(object):
+            def __init__(self, fun, t0, y0, t_bound, **kwargs):
+                self.status, self.t, self.y = 'running', t0, np.array(y0)
+
+            def step(self):
+                self.status = 'failed'
+                return 'Required step size is less than spacing between numbers.'
+
+        BDF = integrate.BDF
+        integrate.BDF = FailedIntegrator
+        try:
+            t, ret_cvgs = solver.integrate_to_steady_state(initial_cvgs=(0.2, 0.3))
+        finally:
+            integrate.BDF = BDF
+        self.assertEqual(t, 0.0)
+        self.assertListEqual(ret_cvgs, [0.2, 0.3])
+
+    def test_broyden_steady_state_coverages(self):
+        " Test we can get steady state coverages with Broyden iterator. "
+        # Construction.
+        self.setup_dict.update(rootfinding="Broyden")
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Check.
+        coverages = [0.9, 0.1]
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        ret_sscvg = solver.get_steady_state_cvgs(coverages, relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, float(ret))
+        self.assertLess(solver.get_residual(ret_sscvg, relative_energies=None), 1e-20)
+
+        # Jacobian is not evaluated in every iteration.
+        iterator = Broyden(solver.steady_state_function, coverages,
+                           J=solver.analytical_jacobian)
+        for i, (x, fxnorm, fx) in enumerate(iterator):
+            if fxnorm < 1e-20 or i > 100:
+                break
+        self.assertLess(fxnorm, 1e-20)
+        self.assertLess(iterator.jacobian_evaluations, i + 1)
+
+    def test_trust_region_steady_state_coverages(self):
+        " Test we can get steady state coverages with trust region iterator. "
+        # Construction.
+        self.setup_dict.update(rootfinding="TrustRegionNewton")
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Check.
+        coverages = [0.5, 0.5]
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        ret_sscvg = solver.get_steady_state_cvgs(coverages, relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, float(ret))
+        self.assertLess(solver.get_residual(ret_sscvg, relative_energies=None), 1e-20)
+
+        # At most two function evaluations in one step.
+        counter = []
+        def f(x):
+            counter.append(x)
+            return solver.steady_state_function(x)
+
+        iterator = TrustRegionNewton(f, coverages, J=solver.analytical_jacobian)
+        for i, (x, fxnorm, fx) in enumerate(iterator):
+            if fxnorm < 1e-20 or i > 100:
+                break
+        self.assertLess(fxnorm, 1e-20)
+        self.assertLessEqual(len(counter), 2*(i + 1) + 1)
+
+    def test_multistart_steady_state_coverages(self):
+        " Test we can get steady state coverages from multiple initial guesses. "
+        # Construction.
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Check initial guesses.
+        c0 = (0.1, 0.9)
+        guesses = solver.get_initial_guesses(6, c0=c0, seed=1)
+        self.assertEqual(len(guesses), 6)
+        self.assertTupleEqual(c0, tuple([float(c) for c in guesses[0]]))
+        for guess in guesses:
+            self.assertTrue(all([0.0 <= c <= 1.0 for c in guess]))
+            self.assertLessEqual(sum(guess), 1.0 + 1e-10)
+        self.assertListEqual(guesses, solver.get_initial_guesses(6, c0=c0, seed=1))
+
+        # Check steady state coverages serially and in worker pool.
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        for processes in [1, 2]:
+            ret_sscvg = solver.multistart_steady_state_cvgs(c0=c0, n_starts=6,
+                                                            processes=processes, seed=1)
+            for ref, ret in zip(ref_sscvg, ret_sscvg):
+                self.assertAlmostEqual(ref, float(ret))
+            self.assertLess(solver.error, 1e-20)
+
+    def test_get_multiple_steady_state_coverages(self):
+        " Test we can enumerate multiple steady states by deflation. "
+        # Construction.
+        self.setup_dict.update(rootfinding="MDNewton")
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Bistable energies.
+        relative_energies = dict(Gaf=[0.0, 0.0, 0.3],
+                                 Gar=[0.758, 2.64, -0.024],
+                                 dG=[-0.758, -2.64, 0.324])
+        model.set_pressures({"CO_g": 1e-3})
+
+        ret = solver.get_multiple_steady_state_cvgs(relative_energies=relative_energies, seed=1)
+        ret_cvgs = sorted([[float(c) for c in cvgs] for cvgs in ret["coverages"]])
+        ref_cvgs = [[0.0034521787943816995, 0.9950478323966289],
+                    [0.995065928746995, 0.0034373039247376238],
+                    [0.999996735161255, 1.6113452299973306e-08]]
+        self.assertEqual(len(ret_cvgs), 3)
+        for ref, ret_cvg in zip(ref_cvgs, ret_cvgs):
+            for r, c in zip(ref, ret_cvg):
+                self.assertAlmostEqual(r, c)
+        for error in ret["errors"]:
+            self.assertLess(error, 1e-20)
+
+        # The saddle between the two stable steady states is unstable.
+        stable = dict(zip([float(c[0]) for c in ret["coverages"]], ret["stable"]))
+        self.assertListEqual([stable[c[0]] for c in ret_cvgs], [True, False, True])
+
+        # Limit number of roots.
+        ret = solver.get_multiple_steady_state_cvgs(relative_energies=relative_energies,
+                                                    max_roots=1, seed=1)
+        self.assertEqual(len(ret["coverages"]), 1)
+
+    def test_mixed_precision_steady_state_coverages(self):
+        " Test we can get steady state coverages with mixed precision. "
+        # Construction.
+        self.setup_dict.update(mixed_precision=True, rootfinding="MDNewton", tolerance=1e-50)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Check.
+        coverages = [0.9, 0.1]
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        ret_sscvg = solver.get_steady_state_cvgs(coverages, relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, float(ret))
+
+        self.assertLess(solver.error, 1e-50)
+        self.assertLess(solver.get_residual(ret_sscvg, relative_energies=None), 1e-50)
+
+        iterations = solver.precision_iterations
+        self.assertGreater(iterations["float64"], 0)
+        self.assertGreater(iterations["mpmath"], 0)
+
+    def test_batch_steady_state_function(self):
+        " Make sure batched dtheta/dt and Jacobians agree with single point evaluation. "
+        # Construction.
+        self.setup_dict["numerical_representation"] = "numpy"
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        cvgs = [[0.2, 0.5], [0.9, 0.1], [0.0, 0.0]]
+        ret_dtheta_dts, ret_jacobians = solver.batch_steady_state_function(cvgs, kf, kr)
+
+        self.assertEqual(ret_dtheta_dts.shape, (3, 2))
+        self.assertEqual(ret_jacobians.shape, (3, 2, 2))
+
+        for cvg, ret_dtheta_dt, ret_jacobian in zip(cvgs, ret_dtheta_dts, ret_jacobians):
+            ref_dtheta_dt = solver.steady_state_function(cvg, relative_energies=None)
+            ref_jacobian = solver.analytical_jacobian(cvg, relative_energies=None)
+            self.assertTrue(np.allclose(ref_dtheta_dt, ret_dtheta_dt, rtol=1e-12))
+            self.assertTrue(np.allclose(ref_jacobian, ret_jacobian, rtol=1e-12))
+
+        # Pressures of each point.
+        pressures = [[0.0, 1.0, 1./3.], [0.0, 0.1, 1./3.]]
+        ret_dtheta_dts = solver.batch_steady_state_function(cvgs[:2], [kf, kf], [kr, kr],
+                                                            pressures, jacobian=False)
+        self.assertTrue(np.allclose(ret_dtheta_dts[0],
+                                    solver.steady_state_function(cvgs[0], relative_energies=None)))
+        self.assertFalse(np.allclose(ret_dtheta_dts[0], ret_dtheta_dts[1]))
+
+    def test_batch_steady_state_coverages(self):
+        " Test we can solve steady state coverages of many points together. "
+        # Construction.
+        self.setup_dict.update(numerical_representation="numpy", tolerance=1e-3)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        kf, kr = solver.get_rate_constants(relative_energies=None)
+        c0 = [[0.9, 0.1], [0.5, 0.5], [0.99, 0.01]]
+        ret_cvgs, ret_converged, ret_errors = solver.batch_steady_state_cvgs(c0, kf, kr)
+
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+        self.assertTrue(all(ret_converged))
+        self.assertTrue(all(ret_errors <= 1e-3))
+        for cvgs in ret_cvgs:
+            for ref, ret in zip(ref_sscvg, cvgs):
+                self.assertAlmostEqual(ref, ret, delta=1e-3)
+
+    def test_log_analytical_jacobian(self):
+        " Make sure the Jacobian in log coverages is correct. "
+        # Construction.
+        self.setup_dict["numerical_representation"] = "numpy"
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        parser = model.parser
+        solver = model.solver
+
+        parser.parse_data(filename=mkm_energy)
+        solver.get_data()
+
+        # Log coverages of CO_s, O_s and *_s.
+        log_cvgs = [-1.2, -1.6, -0.7]
+        ret_jacobian = solver.log_analytical_jacobian(log_cvgs, relative_energies=None)
+
+        # Compare with finite difference.
+        h = 1e-7
+        fx = solver.log_steady_state_function(log_cvgs, relative_energies=None)
+        for j in range(3):
+            x = list(log_cvgs)
+            x[j] += h
+            fxh = solver.log_steady_state_function(x, relative_energies=None)
+            for i in range(3):
+                self.assertAlmostEqual((fxh[i] - fx[i])/h, ret_jacobian[i, j], places=5)
+
+    def test_log_steady_state_coverages(self):
+        " Test we can get steady state coverages in log coverages. "
+        ref_sscvg = [0.9993009023315728, 0.0006990944289937246]
+
+        # Float64 root is accepted directly by the residual of rates.
+        self.setup_dict.update(numerical_representation="numpy",
+                               log_coverage=True,
+                               tolerance=1e-3)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        ret_sscvg = model.solver.get_steady_state_cvgs([0.9, 0.1], relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, ret)
+        self.assertLessEqual(model.solver.error, 1e-3)
+        self.assertEqual(model.solver.error,
+                         model.solver.get_residual(ret_sscvg, relative_energies=None))
+
+        # Log residual is relative, it is not the residual of rates.
+        log_cvgs, log_error = model.solver.log_steady_state_cvgs([0.9, 0.1],
+                                                                 relative_energies=None)
+        self.assertLess(log_error, 1e-10)
+        self.assertGreater(model.solver.get_residual(log_cvgs, relative_energies=None), 1e-10)
+
+        # Polished by mpmath.
+        self.setup_dict.update(numerical_representation="mpmath", tolerance=1e-50)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        ret_sscvg = model.solver.get_steady_state_cvgs([0.9, 0.1], relative_energies=None)
+        for ref, ret in zip(ref_sscvg, ret_sscvg):
+            self.assertAlmostEqual(ref, float(ret))
+        self.assertLess(model.solver.get_residual(ret_sscvg, relative_energies=None), 1e-50)
+
+    def test_trace_steady_state_coverages(self):
+        " Test steady state coverages can be traced along a parameter path. "
+        self.setup_dict.update(mixed_precision=True, tolerance=1e-12)
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        # Bistable CO oxidation with a fast surface reaction.
+        relative_energies = {"Gaf": [0.0, 0.0, 0.3], "dG": [-0.758, -2.64, 0.324]}
+        relative_energies["Gar"] = [Gaf - dG for Gaf, dG in zip(relative_energies["Gaf"],
+                                                                  relative_energies["dG"])]
+
+        ret = model.solver.trace_steady_state_cvgs("CO_g", 1e-6,
+                                                   c0=[0.5, 0.5],
+                                                   relative_energies=relative_energies)
+        parameters, coverages = ret["parameters"], ret["coverages"]
+
+        self.assertEqual(parameters[0], 1.0)
+        self.assertEqual(parameters[-1], 1e-6)
+        self.assertEqual(coverages.shape, (len(parameters), 2))
+
+        # S-shaped branch with two folds.
+        self.assertEqual(len(ret["turning_points"]), 2)
+        i, j = ret["turning_points"]
+        self.assertAlmostEqual(parameters[i], 9.5e-5, delta=5e-6)
+        self.assertAlmostEqual(parameters[j], 8.4e-3, delta=5e-5)
+
+        # Pressure is restored.
+        self.assertEqual(model.species_definitions["CO_g"]["pressure"], 1.0)
+
+        # All points are steady states.
+        for pressure, cvgs in zip(parameters[::5], coverages[::5]):
+            model.set_pressures({"CO_g": pressure})
+            kf, kr = model.solver.get_rate_constants(relative_energies=relative_energies)
+            dtheta_dt = model.solver.steady_state_function(tuple(cvgs), relative_energies)
+            scale = max([float(k) for k in kf + kr])
+            for value in dtheta_dt:
+                self.assertLess(abs(float(value))/scale, 1e-12)
+
+        self.assertRaises(ParameterError, model.solver.trace_steady_state_cvgs, "H2_g", 1.0)
+
     def test_get_single_XRC(self):
         " Test function get_single_XRC(). "
         # Construction.
@@ -313,6 +805,63 @@ class SteadyStateSolverTest(unittest.TestCase):
         for ref, ret in zip(ref_XRC, ret_XRC):
             self.assertAlmostEqual(ref, float(ret), places=4)
 
+        # Parallel finite difference.
+        ret_XRC = solver.get_single_XRC(gas_name, epsilon=1e-5, processes=2)
+        for ref, ret in zip(ref_XRC, ret_XRC):
+            self.assertAlmostEqual(ref, float(ret), places=4)
+
+        # Linear response.
+        ret_XRC = solver.get_single_XRC(gas_name, method="linear_response")
+        for ref, ret in zip(ref_XRC, ret_XRC):
+            self.assertAlmostEqual(ref, float(ret), places=4)
+        self.assertAlmostEqual(1.0, float(sum(ret_XRC)), places=10)
+
+        self.assertRaises(ParameterError, solver.get_single_XRC, gas_name, method="unknown")
+
+    def test_get_XTRC(self):
+        " Test degree of thermodynamic rate control can be calculated correctly. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        self.assertRaises(AttributeError, model.solver.get_XTRC)
+
+        model.solver.get_steady_state_cvgs([0.9, 0.1])
+
+        # Gases x (adsorbates + transition states).
+        ref_XTRC = [-1.99860, -0.00140, 0.00140]
+        ret_XTRC_matrix = model.solver.get_XTRC()
+        self.assertEqual(len(ret_XTRC_matrix), 3)
+        for ret_XTRC in ret_XTRC_matrix:
+            self.assertEqual(len(ret_XTRC), 3)
+            for ref, ret in zip(ref_XTRC, ret_XTRC):
+                self.assertAlmostEqual(ref, float(ret), places=4)
+
+        # XTRC of transition state is the XRC of its reaction.
+        XRCs = model.solver.get_single_XRC("CO2_g", method="linear_response")
+        ret_XTRC = model.solver.get_single_XTRC("CO2_g")
+        self.assertAlmostEqual(float(XRCs[2]), float(ret_XTRC[2]), places=10)
+
+        self.assertRaises(ParameterError, model.solver.get_single_XTRC, "H2_g")
+
+    def test_get_net_rate_derivatives(self):
+        " Test derivatives of net rates wrt coverages are correct. "
+        model = MicroKineticModel(setup_dict=self.setup_dict, logger_level=logging.WARNING)
+        model.parser.parse_data(filename=mkm_energy)
+        model.solver.get_data()
+
+        coverages = (mpf("0.2"), mpf("0.5"))
+        ret_D = model.solver.get_net_rate_derivatives(coverages, relative_energies=None)
+        self.assertEqual((ret_D.rows, ret_D.cols), (3, 2))
+
+        # Check with the float64 kernel.
+        kf, kr = model.solver.get_rate_constants(relative_energies=None)
+        drfs, drrs = model.solver._vectorized_rate_derivatives(coverages, kf, kr)
+        ref_D = drfs - drrs
+        for i in range(3):
+            for j in range(2):
+                self.assertAlmostEqual(float(ret_D[i, j])/ref_D[i, j], 1.0)
+
     def test_get_elementary_dtheta_dt_sym(self):
         " Test we can get correct dtheta/dt expression for an elementary reaction. "
         # Construction.